@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark: `nexus-ai continuity scan` over many projects
+
+Builds a tree of --projects projects, each with --dirs source directories
+and a node_modules of as many (skipped by the walk). A third have an
+.ai/CONTINUITY.md, and every tenth has a legacy copy as well. Directory
+mtimes are set an hour back, as for a tree nobody is editing. Reports:
+
+- a full walk without the index, on one thread and on --jobs threads;
+- the first scan that writes the index, and a second one that reuses it;
+- a scan after --changed projects gain a directory and a continuity file,
+  checked against a full walk.
+
+    python benchmarks/bench_continuity.py                       # 2000 projects
+    python benchmarks/bench_continuity.py --projects 500 --dirs 40 --json
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+
+from installer.python.continuity import CONTINUITY_FILE, LEGACY_FILES, scan  # noqa: E402
+
+CONTENT = "# Continuity\n\n## Summary\nBenchmark project\n\n## Source\nClaude Code | 2026-01-16 14:30 UTC\n"
+
+
+def make_tree(root: Path, projects: int, dirs: int) -> None:
+    for p in range(projects):
+        project = root / f"org{p % 20}" / f"project{p}"
+        for d in range(dirs):
+            (project / "src" / f"pkg{d % 5}" / f"mod{d}").mkdir(parents=True, exist_ok=True)
+            (project / "node_modules" / f"dep{d}" / "lib").mkdir(parents=True, exist_ok=True)
+        (project / ".git" / "objects").mkdir(parents=True)
+        if p % 3 == 0:
+            (project / ".ai").mkdir()
+            (project / CONTINUITY_FILE).write_text(CONTENT)
+        if p % 10 == 0:
+            legacy = project / LEGACY_FILES[p % len(LEGACY_FILES)]
+            legacy.parent.mkdir()
+            legacy.write_text(CONTENT.replace("Claude Code", "Gemini CLI"))
+    age_tree(root)
+
+
+def age_tree(root: Path) -> None:
+    old = time.time() - 3600
+    for current, subdirs, _ in os.walk(root):
+        os.utime(current, (old, old))
+
+
+def timed(roots: list[Path], index, jobs) -> tuple[object, float]:
+    start = time.perf_counter()
+    result = scan(roots, index, jobs)
+    return result, time.perf_counter() - start
+
+
+def run(projects: int, dirs: int, jobs: int, changed: int) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp, "repos")
+        make_tree(root, projects, dirs)
+        index = Path(tmp, "index.json")
+
+        serial, serial_s = timed([root], None, 1)
+        _, parallel_s = timed([root], None, jobs)
+        _, first_s = timed([root], index, jobs)
+        warm, warm_s = timed([root], index, jobs)
+
+        for p in range(0, projects, max(1, projects // changed)):
+            project = root / f"org{p % 20}" / f"project{p}"
+            (project / "src" / "new").mkdir()
+            (project / ".ai").mkdir(exist_ok=True)
+            (project / CONTINUITY_FILE).write_text(CONTENT.replace("2026-01-16", "2026-02-01"))
+        rescan, rescan_s = timed([root], index, jobs)
+        full = scan([root], None, jobs)
+        index_kb = index.stat().st_size / 1024
+
+    return {
+        "projects": projects,
+        "directories": serial.directories,
+        "continuity_files": len(serial.files),
+        "walk_1_thread_s": round(serial_s, 3),
+        f"walk_{jobs}_threads_s": round(parallel_s, 3),
+        "first_indexed_scan_s": round(first_s, 3),
+        "warm_scan_s": round(warm_s, 3),
+        "warm_listed": warm.listed,
+        "changed_projects": changed,
+        "rescan_s": round(rescan_s, 3),
+        "rescan_listed": rescan.listed,
+        "rescan_matches_full_walk": rescan.files == full.files,
+        "index_kb": round(index_kb),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--projects", type=int, default=2000, help="projects in the tree (default: 2000)")
+    parser.add_argument("--dirs", type=int, default=10, help="source directories per project (default: 10)")
+    parser.add_argument("--jobs", "-j", type=int, default=8, help="threads for the parallel walk (default: 8)")
+    parser.add_argument("--changed", type=int, default=20, help="projects changed before the rescan (default: 20)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.projects, args.dirs, args.jobs, args.changed)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for name, value in results.items():
+            print(f"{name:<28}{value!s:>10}")
+    return 0 if results["rescan_matches_full_walk"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""
+Benchmark: feature asset copy throughput
+
+Compares the installer's old text round-trip copy (write_text(read_text()))
+with each mechanism in installer/python/fileops.py on a synthetic feature
+tree. Run from the repo root:
+
+    python benchmarks/bench_copy.py
+    python benchmarks/bench_copy.py --files 2000 --size 64K --json
+"""
+
+import argparse
+import json
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from installer.python import fileops  # noqa: E402
+
+
+def parse_size(value: str) -> int:
+    units = {"K": 1024, "M": 1024 * 1024}
+    if value[-1].upper() in units:
+        return int(value[:-1]) * units[value[-1].upper()]
+    return int(value)
+
+
+def make_tree(root: Path, files: int, size: int) -> list[Path]:
+    """Markdown-like ASCII content with CRLF endings, so text-mode damage would show."""
+    line = b"- Step: read the state file, then dispatch ready tasks to spokes.\r\n"
+    body = (line * (size // len(line) + 1))[:size]
+    paths = []
+    for i in range(files):
+        feature_dir = root / f"feature{i // 10:04d}" / "claude" / "commands"
+        feature_dir.mkdir(parents=True, exist_ok=True)
+        path = feature_dir / f"feature{i // 10:04d}-{i % 10}.md"
+        path.write_bytes(body)
+        paths.append(path)
+    return paths
+
+
+def copy_text(src: Path, dst: Path) -> None:
+    dst.write_text(src.read_text())
+
+
+def copy_buffered(src: Path, dst: Path) -> None:
+    with open(src, "rb") as fsrc, open(dst, "xb") as fdst:
+        shutil.copyfileobj(fsrc, fdst, 1024 * 1024)
+
+
+def mode(name: str):
+    return lambda src, dst: fileops.copy_file(src, dst, name)
+
+
+METHODS = {
+    "text (legacy)": copy_text,
+    "buffered binary": copy_buffered,
+    "copy (zero-copy)": mode("copy"),
+    "reflink": mode("reflink"),
+    "hardlink": mode("hardlink"),
+}
+
+
+def run(paths: list[Path], src_root: Path, dst_parent: Path, copy, repeat: int) -> tuple[float, bool]:
+    best = float("inf")
+    exact = True
+    for r in range(repeat):
+        dst_root = dst_parent / f"run{r}"
+        start = time.perf_counter()
+        for src in paths:
+            dst = dst_root / src.relative_to(src_root)
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            copy(src, dst)
+        best = min(best, time.perf_counter() - start)
+        exact = exact and all(
+            (dst_root / p.relative_to(src_root)).read_bytes() == p.read_bytes() for p in paths[:20]
+        )
+        shutil.rmtree(dst_root)
+    return best, exact
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--files", type=int, default=500, help="number of files (default: 500)")
+    parser.add_argument("--size", default="256K", help="bytes per file, K/M suffix allowed (default: 256K)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per method; best is reported (default: 3)")
+    parser.add_argument("--dir", help="scratch directory (default: system temp; use to test a specific filesystem)")
+    parser.add_argument("--json", action="store_true", help="print JSON results")
+    args = parser.parse_args()
+
+    size = parse_size(args.size)
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        src_root = Path(tmp) / "features"
+        paths = make_tree(src_root, args.files, size)
+        total_mb = args.files * size / (1024 * 1024)
+
+        results = []
+        for name, copy in METHODS.items():
+            seconds, exact = run(paths, src_root, Path(tmp), copy, args.repeat)
+            results.append({
+                "method": name,
+                "seconds": round(seconds, 4),
+                "mb_per_s": round(total_mb / seconds, 1),
+                "byte_exact": exact,
+            })
+
+    if args.json:
+        print(json.dumps({"files": args.files, "bytes_per_file": size, "results": results}, indent=2))
+        return 0
+
+    print(f"{args.files} files x {size} bytes ({total_mb:.1f} MB), best of {args.repeat}")
+    print(f"{'method':<20}{'seconds':>10}{'MB/s':>10}  byte-exact")
+    for r in results:
+        print(f"{r['method']:<20}{r['seconds']:>10.4f}{r['mb_per_s']:>10.1f}  {'yes' if r['byte_exact'] else 'NO'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark: `nexus-ai maestro run` against stub spokes
+
+Writes a plan of --tasks tasks in layers of --width (each task depends on one
+or two tasks of the layer before it, tools assigned round-robin), then runs
+the dispatcher with benchmarks/stub_spoke.py standing in for all three CLIs.
+Reports the wall time next to what running the spokes one at a time would
+take, and the dispatcher's overhead per task over an ideal scheduler with
+the same per-tool limits and spoke run times.
+
+    python benchmarks/bench_dispatch.py                          # 60 tasks, 0.2 s each
+    python benchmarks/bench_dispatch.py --limit 4 --fail 0.2     # with retries
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+
+from installer.python.maestro.dispatch import COMMANDS, Dispatcher  # noqa: E402
+from installer.python.maestro.state import STATE_FILE, TaskStore  # noqa: E402
+
+TOOLS = ("Gemini CLI", "Codex CLI", "Claude Code")
+STUB = f"{sys.executable} {Path(__file__).resolve().parent / 'stub_spoke.py'}"
+
+
+def make_plan(tasks: int, width: int, seed: int = 1) -> str:
+    rng = random.Random(seed)
+    lines = ["# Maestro Orchestration", "", "## Goal", "Synthetic dispatch benchmark", "", "## Tasks",
+             "| ID | Description | Status | Specialist | Tool | Depends |",
+             "|----|-------------|--------|------------|------|---------|"]
+    for i in range(1, tasks + 1):
+        layer_start = (i - 1) // width * width + 1
+        previous = range(max(1, layer_start - width), layer_start)
+        deps = sorted(rng.sample(previous, min(len(previous), rng.randint(1, 2)))) if previous else []
+        lines.append(f"| {i} | Implement part {i} | pending | code | {TOOLS[i % len(TOOLS)]} "
+                     f"| {','.join(map(str, deps)) or '-'} |")
+    lines += ["", "## Source", "Claude Code | 2026-01-16 14:30 UTC", ""]
+    return "\n".join(lines)
+
+
+def waves(text: str, limit: int) -> int:
+    """Rounds a zero-overhead scheduler with the same limits needs, when every task takes as long."""
+    store = TaskStore.parse(text)
+    done: set[int] = set()
+    rounds = 0
+    while len(done) < len(store):
+        busy = dict.fromkeys(TOOLS, 0)
+        wave = []
+        for task in store:
+            if task.id not in done and all(d in done for d in task.depends) and busy[task.tool] < limit:
+                busy[task.tool] += 1
+                wave.append(task.id)
+        done.update(wave)
+        rounds += 1
+    return rounds
+
+
+def run(tasks: int, width: int, limit: int, seconds: float, fail: float) -> dict:
+    text = make_plan(tasks, width)
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / ".ai").mkdir()
+        (root / STATE_FILE).write_text(text)
+        os.environ["STUB_SPOKE_SECONDS"] = str(seconds)
+        os.environ["STUB_SPOKE_FAIL"] = str(fail)
+        dispatcher = Dispatcher(root, limits=dict.fromkeys(COMMANDS, limit), backoff=0.01, keep_going=True,
+                                spokes=dict.fromkeys(COMMANDS, STUB))
+        start = time.perf_counter()
+        result = dispatcher.run()
+        wall = time.perf_counter() - start
+        final = TaskStore.load(root / STATE_FILE).counts()
+
+    attempts = [a.seconds for t in result.tasks for a in t.attempts]
+    # The stub's own run time (interpreter start-up included) is the spoke's, not the dispatcher's
+    mean = sum(attempts) / len(attempts)
+    ideal = waves(text, limit) * mean if not fail else None
+    return {
+        "tasks": tasks,
+        "done": final["done"],
+        "failed": final["failed"],
+        "attempts": len(attempts),
+        "attempt_s": round(mean, 3),
+        "wall_s": round(wall, 3),
+        "serial_s": round(sum(attempts), 3),
+        "speedup": round(sum(attempts) / wall, 2),
+        "ideal_s": round(ideal, 3) if ideal is not None else None,
+        "overhead_ms_per_task": round((wall - ideal) * 1000 / tasks, 2) if ideal is not None else None,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, default=60, help="tasks in the plan (default: 60)")
+    parser.add_argument("--width", type=int, default=12, help="tasks per dependency layer (default: 12)")
+    parser.add_argument("--limit", type=int, default=2, help="spokes per tool at once (default: 2)")
+    parser.add_argument("--seconds", type=float, default=0.2, help="time per stub spoke (default: 0.2)")
+    parser.add_argument("--fail", type=float, default=0.0, help="chance a stub attempt fails (default: 0)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.tasks, args.width, args.limit, args.seconds, args.fail)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for name, value in results.items():
+            if value is not None:
+                print(f"{name:<24}{value:>10}")
+    return 0 if results["done"] == args.tasks or args.fail else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+Benchmark: `nexus-ai maestro stats` over a large execution log
+
+Writes a synthetic `.ai/MAESTRO-LOG.md` of --rows rows in --sessions
+sessions (random tools, specialists, token counts, durations and retries,
+plus a Totals table at the end of each session), then reports:
+
+- the time of a full scan, and its peak memory at --rows and at a tenth of
+  it with as many sessions (the peak should not grow with the rows);
+- the time of the next run after --append more rows, which reads only those;
+- that the resumed totals equal a full re-scan of the grown log;
+- the error of the p50/p95 durations against the exact values.
+
+    python benchmarks/bench_logstats.py                 # 200,000 rows
+    python benchmarks/bench_logstats.py --rows 1000000 --json
+"""
+
+import argparse
+import json
+import math
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+
+from installer.python.maestro.logstats import analyze  # noqa: E402
+from installer.python.maestro.state import LOG_FILE  # noqa: E402
+
+TOOLS = ("Gemini", "Codex", "Claude")
+SPECIALISTS = ("code", "test", "review", "docs", "security")
+
+
+def make_rows(rng: random.Random, rows: int, session: int, durations: list[float], start: int = 0) -> str:
+    """Log text for rows start..start+rows-1; appends each duration to `durations`."""
+    lines = []
+    for i in range(start, start + rows):
+        if i % session == 0:
+            lines += [f"## Session: 2026-01-{i // session % 28 + 1:02d} 14:30 UTC", f"**Goal:** Goal {i // session}",
+                      "", "| Time | Actor | Action | Target | Tokens | Duration | Outcome | Notes |",
+                      "|------|-------|--------|--------|--------|----------|---------|-------|"]
+        seconds = round(rng.lognormvariate(3.5, 0.8))
+        durations.append(seconds)
+        retry = rng.random() < 0.1
+        duration = f"{seconds // 60}m {seconds % 60}s" if seconds >= 60 else f"{seconds}s"
+        lines.append(f"| 14:{i % 60:02d}:{i * 7 % 60:02d} | Hub | {'Retry' if retry else 'Dispatch'} "
+                     f"| {rng.choice(TOOLS)} ({rng.choice(SPECIALISTS)}) | {rng.randint(500, 60000):,} "
+                     f"| {duration} | {'failed' if rng.random() < 0.05 else 'success'} | Task {i}: note |")
+        if i % session == session - 1:
+            lines += ["", "## Totals", "", "| Tool | Dispatches | Tokens | Avg Duration |",
+                      "|------|------------|--------|--------------|", "| Gemini CLI | 10 | 1,000 | 30s |", ""]
+    return "\n".join(lines) + "\n"
+
+
+def exact(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(q * len(ordered))) - 1]
+
+
+def timed(root: Path, use_index: bool = True) -> tuple[dict, float]:
+    start = time.perf_counter()
+    report = analyze(root, use_index=use_index)
+    return report, time.perf_counter() - start
+
+
+def peak_memory(root: Path) -> int:
+    tracemalloc.start()
+    analyze(root, use_index=False)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def run(rows: int, sessions: int, append: int) -> dict:
+    session = max(1, rows // sessions)
+    durations: list[float] = []
+    with tempfile.TemporaryDirectory() as tmp:
+        small, large = Path(tmp, "small"), Path(tmp, "large")
+        for root, n, per_session, seen in ((small, rows // 10, max(1, session // 10), []),
+                                           (large, rows, session, durations)):
+            (root / ".ai").mkdir(parents=True)
+            (root / LOG_FILE).write_text("# Maestro Execution Log\n\n"
+                                         + make_rows(random.Random(1), n, per_session, seen))
+        size = (large / LOG_FILE).stat().st_size
+        _, full_s = timed(large)
+        small_peak, large_peak = peak_memory(small), peak_memory(large)
+
+        with open(large / LOG_FILE, "a") as f:
+            f.write(make_rows(random.Random(2), append, session, durations, start=rows))
+        resumed, append_s = timed(large)
+        rescanned = analyze(large, use_index=False)
+
+    same = all(resumed[k] == rescanned[k] for k in ("rows", "total", "sessions", "tools", "specialists"))
+    p50, p95 = exact(durations, 0.5), exact(durations, 0.95)
+    return {
+        "rows": rows,
+        "log_mb": round(size / 1e6, 1),
+        "full_scan_s": round(full_s, 3),
+        "rows_per_s": round(rows / full_s),
+        "peak_kb_at_tenth": round(small_peak / 1024),
+        "peak_kb": round(large_peak / 1024),
+        "appended_rows": append,
+        "incremental_ms": round(append_s * 1000, 2),
+        "resumed": resumed["resumed"],
+        "resumed_equals_rescan": same,
+        "p50_error_pct": round(abs(resumed["total"]["duration"]["p50"] - p50) / p50 * 100, 2),
+        "p95_error_pct": round(abs(resumed["total"]["duration"]["p95"] - p95) / p95 * 100, 2),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=200_000, help="rows in the log (default: 200000)")
+    parser.add_argument("--sessions", type=int, default=100, help="sessions in the log (default: 100)")
+    parser.add_argument("--append", type=int, default=100, help="rows appended before the second run (default: 100)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.rows, args.sessions, args.append)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for name, value in results.items():
+            print(f"{name:<24}{value!s:>12}")
+    return 0 if results["resumed"] and results["resumed_equals_rescan"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
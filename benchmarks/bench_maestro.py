@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+Benchmark: Maestro state-file engine on large plans
+
+Generates a MAESTRO.md with --tasks tasks (each depending on up to three
+earlier ones) and measures, with the median of --repeat runs: a full parse,
+an incremental re-parse after one status change and after one dependency
+change, and the ready-set, topological-order and critical-path queries.
+
+    python benchmarks/bench_maestro.py                  # 1000 and 10000 tasks
+    python benchmarks/bench_maestro.py --tasks 50000 --json
+"""
+
+import argparse
+import json
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+
+from installer.python.maestro.state import STATUSES, TaskStore  # noqa: E402
+
+TOOLS = ("Claude Code", "Gemini CLI", "Codex CLI")
+SPECIALISTS = ("code", "review", "test", "research")
+
+
+def make_plan(tasks: int, seed: int = 1) -> str:
+    rng = random.Random(seed)
+    lines = [
+        "# Maestro Orchestration", "", "## Goal", "Synthetic benchmark plan", "", "## Tasks",
+        "| ID | Description | Status | Specialist | Tool | Depends |",
+        "|----|-------------|--------|------------|------|---------|",
+    ]
+    for i in range(1, tasks + 1):
+        deps = sorted(rng.sample(range(max(1, i - 50), i), min(i - 1, rng.randint(0, 3)))) if i > 1 else []
+        status = "done" if i < tasks // 3 else rng.choice(STATUSES[:2] if i < tasks // 2 else ("pending",))
+        lines.append(f"| {i} | Task {i}: implement part {i} of the plan | {status} | {rng.choice(SPECIALISTS)} "
+                     f"| {rng.choice(TOOLS)} | {','.join(map(str, deps)) or '-'} |")
+    lines += ["", "## Source", "Claude Code | 2026-01-16 14:30 UTC", ""]
+    return "\n".join(lines)
+
+
+def median_ms(fn, repeat: int, setup=None) -> float:
+    samples = []
+    for i in range(repeat):
+        arg = setup(i) if setup else None
+        start = time.perf_counter()
+        fn(arg) if setup else fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return round(statistics.median(samples), 3)
+
+
+def bench(tasks: int, repeat: int) -> dict:
+    text = make_plan(tasks)
+    mid = tasks // 2
+    row = f"| {mid} | Task {mid}: implement part {mid} of the plan |"
+    results = {f"parse.{tasks}": median_ms(lambda: TaskStore.parse(text), repeat)}
+
+    store = TaskStore.parse(text)
+    results[f"ready.{tasks}"] = median_ms(store.ready, repeat)
+    results[f"topo.{tasks}"] = median_ms(lambda: (setattr(store, "_order", None), store.topo_order()), repeat)
+    results[f"critical_path.{tasks}"] = median_ms(store.critical_path, repeat)
+
+    def status_edit(i: int) -> str:
+        line = next(line for line in text.splitlines() if line.startswith(row))
+        status = STATUSES[i % 2]    # alternate, so every run is a real change
+        return text.replace(line, line.replace("| pending |", f"| {status} |").replace("| running |",
+                                                                                        f"| {status} |"))
+
+    results[f"update.status.{tasks}"] = median_ms(store.update, repeat, setup=status_edit)
+
+    def deps_edit(i: int) -> str:
+        line = next(line for line in text.splitlines() if line.startswith(row))
+        return text.replace(line, line.rsplit("|", 2)[0] + f"| {i % (mid - 1) + 1} |")
+
+    results[f"update.depends.{tasks}"] = median_ms(store.update, repeat, setup=deps_edit)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tasks", type=int, action="append", help="plan size (repeatable; default: 1000, 10000)")
+    parser.add_argument("--repeat", type=int, default=5, help="runs per measurement (default: 5)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    results = {}
+    for tasks in args.tasks or [1000, 10000]:
+        results.update(bench(tasks, args.repeat))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{'metric':<28}{'ms':>10}")
+        for name, value in results.items():
+            print(f"{name:<28}{value:>10.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
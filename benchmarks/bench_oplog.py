@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Benchmark: concurrent status updates to MAESTRO.md through the operations log
+
+Starts --writers processes that each own a slice of the tasks and set their
+statuses round by round (every task of the slice to the next status, in
+order), while the main process keeps taking lock-free snapshots. Reports
+transitions per second, the time to read (snapshot and parse) the table,
+and checks that:
+
+- every snapshot is consistent: within each slice, a prefix of tasks is at
+  one round's status and the rest at the round before's;
+- no transition is lost: after the writers finish, every task has the
+  status its last transition set.
+
+`--naive` makes the writers rewrite the whole file per transition (read,
+set_status, atomic replace) without the lock or log, to show the lost
+updates that races cause.
+
+    python benchmarks/bench_oplog.py                        # 4 writers x 2000 transitions
+    python benchmarks/bench_oplog.py --writers 8 --tasks 10000 --json
+    python benchmarks/bench_oplog.py --naive
+"""
+
+import argparse
+import json
+import multiprocessing
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from bench_maestro import make_plan  # noqa: E402
+from installer.python.fileops import atomic_write_bytes  # noqa: E402
+from installer.python.maestro.oplog import StateFile  # noqa: E402
+from installer.python.maestro.state import STATE_FILE, STATUSES, TaskStore, set_status  # noqa: E402
+
+
+def writer(root: str, tasks: list[int], ops: int, naive: bool, start) -> None:
+    state = StateFile(Path(root))
+    start.wait()
+    for i in range(ops):
+        task_id = tasks[i % len(tasks)]
+        status = STATUSES[(i // len(tasks)) % len(STATUSES)]
+        if naive:
+            text = state.path.read_text(encoding="utf-8")
+            atomic_write_bytes(state.path, set_status(text, {task_id: status}).encode())
+        else:
+            state.append({task_id: status}, "bench")
+
+
+def consistent(statuses: list[str]) -> bool:
+    """A prefix at one round's status, the rest at the previous round's."""
+    first = statuses[0]
+    rest = [s for s in statuses if s != first]
+    if not rest:
+        return True
+    boundary = statuses.index(rest[0])
+    return (len(set(statuses[boundary:])) == 1
+            and STATUSES.index(first) == (STATUSES.index(rest[0]) + 1) % len(STATUSES))
+
+
+def expected(j: int, size: int, ops: int) -> str:
+    """The status a writer's j-th task ends with (writer() sets task i % size to round i // size's status)."""
+    if j >= ops:
+        return STATUSES[-1]     # never touched
+    last = j + size * ((ops - 1 - j) // size)
+    return STATUSES[(last // size) % len(STATUSES)]
+
+
+def run(writers: int, tasks: int, ops: int, naive: bool) -> dict:
+    slices = [list(range(w * (tasks // writers) + 1, (w + 1) * (tasks // writers) + 1)) for w in range(writers)]
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / ".ai").mkdir()
+        text = make_plan(tasks)
+        # Every task starts at round -1's status
+        (root / STATE_FILE).write_text(set_status(text, {t: STATUSES[-1] for s in slices for t in s}))
+        state = StateFile(root)
+
+        ctx = multiprocessing.get_context("fork")
+        go = ctx.Event()
+        procs = [ctx.Process(target=writer, args=(str(root), s, ops, naive, go)) for s in slices]
+        for p in procs:
+            p.start()
+        go.set()
+        start = time.perf_counter()
+        reads, inconsistent, latencies = 0, 0, []
+        while any(p.is_alive() for p in procs):
+            t0 = time.perf_counter()
+            store = TaskStore.parse(state.snapshot().text) if not naive else TaskStore.load(state.path)
+            latencies.append((time.perf_counter() - t0) * 1000)
+            reads += 1
+            if not naive:
+                inconsistent += sum(not consistent([STATUSES[store.status[store.index[t]]] for t in s])
+                                    for s in slices)
+        for p in procs:
+            p.join()
+        elapsed = time.perf_counter() - start
+
+        compacted = state.compact()
+        store = TaskStore.load(state.path)
+        lost = sum(STATUSES[store.status[store.index[t]]] != expected(j, len(s), ops)
+                   for s in slices for j, t in enumerate(s))
+    return {
+        "writers": writers,
+        "tasks": tasks,
+        "transitions": writers * ops,
+        "seconds": round(elapsed, 3),
+        "transitions_per_s": round(writers * ops / elapsed),
+        "snapshots": reads,
+        "read_ms_p50": round(statistics.median(latencies), 3) if latencies else None,
+        "inconsistent_snapshots": inconsistent if not naive else None,
+        "compacted_at_end": compacted,
+        "lost_updates": lost,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--writers", type=int, default=4, help="writer processes (default: 4)")
+    parser.add_argument("--tasks", type=int, default=1000, help="tasks in the table (default: 1000)")
+    parser.add_argument("--ops", type=int, default=2000, help="transitions per writer (default: 2000)")
+    parser.add_argument("--naive", action="store_true", help="rewrite the whole file per transition, unlocked")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args()
+
+    results = run(args.writers, args.tasks, args.ops, args.naive)
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for name, value in results.items():
+            if value is not None:
+                print(f"{name:<24}{value:>12}")
+    return 0 if args.naive or (results["lost_updates"] == 0 and results["inconsistent_snapshots"] == 0) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
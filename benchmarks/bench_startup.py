@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Benchmark: nexus-ai startup cost
+
+Runs the entry point as a subprocess for `--version`, `--help`,
+`install --help` and a real headless install into a scratch HOME, and reports
+for each:
+
+  - median wall time, and the same minus a bare `python -c pass`
+    (the part nexus-ai is responsible for)
+  - import cost from `python -X importtime`: the sum of top-level cumulative
+    times, minus what the bare interpreter imports anyway (site, encodings)
+    and the slowest imports
+  - whether textual/rich were imported (they must not be outside the TUI)
+
+Exits non-zero when any command's import cost exceeds --max-ms (the install
+included, although it also loads the catalog, manifest and engine) or any of
+them imports textual. Run from the repo root:
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 30 --max-ms 40 --json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+ENTRY = REPO / "installer" / "python" / "nexus.py"
+
+COMMANDS = {
+    "--version": ["--version"],
+    "--help": ["--help"],
+    "install --help": ["install", "--help"],
+    "install": ["install", "--tools", "all", "--features", "all", "--yes"],
+}
+
+
+def wall_ms(argv: list[str], env: dict, runs: int) -> float:
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(argv, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def import_profile(argv: list[str], env: dict, runs: int) -> tuple[float, list[tuple[str, float]], set[str]]:
+    """Median total import ms, plus the run's [(module, cumulative ms)] slowest first and package names."""
+    totals = []
+    for _ in range(runs):
+        total, rows, packages = _import_run(argv, env)
+        totals.append(total)
+    return statistics.median(totals), rows, packages
+
+
+def _import_run(argv: list[str], env: dict) -> tuple[float, list[tuple[str, float]], set[str]]:
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", *argv],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True,
+    )
+    total = 0.0
+    rows = []
+    packages = set()
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        name = name[1:]  # nesting is shown as extra leading spaces
+        cumulative_ms = int(cumulative) / 1000
+        if not name.startswith(" "):
+            total += cumulative_ms  # top level: cumulative already includes its children
+        rows.append((name.strip(), cumulative_ms))
+        packages.add(name.strip().split(".")[0])
+    rows.sort(key=lambda r: r[1], reverse=True)
+    return total, rows, packages
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=15, help="runs per command; the median is reported (default: 15)")
+    parser.add_argument("--max-ms", type=float, default=50.0, help="import budget per command (default: 50)")
+    parser.add_argument("--top", type=int, default=5, help="slowest imports to list per command (default: 5)")
+    parser.add_argument("--json", action="store_true", help="print JSON results")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as home:
+        env = dict(os.environ, HOME=home, PYTHONDONTWRITEBYTECODE="")
+        # Warm the bytecode and catalog caches so every run measures the steady state
+        subprocess.run([sys.executable, str(ENTRY), *COMMANDS["install"]], env=env,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+
+        baseline = wall_ms([sys.executable, "-c", "pass"], env, args.runs)
+        baseline_imports, _, _ = import_profile(["-c", "pass"], env, args.runs)
+        results = []
+        for name, cmd in COMMANDS.items():
+            argv = [str(ENTRY), *cmd]
+            wall = wall_ms([sys.executable, *argv], env, args.runs)
+            imports_ms, rows, packages = import_profile(argv, env, args.runs)
+            results.append({
+                "command": name,
+                "limit_ms": args.max_ms,
+                "wall_ms": round(wall, 1),
+                "overhead_ms": round(wall - baseline, 1),
+                "import_ms": round(imports_ms - baseline_imports, 1),
+                "slowest_imports": [{"module": m, "ms": round(ms, 1)} for m, ms in rows[:args.top]],
+                "imports_textual": bool(packages & {"textual", "rich"}),
+            })
+
+    failures = [
+        f"{r['command']}: {r['import_ms']} ms importing (limit {r['limit_ms']} ms)"
+        for r in results if r["import_ms"] > r["limit_ms"]
+    ] + [f"{r['command']}: imported textual/rich" for r in results if r["imports_textual"]]
+
+    if args.json:
+        print(json.dumps({
+            "python": sys.version.split()[0],
+            "runs": args.runs,
+            "baseline_ms": round(baseline, 1),
+            "results": results,
+            "failures": failures,
+        }, indent=2))
+    else:
+        print(f"python {sys.version.split()[0]}, median of {args.runs}; bare interpreter {baseline:.1f} ms")
+        print(f"{'command':<16}{'wall ms':>10}{'overhead':>10}{'imports':>10}{'limit':>8}  textual")
+        for r in results:
+            print(f"{r['command']:<16}{r['wall_ms']:>10.1f}{r['overhead_ms']:>10.1f}{r['import_ms']:>10.1f}"
+                  f"{r['limit_ms']:>8.0f}  "
+                  f"{'YES' if r['imports_textual'] else 'no'}")
+        for r in results:
+            slowest = ", ".join(f"{i['module']} {i['ms']:.1f}" for i in r["slowest_imports"])
+            print(f"  {r['command']}: {slowest}")
+        for failure in failures:
+            print(f"FAIL {failure}", file=sys.stderr)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
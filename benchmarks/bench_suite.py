@@ -0,0 +1,267 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite: installer hot paths on synthetic feature catalogs
+
+Generates feature trees (benchmarks/synthetic.py) and measures, with the
+median of --repeat runs:
+
+  catalog   scan of a new tree, and load from the catalog cache
+  install   cold (empty home) and warm (nothing to change) installs, and cold
+            installs that hardlink from a populated object store, and `doctor`
+            checking the installed home
+  managed   write_managed_config on large user files: no-op and one changed section
+  enable    update_enablement from many processes at once (all updates must survive)
+  startup   `nexus-ai --version` and `install --help` as subprocesses
+
+Results are JSON keyed by metric name, so runs from two commits can be
+compared; --compare exits non-zero when a metric regressed beyond the
+threshold. Run from the repo root:
+
+    python benchmarks/bench_suite.py --out before.json
+    python benchmarks/bench_suite.py --compare before.json --threshold 0.25
+    python benchmarks/bench_suite.py --preset full          # up to 1000 features, 10 MB files
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from installer.python.catalog import Catalog  # noqa: E402
+from installer.python.core import TOOLS, update_enablement  # noqa: E402
+from installer.python.doctor import check  # noqa: E402
+from installer.python.engine import InstallEngine  # noqa: E402
+from installer.python.managed import Section, build_managed_block, write_managed_config  # noqa: E402
+from installer.python.store import ObjectStore  # noqa: E402
+from synthetic import body, make_features, make_user_config, parse_size  # noqa: E402
+
+# (features, instruction file size) per install case
+PRESETS = {
+    "quick": {
+        "install": [(10, "1K"), (100, "64K")],
+        "managed": ["1M", "32M"],
+        "enable": (4, 25),
+    },
+    "full": {
+        "install": [(10, "1K"), (100, "64K"), (1000, "1K"), (10, "1M"), (3, "10M")],
+        "managed": ["1M", "32M", "256M"],
+        "enable": (16, 50),
+    },
+}
+
+
+def timed(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return (time.perf_counter() - start) * 1000
+
+
+def median_ms(fn, repeat: int, setup=None) -> float:
+    times = []
+    for i in range(repeat):
+        if setup:
+            setup(i)
+        times.append(timed(fn))
+    return statistics.median(times)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# BENCHMARKS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def bench_install(tmp: Path, features: int, size: str, repeat: int) -> dict:
+    root = tmp / f"features-{features}-{size}"
+    feature_ids = make_features(root, features, parse_size(size))
+    tool_ids = [t.id for t in TOOLS]
+    tag = f"{features}x{size}"
+    results = {}
+
+    caches = iter(range(10**6))
+    results[f"catalog.scan.{tag}"] = median_ms(
+        lambda: Catalog.load(root, cache_dir=tmp / f"cache-{next(caches)}"), repeat)
+    cache = tmp / "cache-warm"
+    Catalog.load(root, cache_dir=cache)
+    results[f"catalog.cached.{tag}"] = median_ms(lambda: Catalog.load(root, cache_dir=cache), repeat)
+
+    catalog = Catalog.load(root, cache_dir=cache)
+    homes = []
+
+    def new_home(i: int) -> None:
+        homes.append(tmp / f"home-{tag}-{len(homes)}")
+        homes[-1].mkdir()
+
+    def install() -> None:
+        result = InstallEngine(homes[-1], catalog, tool_ids, feature_ids).run()
+        assert result.ok, result.errors
+
+    results[f"install.cold.{tag}"] = median_ms(install, repeat, setup=new_home)
+    results[f"install.warm.{tag}"] = median_ms(install, repeat)
+
+    store = ObjectStore(tmp / f"store-{tag}")
+    results[f"store.populate.{tag}"] = timed(lambda: store.populate(catalog))
+
+    def install_linked() -> None:
+        result = InstallEngine(homes[-1], catalog, tool_ids, feature_ids, store=store).run()
+        assert result.ok, result.errors
+
+    results[f"install.store_cold.{tag}"] = median_ms(install_linked, repeat, setup=new_home)
+    results[f"doctor.{tag}"] = median_ms(lambda: check(homes[-1], catalog), repeat)
+    return results
+
+
+def bench_managed(tmp: Path, size: str, repeat: int) -> dict:
+    """Rewrite a block of 10 sections inside a large user file."""
+    sources = []
+    for i in range(10):
+        src = tmp / f"section-{i}.md"
+        src.write_bytes(body(8192, f"section {i}"))
+        sources.append(src)
+    sections = [Section.from_path(src) for src in sources]
+    dst = tmp / f"CLAUDE-{size}.md"
+    make_user_config(dst, parse_size(size), build_managed_block(sections))
+
+    results = {f"managed.noop.{size}": median_ms(lambda: write_managed_config(dst, sections), repeat)}
+
+    # Alternate one section between two versions so every run really writes
+    variants = [body(8192, "section 0 v2"), body(8192, "section 0")]
+
+    def change(i: int) -> None:
+        sources[0].write_bytes(variants[i % 2])
+        sections[0] = Section.from_path(sources[0])
+
+    results[f"managed.one_changed.{size}"] = median_ms(lambda: write_managed_config(dst, sections), repeat,
+                                                      setup=change)
+    return results
+
+
+def _enable_worker(args) -> None:
+    path, worker, updates = args
+    for n in range(updates):
+        update_enablement(Path(path), [f"ext-{worker}-{n}"])
+
+
+def bench_enable(tmp: Path, processes: int, updates: int, repeat: int) -> dict:
+    def run(i: int) -> None:
+        path = tmp / f"enablement-{i}" / "extension-enablement.json"
+        path.parent.mkdir()
+        paths.append(path)
+
+    paths = []
+
+    def contend() -> None:
+        with multiprocessing.get_context("fork").Pool(processes) as pool:
+            pool.map(_enable_worker, [(str(paths[-1]), w, updates) for w in range(processes)])
+        data = json.loads(paths[-1].read_text())
+        if len(data) != processes * updates:
+            raise AssertionError(f"lost updates: {processes * updates - len(data)}")
+
+    tag = f"{processes}x{updates}"
+    return {f"enable.contended.{tag}": median_ms(contend, repeat, setup=run)}
+
+
+def bench_startup(repeat: int) -> dict:
+    entry = REPO / "installer" / "python" / "nexus.py"
+    results = {}
+    for name, argv in (("version", ["--version"]), ("install_help", ["install", "--help"])):
+        cmd = [sys.executable, str(entry), *argv]
+        results[f"startup.{name}"] = median_ms(
+            lambda: subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True),
+            max(repeat, 9))
+    return results
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# COMPARISON
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def compare(baseline: dict, current: dict, threshold: float, floor_ms: float) -> list[str]:
+    """Metrics slower than baseline by more than threshold (and by at least floor_ms)."""
+    regressions = []
+    for name, ms in current.items():
+        before = baseline.get(name)
+        if before is None:
+            continue
+        if ms > before * (1 + threshold) and ms - before >= floor_ms:
+            regressions.append(f"{name}: {before:.2f} ms -> {ms:.2f} ms (+{(ms / before - 1) * 100:.0f}%)")
+    return regressions
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="quick", help="workload size (default: quick)")
+    parser.add_argument("--only", action="append", choices=["install", "managed", "enable", "startup"],
+                        help="run only these groups (repeatable)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per metric; the median is kept (default: 3)")
+    parser.add_argument("--dir", help="scratch directory (default: system temp; use to test a specific filesystem)")
+    parser.add_argument("--out", help="write JSON results to this file")
+    parser.add_argument("--compare", metavar="BASELINE", help="JSON results of an earlier run to compare against")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="relative slowdown that counts as a regression (default: 0.25)")
+    parser.add_argument("--floor-ms", type=float, default=2.0,
+                        help="ignore slowdowns smaller than this, in ms (default: 2)")
+    args = parser.parse_args()
+
+    preset = PRESETS[args.preset]
+    groups = set(args.only or ["install", "managed", "enable", "startup"])
+    results = {}
+    with tempfile.TemporaryDirectory(dir=args.dir) as tmp:
+        tmp = Path(tmp)
+        if "install" in groups:
+            for features, size in preset["install"]:
+                results.update(bench_install(tmp, features, size, args.repeat))
+        if "managed" in groups:
+            for size in preset["managed"]:
+                results.update(bench_managed(tmp, size, args.repeat))
+        if "enable" in groups:
+            results.update(bench_enable(tmp, *preset["enable"], args.repeat))
+    if "startup" in groups:
+        results.update(bench_startup(args.repeat))
+
+    report = {
+        "meta": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "preset": args.preset,
+            "repeat": args.repeat,
+        },
+        "results": {name: round(ms, 3) for name, ms in results.items()},
+    }
+    if args.out:
+        Path(args.out).write_text(json.dumps(report, indent=2) + "\n")
+
+    print(f"{'metric':<36}{'ms':>12}")
+    for name, ms in report["results"].items():
+        print(f"{name:<36}{ms:>12.2f}")
+
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        regressions = compare(baseline["results"], report["results"], args.threshold, args.floor_ms)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"no regressions against {args.compare} ({baseline['meta'].get('commit') or 'unknown commit'})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Benchmark: keypress-to-frame latency of the selection list
+
+Opens the features screen of the TUI headlessly with a synthetic catalog of
+--items features (benchmarks/synthetic.py) and measures, per key, the time
+from posting the key to the next frame the compositor produces (including
+rendering it to terminal output). Keys: cursor moves, page moves, toggles,
+typing / deleting a filter query, and screen changes (esc / enter).
+
+    python benchmarks/bench_tui.py                    # 1000 items
+    python benchmarks/bench_tui.py --items 5000 --json
+    python benchmarks/bench_tui.py --max-p95-ms 30    # exit 1 if slower
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from installer.python.catalog import Catalog  # noqa: E402
+from installer.python.core import load_features  # noqa: E402
+from installer.python.tui import FeaturesScreen, NexusInstaller  # noqa: E402
+from synthetic import make_features  # noqa: E402
+
+FRAME_TIMEOUT = 2.0
+
+
+class FrameClock:
+    """Wraps App._display to timestamp every frame, rendering it like a real terminal would."""
+
+    def __init__(self, app) -> None:
+        self.app = app
+        self.frame = asyncio.Event()
+        self.last = 0.0
+        self._display = app._display
+        app._display = self.display
+
+    def display(self, screen, renderable) -> None:
+        self._display(screen, renderable)
+        if renderable is not None:
+            from textual._compositor import CompositorUpdate
+
+            if isinstance(renderable, CompositorUpdate):
+                renderable.render_segments(self.app.console)
+            self.last = time.perf_counter()
+            self.frame.set()
+
+
+async def press(pilot, clock: FrameClock, key: str) -> float:
+    """ms from posting key to the next frame (a timeout counts as FRAME_TIMEOUT)."""
+    clock.frame.clear()
+    start = time.perf_counter()
+    await pilot.press(key)
+    try:
+        await asyncio.wait_for(clock.frame.wait(), FRAME_TIMEOUT)
+    except asyncio.TimeoutError:
+        return FRAME_TIMEOUT * 1000
+    return (clock.last - start) * 1000
+
+
+def stats(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+    return {
+        "n": len(ordered),
+        "p50": round(statistics.median(ordered), 3),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        "max": round(ordered[-1], 3),
+    }
+
+
+async def run(items: int, moves: int, banner: str) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / "features"
+        make_features(root, items, 256, commands=0)
+        feature_list = load_features(Catalog.load(root, cache_dir=Path(tmp) / "cache"))
+
+    app = NexusInstaller(banner_mode=banner)
+    app.feature_list = feature_list
+    samples: dict[str, list[float]] = {"down": [], "up": [], "pagedown": [], "space": [], "filter": [],
+                                       "unfilter": [], "screen": []}
+    async with app.run_test(size=(100, 60)) as pilot:
+        await app.push_screen(FeaturesScreen(feature_list))
+        await pilot.pause()
+        clock = FrameClock(app)
+
+        for key, count in (("down", moves), ("up", moves), ("pagedown", moves // 10), ("space", moves // 10)):
+            for _ in range(count):
+                samples[key].append(await press(pilot, clock, key))
+                await pilot.pause()
+
+        await pilot.press("slash")
+        query = "bench0999"
+        for char in query:
+            samples["filter"].append(await press(pilot, clock, char))
+            await pilot.pause()
+        for _ in query:
+            samples["unfilter"].append(await press(pilot, clock, "backspace"))
+            await pilot.pause()
+        await pilot.press("enter")  # leave filter mode
+
+        for _ in range(moves // 10):
+            for key in ("escape", "enter"):  # back to the tools screen, and a new features screen
+                samples["screen"].append(await press(pilot, clock, key))
+                await pilot.pause()
+
+    return {key: stats(values) for key, values in samples.items() if values}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=1000, help="features in the list (default: 1000)")
+    parser.add_argument("--moves", type=int, default=100, help="cursor moves per direction (default: 100)")
+    parser.add_argument("--banner", choices=["auto", "full", "compact", "none"], default="auto",
+                        help="TUI banner mode (default: auto)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--max-p95-ms", type=float, help="exit 1 if any key's p95 latency exceeds this")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.items, args.moves, args.banner))
+
+    if args.json:
+        print(json.dumps({"items": args.items, "keys": results}, indent=2))
+    else:
+        print(f"{args.items} items, ms from keypress to frame")
+        print(f"{'key':<10}{'n':>6}{'p50':>10}{'p95':>10}{'max':>10}")
+        for key, row in results.items():
+            print(f"{key:<10}{row['n']:>6}{row['p50']:>10.2f}{row['p95']:>10.2f}{row['max']:>10.2f}")
+
+    if args.max_p95_ms is not None:
+        slow = [key for key, row in results.items() if row["p95"] > args.max_p95_ms]
+        if slow:
+            print(f"p95 above {args.max_p95_ms} ms: {', '.join(slow)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
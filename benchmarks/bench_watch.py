@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Benchmark: edit-to-installed latency of `nexus-ai watch`
+
+Installs a synthetic catalog (benchmarks/synthetic.py) into a scratch home,
+starts the watch loop on a thread, then repeatedly edits one feature's
+command file and instruction file and measures the time until the installed
+copy (or the managed block) has the new content.
+
+    python benchmarks/bench_watch.py                        # 50 features, inotify
+    python benchmarks/bench_watch.py --poll --edits 10
+    python benchmarks/bench_watch.py --max-p95-ms 100       # exit 1 if slower
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from installer.python.catalog import Catalog  # noqa: E402
+from installer.python.core import TOOLS  # noqa: E402
+from installer.python.engine import InstallEngine  # noqa: E402
+from installer.python.watch import Syncer, open_watcher, watch  # noqa: E402
+from synthetic import body, make_features, parse_size  # noqa: E402
+
+TIMEOUT = 5.0
+
+
+def wait_for(path: Path, marker: bytes) -> float:
+    """perf_counter() when path first contains marker (TIMEOUT after the call if never)."""
+    deadline = time.perf_counter() + TIMEOUT
+    while time.perf_counter() < deadline:
+        try:
+            if marker in path.read_bytes():
+                return time.perf_counter()
+        except FileNotFoundError:
+            pass
+        time.sleep(0.0005)
+    return deadline
+
+
+def stats(samples: list[float]) -> dict:
+    ordered = sorted(samples)
+    return {
+        "n": len(ordered),
+        "p50": round(statistics.median(ordered), 3),
+        "p95": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        "max": round(ordered[-1], 3),
+    }
+
+
+def run(features: int, size: int, edits: int, poll: bool, debounce: float) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        root = tmp / "features"
+        feature_ids = make_features(root, features, size)
+        tool_ids = [t.id for t in TOOLS]
+        home = tmp / "home"
+        home.mkdir()
+        catalog = Catalog.load(root, cache_dir=tmp / "cache")
+        assert InstallEngine(home, catalog, tool_ids, feature_ids).run().ok
+
+        selection = {tool_id: set(feature_ids) for tool_id in tool_ids}
+        watcher = open_watcher(root, poll)
+        stop = threading.Event()
+        thread = threading.Thread(target=watch, args=(watcher, Syncer(home, catalog, selection), debounce),
+                                  kwargs={"stop": stop})
+        thread.start()
+        time.sleep(0.1)
+
+        feature = feature_ids[len(feature_ids) // 2]
+        cases = {
+            "command": (root / feature / "claude" / "commands" / f"{feature}.md",
+                        home / ".claude" / "commands" / f"{feature}.md"),
+            "instruction": (root / feature / "claude" / "CLAUDE.md", home / ".claude" / "CLAUDE.md"),
+        }
+        samples: dict[str, list[float]] = {name: [] for name in cases}
+        try:
+            for i in range(edits):
+                for name, (src, dst) in cases.items():
+                    marker = f"edit {name} {i}".encode()
+                    start = time.perf_counter()
+                    src.write_bytes(body(size if name == "instruction" else 2048, marker.decode()))
+                    samples[name].append((wait_for(dst, marker) - start) * 1000)
+                    time.sleep(debounce * 2)  # let the batch close before the next edit
+        finally:
+            stop.set()
+            thread.join()
+            watcher.close()
+    return {name: stats(values) for name, values in samples.items()}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--features", type=int, default=50, help="features in the catalog (default: 50)")
+    parser.add_argument("--size", default="16K", help="instruction file size (default: 16K)")
+    parser.add_argument("--edits", type=int, default=20, help="edits per case (default: 20)")
+    parser.add_argument("--poll", action="store_true", help="use the polling watcher")
+    parser.add_argument("--debounce", type=float, default=20, help="debounce in ms (default: 20)")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    parser.add_argument("--max-p95-ms", type=float, help="exit 1 if any case's p95 latency exceeds this")
+    args = parser.parse_args()
+
+    results = run(args.features, parse_size(args.size), args.edits, args.poll, args.debounce / 1000)
+
+    if args.json:
+        print(json.dumps({"features": args.features, "poll": args.poll, "cases": results}, indent=2))
+    else:
+        print(f"{args.features} features, {'polling' if args.poll else 'inotify'}, ms from edit to installed")
+        print(f"{'case':<14}{'n':>6}{'p50':>10}{'p95':>10}{'max':>10}")
+        for name, row in results.items():
+            print(f"{name:<14}{row['n']:>6}{row['p50']:>10.2f}{row['p95']:>10.2f}{row['max']:>10.2f}")
+
+    if args.max_p95_ms is not None:
+        slow = [name for name, row in results.items() if row["p95"] > args.max_p95_ms]
+        if slow:
+            print(f"p95 above {args.max_p95_ms} ms: {', '.join(slow)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
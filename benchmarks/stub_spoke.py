@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+A stand-in spoke for `nexus-ai maestro run`
+
+Accepts any of the spoke contract's commands (claude -p ... --output-format
+json, gemini -p ... -o json, codex exec ... --json), sleeps, and answers in
+that CLI's JSON shape with a Result Submission Template. Use it in place of
+the real CLIs:
+
+    nexus-ai maestro run --spoke gemini="python benchmarks/stub_spoke.py" \\
+                         --spoke codex="python benchmarks/stub_spoke.py" \\
+                         --spoke claude="python benchmarks/stub_spoke.py"
+
+Environment:
+    STUB_SPOKE_SECONDS   time each task takes (default: 0.1)
+    STUB_SPOKE_FAIL      chance that an attempt fails (default: 0)
+    STUB_SPOKE_STATUS    answer with this Status instead (success, partial, failed, blocked,
+                         or "garbage" for output that does not follow the contract)
+"""
+
+import json
+import os
+import random
+import re
+import sys
+import time
+
+
+def answer(task: str, status: str) -> str:
+    if status == "garbage":
+        return f"I looked at '{task}' and it seems fine."
+    verified = "x" if status == "success" else " "
+    return "\n".join([
+        "## Status", status, "",
+        "## Summary", f"{'Completed' if status == 'success' else 'Did not complete'}: {task}", "",
+        "## Changes", "- stub.txt: appended a line", "",
+        "## Verification", f"- [{verified}] {task}", "",
+        "## Issues", "None" if status == "success" else "The stub spoke was told to fail",
+    ])
+
+
+def main() -> int:
+    args = sys.argv[1:]
+    prompt = next((args[i + 1] for i, a in enumerate(args[:-1]) if a in ("-p", "exec")), "")
+    match = re.search(r"^## Task\n(.+)$", prompt, re.MULTILINE)
+    task = match.group(1) if match else "the task"
+
+    time.sleep(float(os.environ.get("STUB_SPOKE_SECONDS", "0.1")))
+    status = os.environ.get("STUB_SPOKE_STATUS") or (
+        "failed" if random.random() < float(os.environ.get("STUB_SPOKE_FAIL", "0")) else "success")
+    text = answer(task, status)
+    usage = {"input_tokens": len(prompt) // 4, "output_tokens": len(text) // 4}
+
+    if "--output-format" in args:       # claude
+        print(json.dumps({"type": "result", "result": text, "usage": usage}))
+    elif "-o" in args:                  # gemini
+        print(json.dumps({"response": text, "stats": {"models": {"stub": {"tokens": {"total": sum(usage.values())}}}}}))
+    else:                               # codex: one event per line
+        print(json.dumps({"type": "thread.started"}))
+        print(json.dumps({"type": "item.completed", "item": {"type": "agent_message", "text": text}}))
+        print(json.dumps({"type": "turn.completed", "usage": usage}))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
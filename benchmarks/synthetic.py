@@ -0,0 +1,66 @@
+"""
+Synthetic feature trees for the benchmarks.
+
+Generates features/<feature>/ directories in the layout the catalog scans
+(see TOOL_LAYOUTS in installer/python/catalog.py): per tool a managed config
+("instruction file") of the requested size, command files, and for Gemini an
+extension manifest. Content is deterministic, so runs are comparable.
+"""
+
+import json
+from pathlib import Path
+
+_LINE = b"- When resuming, read the state file first and continue from the last checkpoint.\n"
+
+
+def parse_size(value: str) -> int:
+    units = {"K": 1024, "M": 1024 * 1024}
+    if value[-1].upper() in units:
+        return int(value[:-1]) * units[value[-1].upper()]
+    return int(value)
+
+
+def body(size: int, seed: str) -> bytes:
+    """size bytes of markdown-ish text; the header makes every file distinct."""
+    header = f"# {seed}\n\n".encode()
+    fill = max(0, size - len(header))
+    return header + (_LINE * (fill // len(_LINE) + 1))[:fill]
+
+
+def make_features(root: Path, features: int, instruction_size: int, commands: int = 3,
+                  command_size: int = 2048) -> list[str]:
+    """Write `features` synthetic features under root; returns their ids."""
+    ids = []
+    for i in range(features):
+        feature = f"bench{i:04d}"
+        ids.append(feature)
+        base = root / feature
+        (base / "claude" / "commands").mkdir(parents=True)
+        (base / "codex" / "prompts").mkdir(parents=True)
+        ext = base / "gemini" / "extensions" / feature
+        (ext / "commands").mkdir(parents=True)
+
+        (base / "feature.json").write_text(json.dumps({
+            "name": f"Bench {i}", "description": "Synthetic benchmark feature", "selected": True,
+        }))
+        (base / "claude" / "CLAUDE.md").write_bytes(body(instruction_size, f"{feature} claude"))
+        (base / "gemini" / "GEMINI.md").write_bytes(body(instruction_size, f"{feature} gemini"))
+        (base / "codex" / "AGENTS.md").write_bytes(body(instruction_size, f"{feature} codex"))
+        (ext / "gemini-extension.json").write_text(json.dumps({"name": feature, "version": "1.0.0"}))
+        for c in range(commands):
+            name = feature if c == 0 else f"{feature}-cmd{c}"
+            (base / "claude" / "commands" / f"{name}.md").write_bytes(body(command_size, f"{name} claude"))
+            (base / "codex" / "prompts" / f"{name}.md").write_bytes(body(command_size, f"{name} codex"))
+            (ext / "commands" / f"{name}.toml").write_bytes(body(command_size, f"{name} gemini"))
+    return ids
+
+
+def make_user_config(path: Path, size: int, block: bytes = b"") -> None:
+    """A user's CLAUDE.md of about `size` bytes, with `block` (if any) in the middle."""
+    half = body(size // 2, "user notes")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(half)
+        if block:
+            f.write(b"\n" + block + b"\n")
+        f.write(half)
@@ -0,0 +1,255 @@
+"""
+Nexus-AI Installer - Feature catalog
+
+Scans the features directory once into an index of every feature, the tools
+it supports and the exact files to install for each tool (with their sha256),
+so installers never glob. The index is cached in ~/.nexus-ai/cache/ and
+reused while the fingerprint of the tree (path, size and mtime of every
+directory and file) is unchanged.
+
+Adding a feature is a directory drop: optional metadata lives in
+features/<feature>/feature.json ({"name", "description", "selected"}).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from installer.python.manifest import STATE_DIR, sha256_file
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional
+
+CATALOG_VERSION = 1
+METADATA_FILE = "feature.json"
+
+# Per tool: the managed config file (source name == installed name, relative to the
+# tool dir) and how command files map from features/<f>/<tool>/ to the home directory.
+# "{feature}" is substituted with the feature id.
+TOOL_LAYOUTS = {
+    "claude": {
+        "dir": ".claude",
+        "config": "CLAUDE.md",
+        "commands": [("commands", ".md", ".claude/commands")],
+        "extension": None,
+    },
+    "gemini": {
+        "dir": ".gemini",
+        "config": "GEMINI.md",
+        "commands": [("extensions/{feature}/commands", ".toml", ".gemini/extensions/{feature}/commands")],
+        "extension": ("extensions/{feature}/gemini-extension.json", ".gemini/extensions/{feature}/gemini-extension.json"),
+    },
+    "codex": {
+        "dir": ".codex",
+        "config": "AGENTS.md",
+        "commands": [("prompts", ".md", ".codex/prompts")],
+        "extension": None,
+    },
+}
+
+
+# Plain classes, not dataclasses: see the startup note in nexus.py
+
+class Asset:
+    __slots__ = ("src", "dst", "sha256", "size")
+
+    def __init__(self, src: str, dst: str, sha256: str, size: int) -> None:
+        self.src = src          # relative to the features directory
+        self.dst = dst          # relative to the target home directory
+        self.sha256 = sha256
+        self.size = size
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, Asset) and self.to_dict() == other.to_dict()
+
+    def to_dict(self) -> dict:
+        return {"src": self.src, "dst": self.dst, "sha256": self.sha256, "size": self.size}
+
+
+class ToolAssets:
+    __slots__ = ("config", "files", "extension")
+
+    def __init__(self, config: Optional[Asset] = None, files: Optional[list[Asset]] = None,
+                 extension: Optional[str] = None) -> None:
+        self.config = config
+        self.files = files if files is not None else []
+        self.extension = extension   # Gemini extension name to enable
+
+    def to_dict(self) -> dict:
+        return {"config": self.config.to_dict() if self.config else None,
+                "files": [a.to_dict() for a in self.files], "extension": self.extension}
+
+
+class FeatureEntry:
+    __slots__ = ("id", "name", "description", "selected", "tools")
+
+    def __init__(self, id: str, name: str, description: str, selected: bool, tools: dict[str, ToolAssets]) -> None:
+        self.id = id
+        self.name = name
+        self.description = description
+        self.selected = selected
+        self.tools = tools
+
+    def to_dict(self) -> dict:
+        return {"id": self.id, "name": self.name, "description": self.description, "selected": self.selected,
+                "tools": {tool_id: assets.to_dict() for tool_id, assets in self.tools.items()}}
+
+
+class Catalog:
+    """Index of the features directory."""
+
+    def __init__(self, root: Path, features: dict[str, FeatureEntry], fingerprint: str = "") -> None:
+        self.root = root
+        self.features = features
+        self.fingerprint = fingerprint
+
+    @classmethod
+    def load(cls, root: Path, cache_dir: Optional[Path] = None) -> "Catalog":
+        """Load from the on-disk cache if the tree is unchanged, else rescan and cache."""
+        if cache_dir is None:
+            cache_dir = Path.home() / STATE_DIR / "cache"
+        root = root.resolve()
+        fingerprint = tree_fingerprint(root)
+        cache_path = cache_dir / f"catalog-{hashlib.sha256(str(root).encode()).hexdigest()[:16]}.json"
+
+        try:
+            data = json.loads(cache_path.read_text())
+            if data.get("version") == CATALOG_VERSION and data.get("fingerprint") == fingerprint:
+                return cls.from_dict(root, data)
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        catalog = cls.scan(root, fingerprint)
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(catalog.to_dict()))
+            os.replace(tmp, cache_path)
+        except OSError:
+            pass  # Read-only home: the scan result is still usable
+        return catalog
+
+    @classmethod
+    def scan(cls, root: Path, fingerprint: str = "") -> "Catalog":
+        features = {}
+        for feature_dir in sorted(p for p in root.iterdir() if p.is_dir() and not p.name.startswith((".", "_"))):
+            entry = _scan_feature(root, feature_dir)
+            if entry.tools:
+                features[entry.id] = entry
+        return cls(root, features, fingerprint)
+
+    def to_dict(self) -> dict:
+        return {
+            "version": CATALOG_VERSION,
+            "fingerprint": self.fingerprint,
+            "features": {fid: entry.to_dict() for fid, entry in self.features.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, root: Path, data: dict) -> "Catalog":
+        features = {}
+        for fid, raw in data["features"].items():
+            tools = {}
+            for tool_id, t in raw["tools"].items():
+                tools[tool_id] = ToolAssets(
+                    config=Asset(**t["config"]) if t["config"] else None,
+                    files=[Asset(**a) for a in t["files"]],
+                    extension=t["extension"],
+                )
+            features[fid] = FeatureEntry(raw["id"], raw["name"], raw["description"], raw["selected"], tools)
+        return cls(root, features, data.get("fingerprint", ""))
+
+    def rescan(self, feature_ids) -> None:
+        """Re-index only these features (dropping any that are gone); the fingerprint no longer applies."""
+        for feature_id in feature_ids:
+            feature_dir = self.root / feature_id
+            entry = None
+            if feature_dir.is_dir() and not feature_id.startswith((".", "_")):
+                entry = _scan_feature(self.root, feature_dir)
+            if entry is not None and entry.tools:
+                self.features[feature_id] = entry
+            else:
+                self.features.pop(feature_id, None)
+        self.fingerprint = ""
+
+    def assets(self, feature_id: str, tool_id: str) -> Optional[ToolAssets]:
+        entry = self.features.get(feature_id)
+        return entry.tools.get(tool_id) if entry else None
+
+    def supports(self, feature_id: str, tool_id: str) -> bool:
+        return self.assets(feature_id, tool_id) is not None
+
+
+def tree_fingerprint(root: Path) -> str:
+    """Hash of (path, size, mtime) for every entry; no file contents are read."""
+    digest = hashlib.sha256()
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        with os.scandir(current) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        for entry in entries:
+            st = entry.stat(follow_symlinks=False)
+            digest.update(f"{entry.path}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+            if entry.is_dir(follow_symlinks=False):
+                stack.append(Path(entry.path))
+    return digest.hexdigest()
+
+
+def _asset(root: Path, src: Path, dst: str) -> Asset:
+    return Asset(src.relative_to(root).as_posix(), dst, sha256_file(src), src.stat().st_size)
+
+
+def _scan_feature(root: Path, feature_dir: Path) -> FeatureEntry:
+    feature = feature_dir.name
+    meta = {}
+    meta_path = feature_dir / METADATA_FILE
+    if meta_path.exists():
+        meta = json.loads(meta_path.read_text())
+
+    tools = {}
+    for tool_id, layout in TOOL_LAYOUTS.items():
+        tool_dir = feature_dir / tool_id
+        if not tool_dir.is_dir():
+            continue
+        assets = ToolAssets()
+
+        config = tool_dir / layout["config"]
+        if config.is_file():
+            assets.config = _asset(root, config, f"{layout['dir']}/{layout['config']}")
+
+        if layout["extension"]:
+            src_rel, dst_rel = (p.format(feature=feature) for p in layout["extension"])
+            manifest = tool_dir / src_rel
+            if manifest.is_file():
+                assets.files.append(_asset(root, manifest, dst_rel))
+                assets.extension = feature
+                if not meta.get("description"):
+                    meta["description"] = json.loads(manifest.read_text()).get("description", "")
+
+        # Command files matching the feature name pattern: <feature>.<ext> or <feature>-*.<ext>
+        for src_sub, ext, dst_sub in layout["commands"]:
+            cmd_dir = tool_dir / src_sub.format(feature=feature)
+            if not cmd_dir.is_dir():
+                continue
+            for src in sorted(cmd_dir.iterdir()):
+                name = src.name
+                if src.is_file() and name.endswith(ext) and (
+                    name == f"{feature}{ext}" or name.startswith(f"{feature}-")
+                ):
+                    assets.files.append(_asset(root, src, f"{dst_sub.format(feature=feature)}/{name}"))
+
+        if assets.config or assets.files:
+            tools[tool_id] = assets
+
+    return FeatureEntry(
+        id=feature,
+        name=meta.get("name", feature),
+        description=meta.get("description", ""),
+        selected=bool(meta.get("selected", False)),
+        tools=tools,
+    )
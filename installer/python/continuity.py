@@ -0,0 +1,296 @@
+"""
+Nexus-AI Installer - Continuity scan
+
+`nexus-ai continuity scan ROOT...` finds every project under the given trees
+that has continuity files (features/continuity): the unified
+`.ai/CONTINUITY.md`, the legacy `.claude/`, `.gemini/` and `.codex/`
+copies, and the `.ai/.legacy-checked` flag. Each file is reported with the
+tool and timestamp of its Source line and its legacy status:
+
+    superseded    a legacy file next to an `.ai/CONTINUITY.md` (likely stale)
+    unmigrated    a legacy file in a project without one
+
+The walk runs on a thread pool (os.scandir releases the GIL) and does not
+descend into VCS, vendored or dependency directories (SKIP_DIRS), nor into
+the tool directories themselves.
+
+Every directory's mtime, subdirectories and tool directories are kept in an
+index (INDEX_FILE, or --index). A later scan still stats each directory, but
+lists only those whose mtime changed: adding, removing or renaming an entry
+changes its directory's mtime, so an unchanged directory has the same
+subdirectories. A directory modified within MTIME_SLACK of a scan is not
+trusted by the next one, since a change in the same clock tick would not show.
+Continuity files are stat'ed on every scan and re-read only when their size or
+mtime changed.
+"""
+
+import json
+import os
+import queue
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+from installer.python.fileops import atomic_write_bytes
+
+CONTINUITY_FILE = ".ai/CONTINUITY.md"
+LEGACY_FILES = (".claude/CONTINUITY.md", ".gemini/CONTINUITY.md", ".codex/CONTINUITY.md")
+LEGACY_FLAG = ".ai/.legacy-checked"
+
+# Directories whose presence marks a project (and that the walk does not enter)
+TOOL_DIRS = frozenset(p.split("/")[0] for p in (CONTINUITY_FILE,) + LEGACY_FILES)
+
+# Version control, vendored code, dependencies, virtualenvs and build caches
+SKIP_DIRS = frozenset({
+    ".git", ".hg", ".svn", ".bzr", "CVS", ".jj",
+    "node_modules", "bower_components", "vendor", "third_party", "third-party", "Pods", "Carthage",
+    ".venv", "venv", "site-packages", "__pycache__", ".tox", ".nox", ".mypy_cache", ".pytest_cache",
+    ".ruff_cache", ".gradle", ".terraform", ".next", ".cache", "target",
+})
+
+INDEX_VERSION = 1
+INDEX_FILE = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "nexus-ai" / "continuity-index.json"
+
+# Directory mtimes this close to the scan are listed again next time
+MTIME_SLACK = 2.0
+
+_SOURCE_HEADING = re.compile(r"^#+\s*Source\s*$", re.IGNORECASE)
+_SOURCE_INLINE = re.compile(r"^\W*Source\W*:\W*(.+)$", re.IGNORECASE)
+_TIMESTAMP = re.compile(r"(\d{4}-\d{2}-\d{2})[ T](\d{2}:\d{2})")
+
+
+@dataclass
+class ContinuityFile:
+    project: str                # absolute path of the project directory
+    path: str                   # CONTINUITY_FILE or one of LEGACY_FILES
+    tool: str = ""              # from the Source line
+    updated: str = ""           # the Source line's timestamp, as written
+    legacy: str = ""            # "", "superseded" or "unmigrated"
+    legacy_checked: str = ""    # contents of LEGACY_FLAG, if the project has one
+
+    def age_days(self, now: Optional[float] = None) -> Optional[float]:
+        """Days since the Source timestamp; None if the file has none."""
+        match = _TIMESTAMP.search(self.updated)
+        if not match:
+            return None
+        stamp = datetime.strptime(f"{match.group(1)} {match.group(2)}", "%Y-%m-%d %H:%M").replace(tzinfo=timezone.utc)
+        return ((now or time.time()) - stamp.timestamp()) / 86400
+
+
+@dataclass
+class ScanResult:
+    files: list[ContinuityFile] = field(default_factory=list)
+    directories: int = 0        # directories visited
+    listed: int = 0             # of those, read with scandir (the rest came from the index)
+    errors: list[str] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+def read_source(text: str) -> tuple[str, str]:
+    """(tool, timestamp) from a continuity file's Source section, e.g. "Claude Code | 2026-01-16 14:30 UTC"."""
+    line = ""
+    lines = text.splitlines()
+    for i, current in enumerate(lines):
+        if _SOURCE_HEADING.match(current.strip()):
+            line = next((rest.strip() for rest in lines[i + 1:] if rest.strip()), "")
+            break
+        match = _SOURCE_INLINE.match(current.strip())
+        if match:
+            line = match.group(1).strip()   # legacy files: "**Source:** Gemini CLI | ..."
+    if line.startswith("#"):
+        return "", ""
+    tool, _, stamp = line.partition("|")
+    if not stamp and _TIMESTAMP.search(tool):
+        tool, stamp = "", tool
+    return tool.strip(" *[]"), stamp.strip(" *[]")
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# WALK
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class _Walk:
+    """One root's parallel walk. Index entries, keyed by path relative to the root, are
+
+        [mtime_ns (0: list again), [subdirectories], [tool dirs], {file: [mtime_ns, size, tool, updated]}]
+    """
+
+    def __init__(self, root: str, old: dict[str, list], jobs: int, started: float) -> None:
+        self.root = root
+        self.old = old
+        self.new: dict[str, list] = {}
+        self.jobs = jobs
+        self.cutoff = int((started - MTIME_SLACK) * 1e9)
+        self.listed = 0
+        self.changed = len(old) == 0   # whether self.new differs from the index's entries
+        self.errors: list[str] = []
+        self._queue: "queue.SimpleQueue[Optional[str]]" = queue.SimpleQueue()
+        self._outstanding = 0
+        self._lock = threading.Lock()
+
+    def run(self) -> None:
+        self._push([""])
+        workers = [threading.Thread(target=self._work, daemon=True) for _ in range(self.jobs)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+    def _push(self, paths: list[str]) -> None:
+        with self._lock:
+            self._outstanding += len(paths)
+        for path in paths:
+            self._queue.put(path)
+
+    def _work(self) -> None:
+        while True:
+            top = self._queue.get()
+            if top is None:
+                return
+            # Walk the subtree depth-first; hand subdirectories to the queue only while it runs low
+            stack = [top]
+            while stack:
+                rel = stack.pop()
+                try:
+                    children = [f"{rel}/{c}" if rel else c for c in self._visit(rel)]
+                except OSError as e:
+                    children = []
+                    if rel == "" or not isinstance(e, FileNotFoundError):   # deleted mid-walk is fine
+                        with self._lock:
+                            self.errors.append(f"{os.path.join(self.root, rel)}: {e.strerror or e}")
+                if self.jobs > 1 and len(children) > 1 and self._queue.qsize() < self.jobs:
+                    self._push(children[1:])
+                    stack.append(children[0])
+                else:
+                    stack.extend(children)
+            with self._lock:
+                self._outstanding -= 1
+                finished = self._outstanding == 0
+            if finished:
+                for _ in range(self.jobs):
+                    self._queue.put(None)
+
+    def _visit(self, rel: str) -> list[str]:
+        path = os.path.join(self.root, rel) if rel else self.root
+        mtime = os.stat(path).st_mtime_ns
+        cached = self.old.get(rel)
+        if cached and cached[0] == mtime:
+            children, tool_dirs = cached[1], cached[2]
+        else:
+            children, tool_dirs = [], []
+            with os.scandir(path) as it:
+                for entry in it:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    if entry.name in TOOL_DIRS:
+                        tool_dirs.append(entry.name)
+                    elif entry.name not in SKIP_DIRS:
+                        children.append(entry.name)
+            with self._lock:
+                self.listed += 1
+        files = self._files(path, tool_dirs, cached[3] if cached else {}) if tool_dirs else {}
+        entry = [mtime if mtime < self.cutoff else 0, children, tool_dirs, files]
+        if entry != cached:
+            self.changed = True
+        self.new[rel] = entry
+        return children
+
+    @staticmethod
+    def _files(project: str, tool_dirs: list[str], cached: dict[str, list]) -> dict[str, list]:
+        """The project's continuity files and flag; unchanged ones are not read again."""
+        files = {}
+        for name in (CONTINUITY_FILE, LEGACY_FLAG) + LEGACY_FILES:
+            if name.split("/")[0] not in tool_dirs:
+                continue
+            try:
+                st = os.stat(os.path.join(project, name))
+            except OSError:
+                continue
+            old = cached.get(name)
+            if old and old[0] == st.st_mtime_ns and old[1] == st.st_size:
+                files[name] = old
+                continue
+            try:
+                text = Path(project, name).read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                continue
+            if name == LEGACY_FLAG:
+                tool, stamp = "", text.strip().split("\n")[0].strip()
+            else:
+                tool, stamp = read_source(text)
+            files[name] = [st.st_mtime_ns, st.st_size, tool, stamp]
+        return files
+
+
+def _results(root: str, entries: dict[str, list]) -> list[ContinuityFile]:
+    found = []
+    for rel, (_, _, _, files) in entries.items():
+        if not files:
+            continue
+        project = os.path.join(root, rel) if rel else root
+        flag = files.get(LEGACY_FLAG)
+        unified = CONTINUITY_FILE in files
+        for name in (CONTINUITY_FILE,) + LEGACY_FILES:
+            if name not in files:
+                continue
+            _, _, tool, stamp = files[name]
+            legacy = "" if name == CONTINUITY_FILE else "superseded" if unified else "unmigrated"
+            found.append(ContinuityFile(project, name, tool, stamp, legacy, flag[3] if flag else ""))
+    return found
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# SCAN
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def load_index(path: Path) -> dict[str, dict[str, list]]:
+    """Root -> directory entries; empty if the index is missing or from another version."""
+    try:
+        data = json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+        return {}
+    return data.get("roots", {})
+
+
+def save_index(path: Path, roots: dict[str, dict[str, list]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write_bytes(path, json.dumps({"version": INDEX_VERSION, "roots": roots}, separators=(",", ":")).encode())
+
+
+def scan(roots: list[Path], index: Optional[Path] = INDEX_FILE, jobs: Optional[int] = None) -> ScanResult:
+    """Find continuity files under each root; reuses and updates `index` unless it is None."""
+    started = time.time()
+    clock = time.perf_counter()
+    jobs = jobs or min(32, (os.cpu_count() or 1) + 4)
+    saved = load_index(index) if index else {}
+    changed = False
+    result = ScanResult()
+    seen: set[tuple[str, str]] = set()
+    for root in dict.fromkeys(os.path.abspath(r) for r in roots):
+        walk = _Walk(root, saved.get(root, {}), jobs, started)
+        walk.run()
+        # A directory gone since the last scan changes its parent's entry, so walk.changed covers it
+        changed = changed or walk.changed
+        saved[root] = walk.new
+        result.directories += len(walk.new)
+        result.listed += walk.listed
+        result.errors.extend(walk.errors)
+        for found in _results(root, walk.new):
+            # Nested roots report a project once
+            if (found.project, found.path) not in seen:
+                seen.add((found.project, found.path))
+                result.files.append(found)
+    result.files.sort(key=lambda f: (f.project, f.path != CONTINUITY_FILE, f.path))
+    if index and changed:
+        try:
+            save_index(index, saved)
+        except OSError as e:
+            result.errors.append(f"{index}: {e.strerror or e}")
+    result.seconds = time.perf_counter() - clock
+    return result
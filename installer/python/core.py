@@ -0,0 +1,422 @@
+"""
+Nexus-AI Installer - Core install logic
+
+Everything needed to install features without a terminal UI. This module must
+never import textual or rich: the headless `nexus-ai install` path relies on it.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from functools import lru_cache
+
+from installer.python import events, timing
+from installer.python.catalog import TOOL_LAYOUTS, Asset, Catalog
+from installer.python.fileops import atomic_copy, atomic_write_bytes, file_lock, lock_path
+from installer.python.journal import Journal
+from installer.python.managed import (  # noqa: F401
+    END_MARKER,
+    START_MARKER,
+    Section,
+    read_sections,
+    remove_managed_sections,
+    write_managed_config,
+)
+from installer.python.manifest import Manifest
+from installer.python.store import LinkError, ObjectStore
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, Optional
+
+
+@lru_cache(maxsize=None)
+def get_features_path() -> Path:
+    """Get the path to features directory, works both in dev and installed.
+
+    Memoized: the answer can't change during a run and the package-resource
+    probe is comparatively slow.
+    """
+    # Method 1: Relative path from this file (development mode, and pip/brew
+    # installs, where package data sits next to this module)
+    dev_features = Path(__file__).parent / "features"
+    if dev_features.is_dir():
+        return dev_features
+
+    # Method 2: Try package resources (zipped or otherwise relocated installs)
+    try:
+        from importlib.resources import files
+        pkg_features = files("installer.python").joinpath("features")
+        # Check if it's a real directory (not just a namespace)
+        if hasattr(pkg_features, '_path'):
+            pkg_path = Path(str(pkg_features._path))
+            if pkg_path.exists() and pkg_path.is_dir():
+                return pkg_path
+        # For newer Python, try direct path conversion
+        pkg_path = Path(str(pkg_features))
+        if pkg_path.exists() and pkg_path.is_dir():
+            return pkg_path
+    except (TypeError, FileNotFoundError, AttributeError, ModuleNotFoundError):
+        pass
+
+    # Method 3: Legacy - look for features at repo root (backwards compat for install.sh)
+    repo_root = Path(__file__).parent.parent.parent
+    legacy_features = repo_root / "features"
+    if legacy_features.exists() and legacy_features.is_dir():
+        return legacy_features
+
+    raise FileNotFoundError(
+        "Could not locate features directory. "
+        "Expected at installer/python/features/ or repo root features/"
+    )
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# DATA
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class Tool:
+    __slots__ = ("id", "name", "description", "selected")
+
+    def __init__(self, id: str, name: str, description: str, selected: bool = True) -> None:
+        self.id = id
+        self.name = name
+        self.description = description
+        self.selected = selected
+
+
+class Feature:
+    __slots__ = ("id", "name", "description", "selected")
+
+    def __init__(self, id: str, name: str, description: str, selected: bool = True) -> None:
+        self.id = id
+        self.name = name
+        self.description = description
+        self.selected = selected
+
+
+TOOLS = [
+    Tool("claude", "Claude Code", "Anthropic's AI coding assistant", True),
+    Tool("gemini", "Gemini CLI", "Google's AI command-line interface", True),
+    Tool("codex", "Codex CLI", "OpenAI's coding assistant", False),
+]
+
+
+def load_features(catalog: Catalog) -> list[Feature]:
+    """Selectable features, in catalog order, with their default selection."""
+    return [Feature(e.id, e.name, e.description, e.selected) for e in catalog.features.values()]
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# INSTALL
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+# Gemini's extension on/off switches, relative to the home directory
+ENABLEMENT_FILE = ".gemini/extensions/extension-enablement.json"
+
+
+class InstallContext:
+    """Where and how to install: target home, feature sources and copy options.
+
+    `sources` maps catalog source paths to their bytes when they were read up
+    front (fleet installs); files not in it are copied from the features directory.
+    With a `store`, files are linked to its objects where it has them.
+    With a `journal`, every file and directory change is recorded before it is made.
+    """
+    __slots__ = ("home", "catalog", "manifest", "copy_mode", "sources", "journal", "store")
+
+    def __init__(self, home: Path, catalog: Optional[Catalog] = None, manifest: Optional[Manifest] = None,
+                 copy_mode: str = "copy", sources: Optional[dict[str, bytes]] = None,
+                 journal: Optional[Journal] = None, store: Optional[ObjectStore] = None) -> None:
+        self.home = home
+        self.catalog = catalog
+        self.manifest = manifest
+        self.copy_mode = copy_mode
+        self.sources = sources
+        self.journal = journal
+        self.store = store
+
+    @property
+    def features(self) -> Path:
+        return self.catalog.root
+
+    def makedirs(self, path: Path) -> None:
+        if self.journal:
+            self.journal.makedirs(path)
+        else:
+            path.mkdir(parents=True, exist_ok=True)
+
+    def before_write(self, path: Path) -> None:
+        if self.journal:
+            self.journal.save(path)
+
+
+def install_configs(ctx: InstallContext, tool_ids: list[str], feature_ids: list[str]) -> list[str]:
+    """Write each tool's managed config once, adding or updating the selected features' sections.
+
+    Other features' sections are kept; only uninstall removes a section.
+    Returns the configs that were written, relative to home.
+    """
+    written_paths = []
+    for tool_id in tool_ids:
+        layout = TOOL_LAYOUTS[tool_id]
+        tool_dir = ctx.home / layout["dir"]
+        ctx.makedirs(tool_dir)
+        sections = []
+        for feature_id in feature_ids:
+            assets = ctx.catalog.assets(feature_id, tool_id)
+            if assets and assets.config:
+                config = assets.config
+                data = ctx.sources.get(config.src) if ctx.sources else None
+                sections.append(Section(feature_id, ctx.features / config.src, config.sha256, data))
+        with timing.span("managed config", "tool", tool=tool_id, sections=len(sections)):
+            written = write_managed_config(tool_dir / layout["config"], sections, ctx.before_write,
+                                           only=feature_ids)
+            if written:
+                timing.count(written=1, bytes=_size(tool_dir / layout["config"]))
+            else:
+                timing.count(skipped=1)
+        events.emit("file", action="write" if written else "skip", kind="block",
+                    path=f"{layout['dir']}/{layout['config']}", tool=tool_id)
+        if written:
+            written_paths.append(f"{layout['dir']}/{layout['config']}")
+    return written_paths
+
+
+def install_step(ctx: InstallContext, tool_id: str, feature_id: str) -> None:
+    """Install one feature's command files for one tool."""
+    assets = ctx.catalog.assets(feature_id, tool_id)
+    if assets is None:
+        return
+    ctx.makedirs(ctx.home / TOOL_LAYOUTS[tool_id]["dir"])
+    sync_files(ctx, assets.files, tool_id, feature_id)
+
+
+def enable_extensions(ctx: InstallContext, tool_id: str, feature_ids: list[str]) -> None:
+    """Enable every installed feature's extension in a single enablement update."""
+    names = extension_names(ctx, tool_id, feature_ids)
+    if names:
+        with timing.span("enablement", "tool", tool=tool_id, extensions=len(names)):
+            enablement = ctx.home / ENABLEMENT_FILE
+            ctx.makedirs(enablement.parent)
+            lock = lock_path(enablement)
+            new_lock = ctx.journal is not None and not lock.exists()
+
+            def on_write(path: Path) -> None:
+                ctx.before_write(path)
+                if new_lock:
+                    ctx.journal.created(lock)   # so a rollback leaves no trace
+
+            written = update_enablement(enablement, names, on_write=on_write)
+            if written:
+                timing.count(written=1, bytes=_size(enablement))
+            else:
+                timing.count(skipped=1)
+        events.emit("file", action="write" if written else "skip", kind="enablement", path=ENABLEMENT_FILE,
+                    tool=tool_id)
+
+
+def _size(path: Path) -> int:
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0   # a block removed with the last section deletes the file
+
+
+def extension_names(ctx: InstallContext, tool_id: str, feature_ids: list[str]) -> list[str]:
+    """The extensions these features install for the tool (features the catalog lacks have none)."""
+    names = []
+    for feature_id in feature_ids:
+        assets = ctx.catalog.assets(feature_id, tool_id) if ctx.catalog else None
+        if assets and assets.extension:
+            names.append(assets.extension)
+    return names
+
+
+def sync_files(ctx: InstallContext, assets: list[Asset], tool_id: str, feature_id: str) -> None:
+    """Copy catalog assets into the home, skipping unchanged files and removing stale ones.
+
+    Without a manifest every file is rewritten.
+    """
+    manifest = ctx.manifest
+    wanted = set()
+    written = skipped = 0
+
+    for asset in assets:
+        dst = ctx.home / asset.dst
+        if manifest is not None:
+            wanted.add(asset.dst)
+            if manifest.is_current(dst, asset.sha256):
+                skipped += 1
+                timing.count(skipped=1)
+                events.emit("file", action="skip", path=asset.dst, tool=tool_id, feature=feature_id)
+                continue
+
+        write_asset(ctx, asset, tool_id, feature_id)
+        written += 1
+
+    if manifest is None:
+        return
+
+    # Files this feature installed before but no longer ships
+    removed = 0
+    for key in manifest.owned(tool_id, feature_id):
+        if key in wanted:
+            continue
+        entry = manifest.forget(key)
+        stale = manifest.home / key
+        try:
+            st = stale.lstat()
+        except FileNotFoundError:
+            continue
+        # Leave files the user edited since we wrote them
+        if st.st_size == entry["size"] and st.st_mtime_ns == entry["mtime_ns"]:
+            ctx.before_write(stale)
+            stale.unlink()
+            removed += 1
+            timing.count(removed=1)
+            events.emit("file", action="remove", path=key, tool=tool_id, feature=feature_id)
+
+    manifest.count(written, skipped, removed)
+
+
+def write_asset(ctx: InstallContext, asset: Asset, tool_id: str, feature_id: str) -> None:
+    """Place one catalog asset in the home (linked from the store, or copied) and record it."""
+    dst = ctx.home / asset.dst
+    ctx.makedirs(dst.parent)
+    ctx.before_write(dst)
+    linked, reason = False, ""
+    if ctx.store is not None:
+        try:
+            linked = ctx.store.link(asset.sha256, dst, ctx.copy_mode)
+            if not linked:
+                reason = "not in the store (run `nexus-ai store populate`)"
+        except LinkError as e:
+            reason = str(e)
+        if reason and ctx.manifest is not None:
+            ctx.manifest.count_unlinked(reason)
+    if not linked:
+        data = ctx.sources.get(asset.src) if ctx.sources else None
+        atomic_copy(ctx.features / asset.src, dst, ctx.copy_mode, data)
+    timing.count(written=1, bytes=asset.size)
+    events.emit("file", action="write", path=asset.dst, bytes=asset.size, tool=tool_id, feature=feature_id,
+                **({"linked": linked, "reason": reason} if ctx.store is not None else {}))
+    if ctx.manifest is not None:
+        ctx.manifest.record(dst, asset.sha256, tool_id, feature_id)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# UNINSTALL
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def uninstall_features(ctx: InstallContext, tool_id: str, feature_ids: list[str]) -> list[str]:
+    """Remove features from one tool using the manifest (no directory scans).
+
+    Deletes the files they installed, their managed-block sections and their
+    Gemini enablement entries. Files edited since installation are kept and
+    returned (relative to home); the manifest forgets them either way.
+    """
+    layout = TOOL_LAYOUTS[tool_id]
+    tool_dir = ctx.home / layout["dir"]
+    manifest = ctx.manifest
+    kept = []
+    removed = 0
+
+    for feature_id in feature_ids:
+        for key in manifest.owned(tool_id, feature_id):
+            entry = manifest.forget(key)
+            path = ctx.home / key
+            try:
+                st = path.lstat()
+            except FileNotFoundError:
+                continue
+            if st.st_size != entry["size"] or st.st_mtime_ns != entry["mtime_ns"]:
+                kept.append(key)
+                events.emit("file", action="keep", path=key, tool=tool_id, feature=feature_id)
+                continue
+            ctx.before_write(path)
+            path.unlink()
+            removed += 1
+            timing.count(removed=1)
+            events.emit("file", action="remove", path=key, tool=tool_id, feature=feature_id)
+            _prune_dirs(path.parent, tool_dir)
+
+    if remove_managed_sections(tool_dir / layout["config"], feature_ids, ctx.before_write):
+        events.emit("file", action="write", kind="block", path=f"{layout['dir']}/{layout['config']}", tool=tool_id)
+    names = extension_names(ctx, tool_id, feature_ids) if layout["extension"] else []
+    if names and update_enablement(ctx.home / ENABLEMENT_FILE, names, remove=True, on_write=ctx.before_write):
+        events.emit("file", action="write", kind="enablement", path=ENABLEMENT_FILE, tool=tool_id)
+
+    manifest.count(removed=removed)
+    return kept
+
+
+def _prune_dirs(directory: Path, stop: Path) -> None:
+    """Remove directories left empty, up to (not including) stop."""
+    while directory != stop and stop in directory.parents:
+        try:
+            directory.rmdir()
+        except OSError:
+            return
+        directory = directory.parent
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# HELPERS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def installed_features(home: Path, manifest: Manifest) -> dict[str, list[str]]:
+    """tool -> features installed for it, per the manifest and the managed blocks.
+
+    Features appear in managed-block order, then in manifest order.
+    """
+    pairs: dict[str, list[str]] = {}
+    for tool_id, layout in TOOL_LAYOUTS.items():
+        pairs[tool_id] = list(read_sections(home / layout["dir"] / layout["config"]))
+    for entry in manifest.files.values():
+        features = pairs.setdefault(entry["tool"], [])
+        if entry["feature"] not in features:
+            features.append(entry["feature"])
+    return {tool_id: features for tool_id, features in pairs.items() if features}
+
+
+def update_enablement(path: Path, extension_names: list[str], remove: bool = False,
+                      on_write: Optional[Callable[[Path], None]] = None) -> bool:
+    """Enable (or with `remove`, drop) Gemini extensions in one locked, atomic read-modify-write.
+
+    `on_write(path)` is called just before the file is replaced. Returns True if it was written.
+    """
+    if remove and not path.exists():
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with file_lock(path):
+        try:
+            raw = path.read_text()
+        except FileNotFoundError:
+            raw = ""
+
+        data = {}
+        if raw.strip():
+            try:
+                data = json.loads(raw)
+            except json.JSONDecodeError as e:
+                # Never silently drop the user's other enablement settings
+                raise ValueError(f"{path} is not valid JSON ({e}); fix or remove it and re-run") from e
+            if not isinstance(data, dict):
+                raise ValueError(f"{path} must contain a JSON object")
+
+        if remove:
+            if not any(name in data for name in extension_names):
+                return False
+            for name in extension_names:
+                data.pop(name, None)
+        else:
+            if all(data.get(name) is True for name in extension_names):
+                return False
+            for name in extension_names:
+                data[name] = True
+        if on_write:
+            on_write(path)
+        atomic_write_bytes(path, json.dumps(data, indent=2).encode())
+    return True
@@ -0,0 +1,320 @@
+"""
+Nexus-AI Installer - Integrity check
+
+`nexus-ai doctor` compares a home directory with the feature catalog: every
+installed command file and extension manifest is hashed, every managed-block
+section is compared with its rendered source, and the Gemini enablement file
+is checked against the extensions that are installed. What counts as
+installed comes from the manifest and the managed blocks, so no tool
+directory is scanned. Hashing runs on a thread pool (hashlib releases the GIL).
+
+Problems found:
+
+    missing     an installed feature's file, section or enablement entry is gone
+    modified    edited since it was installed
+    outdated    unchanged since installation, but the feature now ships another version
+    stale       left behind: the feature no longer ships it, or the extension is gone
+    damaged     the enablement file is not a JSON object (reported, never rewritten)
+
+`--fix` repairs only the drifted items, as one journaled transaction that
+`nexus-ai rollback` can undo.
+"""
+
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from installer.python import events, timing
+from installer.python.catalog import TOOL_LAYOUTS, Asset, Catalog
+from installer.python.core import (
+    ENABLEMENT_FILE,
+    InstallContext,
+    installed_features,
+    update_enablement,
+    write_asset,
+)
+from installer.python.journal import Journal
+from installer.python.managed import Section, read_sections, render_section, write_managed_config
+from installer.python.manifest import Manifest, sha256_file
+from installer.python.store import ObjectStore
+
+# Problems, in the order they are listed
+PROBLEMS = ("missing", "modified", "outdated", "stale", "damaged")
+
+
+@dataclass
+class Drift:
+    kind: str       # "file", "block" (managed-block section) or "enablement"
+    problem: str    # one of PROBLEMS
+    path: str       # relative to the home directory
+    tool: str
+    feature: str = ""
+
+
+@dataclass
+class Report:
+    home: Path
+    files: int = 0      # files hashed
+    sections: int = 0   # managed-block sections compared
+    drift: list[Drift] = field(default_factory=list)
+    seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not self.drift
+
+
+@dataclass
+class FixResult:
+    repaired: int = 0
+    kept: list[str] = field(default_factory=list)   # stale files edited since install, left in place
+    errors: list[str] = field(default_factory=list)
+    rolled_back: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# CHECK
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def check(home: Path, catalog: Catalog, jobs: Optional[int] = None) -> Report:
+    """Compare everything installed in `home` with the catalog; changes nothing."""
+    started = time.perf_counter()
+    report = Report(home)
+    with timing.span("load manifest"):
+        manifest = Manifest.load(home)
+        pairs = installed_features(home, manifest)
+
+    files: list[tuple[str, str, Asset]] = []    # (tool, feature, asset) to hash
+    stale: list[tuple[str, str, str]] = []      # (tool, feature, manifest key) no longer shipped
+    for tool_id, feature_ids in pairs.items():
+        for feature_id in feature_ids:
+            assets = catalog.assets(feature_id, tool_id)
+            shipped = set()
+            for asset in assets.files if assets else []:
+                files.append((tool_id, feature_id, asset))
+                shipped.add(asset.dst)
+            stale.extend((tool_id, feature_id, key) for key in manifest.owned(tool_id, feature_id)
+                         if key not in shipped)
+
+    with timing.span("hash", files=len(files) + len(stale), tools=len(pairs)):
+        with ThreadPoolExecutor(max_workers=jobs or min(32, (os.cpu_count() or 1) + 4)) as pool:
+            hashes = list(pool.map(_hash, [home / asset.dst for _, _, asset in files]
+                                   + [home / key for _, _, key in stale]))
+            blocks = [pool.submit(_check_block, home, catalog, tool_id, feature_ids)
+                      for tool_id, feature_ids in pairs.items()]
+
+            for (tool_id, feature_id, asset), actual in zip(files, hashes[:len(files)]):
+                report.files += 1
+                if actual == asset.sha256:
+                    continue
+                if actual is None:
+                    problem = "missing"
+                elif actual == manifest.files.get(asset.dst, {}).get("sha256"):
+                    problem = "outdated"
+                else:
+                    problem = "modified"
+                report.drift.append(Drift("file", problem, asset.dst, tool_id, feature_id))
+            for (tool_id, feature_id, key), actual in zip(stale, hashes[len(files):]):
+                # A stale file that is already gone needs no repair
+                if actual is not None:
+                    report.files += 1
+                    report.drift.append(Drift("file", "stale", key, tool_id, feature_id))
+            for future in blocks:
+                sections, drift = future.result()
+                report.sections += sections
+                report.drift.extend(drift)
+
+    if "gemini" in pairs or (home / ENABLEMENT_FILE).exists():
+        report.drift.extend(_check_enablement(home, catalog, pairs.get("gemini", [])))
+
+    report.seconds = time.perf_counter() - started
+    for drift in report.drift:
+        events.emit("drift", kind=drift.kind, problem=drift.problem, path=drift.path, tool=drift.tool,
+                    feature=drift.feature)
+    return report
+
+
+def _hash(path: Path) -> Optional[str]:
+    try:
+        return sha256_file(path)
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return None
+
+
+def _check_block(home: Path, catalog: Catalog, tool_id: str, feature_ids: list[str]) -> tuple[int, list[Drift]]:
+    layout = TOOL_LAYOUTS[tool_id]
+    rel = f"{layout['dir']}/{layout['config']}"
+    current = read_sections(home / rel)
+    drift = []
+    compared = 0
+    for feature_id in feature_ids:
+        assets = catalog.assets(feature_id, tool_id)
+        config = assets.config if assets else None
+        old = current.get(feature_id)
+        if config is None:
+            if old is not None:
+                drift.append(Drift("block", "stale", rel, tool_id, feature_id))
+            continue
+        expected = render_section(Section(feature_id, catalog.root / config.src, config.sha256))
+        if not expected:
+            continue    # an empty source renders no section
+        compared += 1
+        if old is None:
+            problem = "missing"
+        elif old[0] != config.sha256:
+            # Carried over verbatim by the last install, so only the source moved on
+            problem = "outdated"
+        elif old[1] != expected:
+            problem = "modified"
+        else:
+            continue
+        drift.append(Drift("block", problem, rel, tool_id, feature_id))
+    return compared, drift
+
+
+def _check_enablement(home: Path, catalog: Catalog, feature_ids: list[str]) -> list[Drift]:
+    """Every installed extension enabled; no enabled catalog extension without its directory."""
+    try:
+        data = json.loads((home / ENABLEMENT_FILE).read_text() or "{}")
+    except FileNotFoundError:
+        data = {}
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        data = None
+    if not isinstance(data, dict):
+        return [Drift("enablement", "damaged", ENABLEMENT_FILE, "gemini")]
+
+    drift = []
+    for feature_id in feature_ids:
+        assets = catalog.assets(feature_id, "gemini")
+        if assets and assets.extension and data.get(assets.extension) is not True:
+            drift.append(Drift("enablement", "missing", ENABLEMENT_FILE, "gemini", feature_id))
+    # Installed features with missing files are reported (and restored) as files instead
+    extensions_dir = (home / ENABLEMENT_FILE).parent
+    for feature_id, entry in catalog.features.items():
+        assets = entry.tools.get("gemini")
+        name = assets.extension if assets else None
+        if name and name in data and feature_id not in feature_ids and not (extensions_dir / name).is_dir():
+            drift.append(Drift("enablement", "stale", ENABLEMENT_FILE, "gemini", feature_id))
+    return drift
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# FIX
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def fix(report: Report, catalog: Catalog, store: Optional[ObjectStore] = None) -> FixResult:
+    """Repair what `check` found, as one transaction (rolled back on any error)."""
+    home = report.home
+    result = FixResult()
+    journal = Journal.begin(home, "doctor", drift=len(report.drift))
+    manifest = Manifest.load(home)
+    ctx = InstallContext(home, catalog, manifest, journal=journal, store=store)
+    try:
+        with timing.span("fix", drift=len(report.drift)):
+            for drift in report.drift:
+                if drift.kind == "file":
+                    try:
+                        _fix_file(ctx, drift, result)
+                    except Exception as e:
+                        result.errors.append(f"{drift.path}: {e}")
+            blocks: dict[str, set[str]] = {}
+            for drift in report.drift:
+                if drift.kind == "block":
+                    blocks.setdefault(drift.tool, set()).add(drift.feature)
+            for tool_id, refresh in blocks.items():
+                try:
+                    _fix_block(ctx, tool_id, refresh)
+                    result.repaired += len(refresh)
+                except Exception as e:
+                    result.errors.append(f"{tool_id} managed block: {e}")
+            try:
+                result.repaired += _fix_enablement(ctx, [d for d in report.drift if d.kind == "enablement"])
+            except Exception as e:
+                result.errors.append(f"{ENABLEMENT_FILE}: {e}")
+        if result.errors:
+            journal.rollback()
+            result.rolled_back = True
+        else:
+            if journal.changed:
+                journal.save(manifest.path)
+            manifest.save()
+            journal.commit()
+    except BaseException:
+        journal.rollback()
+        raise
+    return result
+
+
+def _fix_file(ctx: InstallContext, drift: Drift, result: FixResult) -> None:
+    if drift.problem != "stale":
+        assets = ctx.catalog.assets(drift.feature, drift.tool)
+        asset = next(a for a in assets.files if a.dst == drift.path)
+        write_asset(ctx, asset, drift.tool, drift.feature)
+        result.repaired += 1
+        return
+    # Like a re-install: delete what the feature left behind unless the user edited it
+    path = ctx.home / drift.path
+    entry = ctx.manifest.forget(drift.path)
+    if entry is not None and _hash(path) == entry["sha256"]:
+        ctx.before_write(path)
+        path.unlink()
+        result.repaired += 1
+        events.emit("file", action="remove", path=drift.path, tool=drift.tool, feature=drift.feature)
+    else:
+        result.kept.append(drift.path)
+
+
+def _fix_block(ctx: InstallContext, tool_id: str, refresh: set[str]) -> None:
+    """Rebuild the tool's managed block from the installed features, re-rendering `refresh`."""
+    layout = TOOL_LAYOUTS[tool_id]
+    sections = []
+    for feature_id in installed_features(ctx.home, ctx.manifest).get(tool_id, []):
+        assets = ctx.catalog.assets(feature_id, tool_id)
+        if assets and assets.config:
+            sections.append(Section(feature_id, ctx.features / assets.config.src, assets.config.sha256))
+    path = ctx.home / layout["dir"] / layout["config"]
+    if write_managed_config(path, sections, ctx.before_write, refresh):
+        events.emit("file", action="write", kind="block", path=f"{layout['dir']}/{layout['config']}", tool=tool_id)
+
+
+def _fix_enablement(ctx: InstallContext, drift: list[Drift]) -> int:
+    path = ctx.home / ENABLEMENT_FILE
+    enable = [d.feature for d in drift if d.problem == "missing"]
+    disable = [d.feature for d in drift if d.problem == "stale"]
+    if any(d.problem == "damaged" for d in drift):
+        raise ValueError("not a JSON object; fix or remove it and re-run")
+    names = {fid: ctx.catalog.assets(fid, "gemini").extension for fid in enable + disable}
+    if enable:
+        ctx.makedirs(path.parent)
+        update_enablement(path, [names[fid] for fid in enable], on_write=ctx.before_write)
+    if disable:
+        update_enablement(path, [names[fid] for fid in disable], remove=True, on_write=ctx.before_write)
+    return len(enable) + len(disable)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# REPORT
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def format_report(report: Report) -> list[str]:
+    """One line per drifted item, then a summary line."""
+    from installer.python.core import TOOLS
+
+    tool_names = {t.id: t.name for t in TOOLS}
+    lines = []
+    for drift in sorted(report.drift, key=lambda d: (d.tool, PROBLEMS.index(d.problem), d.path, d.feature)):
+        what = {"block": "managed block", "enablement": "extension enablement"}.get(drift.kind)
+        detail = [tool_names.get(drift.tool, drift.tool)] + ([what, drift.feature] if what else [])
+        lines.append(f"{drift.problem:<9} {drift.path}  ({', '.join(d for d in detail if d)})")
+    lines.append(f"Checked {report.files} file(s) and {report.sections} managed section(s) in "
+                 f"{report.seconds * 1000:.0f} ms: "
+                 + (f"{len(report.drift)} drifted" if report.drift else "no drift"))
+    return lines
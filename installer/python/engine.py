@@ -0,0 +1,284 @@
+"""
+Nexus-AI Installer - Install engine
+
+Runs the (feature × tool) install steps. Each tool writes to its own config
+directory (~/.claude, ~/.gemini, ~/.codex), so tools are installed in
+parallel on their own threads while the steps for a single tool stay ordered.
+Progress is reported through a callback as steps actually start and finish.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+from installer.python import events, timing
+from installer.python.catalog import Catalog
+from installer.python.core import (
+    TOOLS,
+    InstallContext,
+    enable_extensions,
+    install_configs,
+    install_step,
+    uninstall_features,
+)
+from installer.python.journal import Journal
+from installer.python.manifest import Manifest, SyncStats
+from installer.python.store import ObjectStore
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, Optional
+
+
+class InstallStep:
+    __slots__ = ("label", "tool_id", "feature_id")
+
+    def __init__(self, label: str, tool_id: str, feature_id: str) -> None:
+        self.label = label
+        self.tool_id = tool_id
+        self.feature_id = feature_id
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, InstallStep) and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    def _key(self) -> tuple[str, str, str]:
+        return self.label, self.tool_id, self.feature_id
+
+
+class InstallResult:
+    __slots__ = ("steps", "errors", "files", "rolled_back")
+
+    def __init__(self, steps: list[InstallStep]) -> None:
+        self.steps = steps
+        self.errors: list[tuple[InstallStep, BaseException]] = []
+        self.files = SyncStats()
+        self.rolled_back = False    # a step failed and every change was undone
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+class UninstallResult:
+    __slots__ = ("removed", "kept", "errors", "rolled_back")
+
+    def __init__(self) -> None:
+        self.removed = 0
+        self.kept: list[str] = []       # edited since install, left in place
+        self.errors: list[tuple[str, BaseException]] = []
+        self.rolled_back = False
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+# on_step(step, status) where status is "active", "done" or "failed".
+# Called from worker threads; UI consumers must marshal back to their own loop.
+if TYPE_CHECKING:
+    StepCallback = Callable[[InstallStep, str], None]
+
+
+class InstallEngine:
+    """Install selected features for selected tools, one worker per tool."""
+
+    def __init__(self, home: Path, catalog: Catalog, tool_ids: list[str], feature_ids: list[str],
+                 copy_mode: str = "copy", sources: Optional[dict[str, bytes]] = None,
+                 store: Optional[ObjectStore] = None) -> None:
+        self.home = home
+        self.catalog = catalog
+        self.copy_mode = copy_mode
+        self.sources = sources
+        self.store = store
+        self.tool_ids = tool_ids
+        self.feature_ids = feature_ids
+        tool_names = {t.id: t.name for t in TOOLS}
+        # Only pairs the catalog says the feature actually ships files for
+        self.steps = [
+            InstallStep(f"Installing {feature_id} for {tool_names[tool_id]}", tool_id, feature_id)
+            for feature_id in feature_ids
+            for tool_id in tool_ids
+            if catalog.supports(feature_id, tool_id)
+        ]
+
+    def run(self, on_step: Optional[StepCallback] = None) -> InstallResult:
+        """Install everything; blocks until the slowest tool finishes."""
+        result = InstallResult(self.steps)
+        if not self.tool_ids:
+            return result
+        if events.enabled():
+            on_step = _emitting(on_step)
+            events.emit("start", command="install", home=str(self.home), tools=self.tool_ids,
+                        features=self.feature_ids, steps=len(self.steps))
+        started = time.monotonic()
+
+        with timing.span("begin journal"):
+            journal = Journal.begin(self.home, "install", tools=self.tool_ids, features=self.feature_ids)
+        with timing.span("load manifest"):
+            manifest = Manifest.load(self.home)
+        ctx = InstallContext(self.home, self.catalog, manifest, self.copy_mode, self.sources, journal, self.store)
+        try:
+            with timing.span("install", tools=len(self.tool_ids), features=len(self.feature_ids)):
+                self._run_tools(ctx, on_step, result)
+            if result.errors:
+                # All or nothing: a half-installed feature set is worse than the old one
+                with timing.span("rollback"):
+                    journal.rollback()
+                result.rolled_back = True
+            else:
+                with timing.span("save manifest"):
+                    if journal.changed:
+                        journal.save(ctx.manifest.path)
+                    ctx.manifest.save()
+                with timing.span("commit journal"):
+                    journal.commit()
+        except BaseException as e:
+            journal.rollback()
+            events.emit("error", message=str(e), fatal=True)
+            raise
+        result.files = ctx.manifest.stats
+        events.emit("summary", ok=result.ok, rolled_back=result.rolled_back, written=result.files.written,
+                    skipped=result.files.skipped, removed=result.files.removed,
+                    unlinked=result.files.unlinked, errors=len(result.errors),
+                    seconds=round(time.monotonic() - started, 6))
+        return result
+
+    def _run_tools(self, ctx: InstallContext, on_step: Optional[StepCallback], result: InstallResult) -> None:
+        # Plain threads rather than concurrent.futures: its logging import alone
+        # costs more startup time than a headless install spends copying files
+        outcomes: dict = {}
+        parent = timing.current()
+
+        def worker(tool_id: str) -> None:
+            try:
+                with timing.span(f"tool {tool_id}", "tool", parent=parent):
+                    outcomes[tool_id] = self._run_tool(ctx, tool_id, on_step)
+                for step, error in outcomes[tool_id]:
+                    events.emit("error", tool=step.tool_id, feature=step.feature_id, label=step.label,
+                                message=str(error))
+            except BaseException as e:
+                outcomes[tool_id] = e
+
+        if ctx.store is not None and ctx.store.link_as_root:
+            # Linking switches the euid of every thread in the process, so install one tool at a time
+            for tool_id in self.tool_ids:
+                worker(tool_id)
+            threads = []
+        else:
+            threads = [threading.Thread(target=worker, args=(tool_id,), name=f"nexus-install-{tool_id}")
+                       for tool_id in self.tool_ids]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for tool_id in self.tool_ids:
+            if isinstance(outcomes[tool_id], BaseException):
+                raise outcomes[tool_id]
+            result.errors.extend(outcomes[tool_id])
+
+    def _run_tool(self, ctx: InstallContext, tool_id: str,
+                  on_step: Optional[StepCallback]) -> list[tuple[InstallStep, BaseException]]:
+        errors = []
+        tool_steps = [s for s in self.steps if s.tool_id == tool_id]
+
+        try:
+            install_configs(ctx, [tool_id], self.feature_ids)
+        except Exception as e:
+            # Without its config directory nothing else for this tool can succeed
+            for step in tool_steps:
+                errors.append((step, e))
+                if on_step:
+                    on_step(step, "failed")
+            return errors
+
+        installed = []
+        pending = []    # done once their extension is enabled
+        for step in tool_steps:
+            if on_step:
+                on_step(step, "active")
+            try:
+                with timing.span(f"{step.feature_id} for {tool_id}", "step", tool=tool_id, feature=step.feature_id):
+                    install_step(ctx, step.tool_id, step.feature_id)
+            except Exception as e:
+                errors.append((step, e))
+                if on_step:
+                    on_step(step, "failed")
+                continue
+            installed.append(step)
+            if ctx.catalog.assets(step.feature_id, tool_id).extension:
+                pending.append(step)
+            elif on_step:
+                on_step(step, "done")
+
+        # One enablement write per install, covering every extension installed above
+        status = "done"
+        try:
+            enable_extensions(ctx, tool_id, [s.feature_id for s in installed])
+        except Exception as e:
+            errors.extend((step, e) for step in pending)
+            status = "failed"
+        if on_step:
+            for step in pending:
+                on_step(step, status)
+        return errors
+
+
+def uninstall(home: Path, tool_ids: list[str], feature_ids: list[str],
+              catalog: Optional[Catalog] = None) -> UninstallResult:
+    """Remove features from tools as one journaled transaction (rolled back on any error).
+
+    `catalog` names the features' Gemini extensions; without it their enablement entries stay.
+    """
+    result = UninstallResult()
+    events.emit("start", command="uninstall", home=str(home), tools=tool_ids, features=feature_ids)
+    started = time.monotonic()
+    with timing.span("begin journal"):
+        journal = Journal.begin(home, "uninstall", tools=tool_ids, features=feature_ids)
+    with timing.span("load manifest"):
+        manifest = Manifest.load(home)
+    ctx = InstallContext(home, catalog, manifest=manifest, journal=journal)
+    try:
+        with timing.span("uninstall", tools=len(tool_ids), features=len(feature_ids)):
+            for tool_id in tool_ids:
+                try:
+                    with timing.span(f"uninstall from {tool_id}", "tool", tool=tool_id):
+                        result.kept.extend(uninstall_features(ctx, tool_id, feature_ids))
+                except Exception as e:
+                    result.errors.append((tool_id, e))
+                    events.emit("error", tool=tool_id, message=str(e))
+        if result.errors:
+            with timing.span("rollback"):
+                journal.rollback()
+            result.rolled_back = True
+        else:
+            with timing.span("save manifest"):
+                journal.save(ctx.manifest.path)
+                ctx.manifest.save()
+            with timing.span("commit journal"):
+                journal.commit()
+    except BaseException as e:
+        journal.rollback()
+        events.emit("error", message=str(e), fatal=True)
+        raise
+    result.removed = ctx.manifest.stats.removed
+    events.emit("summary", ok=result.ok, rolled_back=result.rolled_back, removed=result.removed,
+                kept=len(result.kept), errors=len(result.errors), seconds=round(time.monotonic() - started, 6))
+    return result
+
+
+def _emitting(on_step: Optional[StepCallback]) -> StepCallback:
+    """Wrap a step callback so every status change is also emitted as an event."""
+    def notify(step: InstallStep, status: str) -> None:
+        if status == "active":
+            events.emit("step_start", tool=step.tool_id, feature=step.feature_id, label=step.label)
+        else:
+            events.emit("step_finish", tool=step.tool_id, feature=step.feature_id, label=step.label,
+                        status=status)
+        if on_step:
+            on_step(step, status)
+    return notify
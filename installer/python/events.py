@@ -0,0 +1,78 @@
+"""
+Nexus-AI Installer - Structured event stream
+
+`--events ndjson` emits one JSON object per line for orchestration tools
+wrapping nexus-ai:
+
+    {"event": "start", "seq": 0, "ts": 12.345, "home": "/root", "tools": [...], ...}
+    {"event": "step_start", "tool": "claude", "feature": "maestro", ...}
+    {"event": "file", "action": "write", "path": ".claude/commands/maestro-run.md", "bytes": 4120, ...}
+    {"event": "step_finish", "status": "done", ...}
+    {"event": "error", "message": "...", ...}
+    {"event": "summary", "ok": true, "written": 23, ...}
+
+`ts` is time.monotonic() seconds and `seq` orders events within a run.
+Each line is a single unbuffered write() to the stream's descriptor (stdout
+or a fifo), so a reader sees whole events as they happen. Emitting is a no-op
+unless a stream was opened.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional
+
+
+class EventStream:
+    def __init__(self, fd: int) -> None:
+        self.fd = fd
+        self.seq = 0
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, **fields) -> None:
+        with self._lock:
+            record = {"event": event, "seq": self.seq, "ts": round(time.monotonic(), 6), **fields}
+            self.seq += 1
+            data = (json.dumps(record, default=str) + "\n").encode()
+            while data:
+                data = data[os.write(self.fd, data):]
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+_stream: Optional[EventStream] = None
+
+
+def open_stream(target: str) -> EventStream:
+    """Send events to target: "-" for stdout, or a path (a fifo blocks until read)."""
+    global _stream
+    if target == "-":
+        fd = os.dup(1)
+    else:
+        fd = os.open(target, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    _stream = EventStream(fd)
+    return _stream
+
+
+def close_stream() -> None:
+    global _stream
+    if _stream is not None:
+        _stream.close()
+        _stream = None
+
+
+def enabled() -> bool:
+    return _stream is not None
+
+
+def emit(event: str, **fields) -> None:
+    stream = _stream
+    if stream is not None:
+        stream.emit(event, **fields)
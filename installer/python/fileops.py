@@ -0,0 +1,211 @@
+"""
+Nexus-AI Installer - File operations
+
+All feature assets are copied as raw bytes (never decoded), using the
+cheapest mechanism the platform offers:
+
+- "copy":     os.copy_file_range -> os.sendfile -> buffered binary copy
+- "hardlink": os.link, falling back to "copy" across filesystems
+- "reflink":  copy-on-write clone (Linux FICLONE), falling back to "copy"
+
+Hardlinked files share an inode with the packaged feature source, so they
+are only suitable when the installed files are treated as read-only.
+
+Also home to the atomic-replace and advisory-lock helpers used for files the
+installer edits in place.
+"""
+
+from __future__ import annotations
+
+import errno
+import fcntl
+import os
+import stat
+import sys
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional
+
+COPY_MODES = ("copy", "hardlink", "reflink")
+
+# ioctl request number for FICLONE (linux/fs.h: _IOW(0x94, 9, int))
+_FICLONE = 0x40049409
+
+# Errors that mean "this mechanism is unavailable here", not "the copy failed"
+_UNSUPPORTED = {
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP,
+    errno.ENOTSUP, errno.EPERM, errno.EBADF, errno.ENOTTY,
+}
+
+_BUFFER_SIZE = 1024 * 1024
+
+
+def copy_file(src: Path, dst: Path, mode: str = "copy") -> str:
+    """Copy src to a new file at dst, byte for byte.
+
+    dst must not exist. Returns the mechanism that was actually used
+    ("hardlink", "reflink", "copy_file_range", "sendfile" or "buffered").
+    """
+    if mode not in COPY_MODES:
+        raise ValueError(f"unknown copy mode: {mode!r}")
+
+    if mode == "hardlink":
+        try:
+            os.link(src, dst)
+            return "hardlink"
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED and e.errno != errno.EMLINK:
+                raise
+
+    with open(src, "rb") as fsrc, open(dst, "xb") as fdst:
+        if mode == "reflink" and _reflink(fsrc.fileno(), fdst.fileno()):
+            return "reflink"
+        return _copy_fd(fsrc, fdst)
+
+
+def atomic_copy(src: Path, dst: Path, mode: str = "copy", data: Optional[bytes] = None) -> None:
+    """Like copy_file, but dst may exist and is replaced in a single rename.
+
+    With `data` those bytes are written instead of reading src. Readers (and
+    a crash) see either the old file or the complete new one, never a mix.
+    """
+    tmp = temp_path(dst)
+    try:
+        if data is None:
+            copy_file(src, tmp, mode)
+        else:
+            with open(tmp, "xb") as f:
+                f.write(data)
+        os.replace(tmp, dst)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def temp_path(path: Path) -> Path:
+    """A sibling temp name, unique per process and thread, for write-then-rename."""
+    return path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+
+
+def _reflink(src_fd: int, dst_fd: int) -> bool:
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+        return True
+    except OSError as e:
+        if e.errno in _UNSUPPORTED:
+            return False
+        raise
+
+
+def _copy_fd(fsrc, fdst) -> str:
+    src_fd, dst_fd = fsrc.fileno(), fdst.fileno()
+    size = os.fstat(src_fd).st_size
+
+    if hasattr(os, "copy_file_range"):
+        try:
+            if _copy_loop(lambda n: os.copy_file_range(src_fd, dst_fd, n), size):
+                return "copy_file_range"
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED:
+                raise
+            _rewind(fsrc, fdst)
+
+    # Linux can sendfile between regular files; macOS only to sockets
+    if hasattr(os, "sendfile") and sys.platform.startswith("linux"):
+        try:
+            if _copy_loop(lambda n: os.sendfile(dst_fd, src_fd, None, n), size):
+                return "sendfile"
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED:
+                raise
+            _rewind(fsrc, fdst)
+
+    import shutil  # only needed on this fallback path
+    shutil.copyfileobj(fsrc, fdst, _BUFFER_SIZE)
+    return "buffered"
+
+
+def _copy_loop(copy_chunk, size: int) -> bool:
+    """Copy with a syscall that may copy fewer bytes than asked; False if it copied nothing.
+
+    Some filesystems (procfs, sysfs, some FUSE and network mounts) report a size
+    but make these syscalls return 0 straight away; shutil falls back there too.
+    """
+    chunk = min(max(size, _BUFFER_SIZE), 1 << 30)
+    copied = 0
+    while True:
+        n = copy_chunk(chunk)
+        if not n:
+            break
+        copied += n
+    if copied == 0 and size > 0:
+        return False
+    if copied < size:
+        raise OSError(errno.EIO, f"short copy: {copied} of {size} bytes")
+    return True
+
+
+def _rewind(fsrc, fdst) -> None:
+    fsrc.seek(0)
+    fdst.seek(0)
+    fdst.truncate()
+
+
+@contextmanager
+def atomic_writer(path: Path):
+    """Yield a binary file that replaces path (temp file + rename) when the block exits.
+
+    The old file's mode is kept; on error the temp file is removed and path is untouched.
+    """
+    tmp = temp_path(path)
+    # 0o666 lets the umask pick the mode for new files, like open(..., "w") would
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(tmp, stat.S_IMODE(os.stat(path).st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Replace path with data via a temp file + rename, keeping the old file mode."""
+    with atomic_writer(path) as f:
+        f.write(data)
+
+
+def lock_path(path: Path) -> Path:
+    return path.with_name(path.name + ".lock")
+
+
+@contextmanager
+def file_lock(path: Path):
+    """Exclusive advisory lock on a sidecar `<path>.lock` file, held for the block.
+
+    Serializes read-modify-write cycles between concurrent nexus-ai processes.
+    """
+    fd = os.open(lock_path(path), os.O_RDWR | os.O_CREAT, 0o666)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)  # closing the descriptor releases the lock
@@ -0,0 +1,159 @@
+"""
+Nexus-AI Installer - Fleet installs
+
+Installs the same selection into many home directories (user homes on a
+build host, or homes inside container rootfs trees) on a process pool. The
+feature sources are read once in the parent and handed to each worker when
+it starts, so per-home work is only writes into that home.
+
+When run as root, each home is installed with the effective uid/gid of the
+home directory's owner, so the files end up owned by that user. Files linked
+from a store are the exception: they are linked as root, so every home
+shares the store's objects (see store.py), and the home's tools are
+installed one after another rather than on threads.
+"""
+
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from installer.python import events
+from installer.python.catalog import Catalog
+from installer.python.engine import InstallEngine
+from installer.python.store import ObjectStore
+
+
+@dataclass
+class HomeResult:
+    home: str
+    seconds: float
+    written: int = 0
+    skipped: int = 0
+    removed: int = 0
+    unlinked: int = 0           # written files copied because the store could not link them
+    unlinked_reason: str = ""
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+def read_homes(path: str) -> list[Path]:
+    """One home per line ('-' reads stdin); blank lines and '#' comments are ignored."""
+    text = sys.stdin.read() if path == "-" else Path(path).read_text()
+    homes = []
+    for line in text.splitlines():
+        line = line.split("#", 1)[0].strip()
+        if line:
+            homes.append(Path(line))
+    return homes
+
+
+def read_sources(catalog: Catalog, tool_ids: list[str], feature_ids: list[str]) -> dict[str, bytes]:
+    """Bytes of every source file the selection installs, keyed by catalog path."""
+    sources = {}
+    for feature_id in feature_ids:
+        for tool_id in tool_ids:
+            assets = catalog.assets(feature_id, tool_id)
+            if assets is None:
+                continue
+            for asset in ([assets.config] if assets.config else []) + assets.files:
+                if asset.src not in sources:
+                    sources[asset.src] = (catalog.root / asset.src).read_bytes()
+    return sources
+
+
+# Worker state, set once per process by _init_worker
+_job: dict = {}
+
+
+def _init_worker(catalog: Catalog, sources: dict[str, bytes], tool_ids: list[str],
+                 feature_ids: list[str], copy_mode: str, store: Optional[ObjectStore]) -> None:
+    # Forked workers inherit the parent's event stream; only the parent reports (per home)
+    events.close_stream()
+    if store is not None and os.geteuid() == 0:
+        store.link_as_root = True
+    _job.update(catalog=catalog, sources=sources, tool_ids=tool_ids,
+                feature_ids=feature_ids, copy_mode=copy_mode, store=store)
+
+
+def _install_home(home: str) -> HomeResult:
+    start = time.perf_counter()
+    result = HomeResult(home, 0.0)
+    try:
+        if not os.path.isdir(home):
+            raise FileNotFoundError(f"home directory does not exist: {home}")
+        with _as_owner(home):
+            engine = InstallEngine(Path(home), _job["catalog"], _job["tool_ids"], _job["feature_ids"],
+                                   _job["copy_mode"], _job["sources"], _job["store"])
+            install = engine.run()
+        result.written = install.files.written
+        result.skipped = install.files.skipped
+        result.removed = install.files.removed
+        result.unlinked = install.files.unlinked
+        result.unlinked_reason = install.files.unlinked_reason
+        result.errors = [f"{step.label}: {error}" for step, error in install.errors]
+    except Exception as e:
+        result.errors.append(str(e))
+    result.seconds = time.perf_counter() - start
+    return result
+
+
+class _as_owner:
+    """As root, switch the effective uid/gid to the home's owner for the duration."""
+
+    def __init__(self, home: str) -> None:
+        self.home = home
+        self.saved = None
+
+    def __enter__(self):
+        if os.geteuid() != 0:
+            return self
+        st = os.stat(self.home)
+        if st.st_uid == 0:
+            return self
+        self.saved = (os.getegid(), os.geteuid())
+        os.setegid(st.st_gid)
+        os.seteuid(st.st_uid)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self.saved:
+            os.seteuid(0)
+            os.setegid(self.saved[0])
+
+
+def run_fleet(homes: list[Path], catalog: Catalog, tool_ids: list[str], feature_ids: list[str],
+              copy_mode: str = "copy", jobs: Optional[int] = None,
+              on_result: Optional[Callable[[HomeResult], None]] = None,
+              sources: Optional[dict[str, bytes]] = None,
+              store: Optional[ObjectStore] = None) -> list[HomeResult]:
+    """Install into every home on a process pool; results come back in input order.
+
+    `sources` are the feature files' bytes when the caller already has them (plans).
+    With a `store`, files are linked to its objects instead.
+    """
+    # Links must point at the packaged files, so only plain copies use the shared bytes
+    if sources is None and copy_mode == "copy" and store is None:
+        sources = read_sources(catalog, tool_ids, feature_ids)
+    jobs = max(1, min(jobs or os.cpu_count() or 1, len(homes)))
+
+    results = []
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(catalog, sources, tool_ids, feature_ids, copy_mode, store),
+    ) as pool:
+        for result in pool.map(_install_home, [str(h) for h in homes], chunksize=max(1, len(homes) // (jobs * 4))):
+            results.append(result)
+            events.emit("home", home=result.home, ok=result.ok, seconds=round(result.seconds, 6),
+                        written=result.written, skipped=result.skipped, removed=result.removed,
+                        unlinked=result.unlinked, errors=result.errors)
+            if on_result:
+                on_result(result)
+    return results
@@ -0,0 +1,380 @@
+"""
+Nexus-AI Installer - Transaction journal
+
+Every install and uninstall runs as one transaction with a write-ahead
+journal in ~/.nexus-ai/journal/<txid>/. Before the installer replaces,
+creates or deletes a file it appends a record naming the path and keeps a
+backup of the old file (a hardlink: every write goes through a temp file
+and rename, so the old inode is never modified). Files changed in place,
+like lock files, must not be saved: their backup would be the same inode.
+Directories the installer creates, and lock files it creates along the way,
+are recorded too.
+
+Rolling back replays the records in reverse, so it costs O(changed files)
+and never scans the tool directories. A transaction without a commit
+record (the process died mid-install) is rolled back by the next run.
+
+Committing records what each saved file now holds (its hash), so `nexus-ai
+rollback` can tell when the user has edited one since, and refuses to
+overwrite it without --force.
+
+    journal.jsonl   {"op": "begin", ...}
+                    {"op": "mkdir", "path": ...}
+                    {"op": "save", "path": ..., "backup": "3" | null, "symlink": target | null}
+                    {"op": "result", "path": ..., "sha256": ... | "symlink:<target>" | null}
+                    {"op": "commit"} or {"op": "rollback"}
+    backups/<n>     the file as it was before this transaction
+"""
+
+from __future__ import annotations
+
+import errno
+import fcntl
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from installer.python.fileops import copy_file, temp_path
+from installer.python.manifest import STATE_DIR, sha256_file
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional
+
+JOURNAL_DIR = "journal"
+JOURNAL_NAME = "journal.jsonl"
+# Committed transactions kept for `nexus-ai rollback`; older ones are pruned
+JOURNAL_KEEP = 10
+
+
+class NothingToRollBack(Exception):
+    """There is no committed transaction left to undo."""
+
+
+class EditedSinceCommit(Exception):
+    """Files the transaction changed were edited afterwards; rolling back would lose the edits."""
+
+    def __init__(self, paths: list[str]) -> None:
+        super().__init__(f"{len(paths)} file(s) changed since the transaction: {', '.join(paths)}")
+        self.paths = paths
+
+
+class RollbackStats:
+    __slots__ = ("restored", "removed", "dirs")
+
+    def __init__(self) -> None:
+        self.restored = 0   # files put back to their previous content
+        self.removed = 0    # files the transaction had created
+        self.dirs = 0       # directories the transaction had created
+
+
+class Journal:
+    """Write-ahead log for one transaction against a home directory.
+
+    Safe to share between the engine's per-tool worker threads.
+    """
+
+    def __init__(self, home: Path, path: Path) -> None:
+        self.home = home
+        self.path = path
+        self.saved: set[str] = set()
+        self.changed = False    # any file or directory recorded (each one really changes)
+        self._backups = 0
+        self._fd: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def begin(cls, home: Path, command: str, **info) -> "Journal":
+        """Start a transaction, first rolling back any that a dead process left open."""
+        recover(home)
+        root = journal_root(home)
+        txid = f"{time.time_ns():020d}-{os.getpid()}-{threading.get_ident()}"
+        path = root / txid
+        (path / "backups").mkdir(parents=True)
+        journal = cls(home, path)
+        journal._fd = os.open(path / JOURNAL_NAME, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        # Held until commit/rollback, so recover() can tell live transactions from dead ones
+        fcntl.flock(journal._fd, fcntl.LOCK_EX)
+        journal._append({"op": "begin", "command": command, "time": time.time(), "pid": os.getpid(), **info})
+        return journal
+
+    def _append(self, record: dict) -> None:
+        # Unbuffered append: the record reaches the OS before the change it describes
+        os.write(self._fd, (json.dumps(record) + "\n").encode())
+
+    def save(self, path: Path) -> None:
+        """Record path (and back up its current content) before it is replaced or deleted."""
+        key = os.path.abspath(path)
+        with self._lock:
+            if key in self.saved:
+                return
+            self.saved.add(key)
+            record = {"op": "save", "path": key, "backup": None, "symlink": None}
+            try:
+                st = os.lstat(key)
+            except FileNotFoundError:
+                st = None
+            if st is not None:
+                if os.path.islink(key):
+                    record["symlink"] = os.readlink(key)
+                else:
+                    backup = str(self._backups)
+                    self._backups += 1
+                    _preserve(key, self.path / "backups" / backup)
+                    record["backup"] = backup
+            self._append(record)
+            self.changed = True
+
+    def created(self, path: Path) -> None:
+        """Record a file that was just created by other means, so rollback deletes it."""
+        key = os.path.abspath(path)
+        with self._lock:
+            if key in self.saved:
+                return
+            self.saved.add(key)
+            self._append({"op": "save", "path": key, "backup": None, "symlink": None})
+            self.changed = True
+
+    def makedirs(self, path: Path) -> None:
+        """mkdir -p, recording each directory that did not exist."""
+        missing = []
+        current = Path(os.path.abspath(path))
+        while not current.exists():
+            missing.append(current)
+            current = current.parent
+        for directory in reversed(missing):
+            try:
+                directory.mkdir()
+            except FileExistsError:
+                continue  # another worker thread got there first
+            with self._lock:
+                self._append({"op": "mkdir", "path": str(directory)})
+                self.changed = True
+
+    def commit(self) -> None:
+        """Make the transaction final; one that changed nothing leaves no history."""
+        with self._lock:
+            if not self.changed:
+                self._close()
+                _remove(self.path)
+                return
+            # The installer's own state (manifest) is rewritten by later runs, so only check the user's files
+            state = str(journal_root(self.home).parent) + os.sep
+            for key in sorted(self.saved):
+                if not key.startswith(state):
+                    self._append({"op": "result", "path": key, "sha256": _fingerprint(key)})
+            os.fsync(self._fd)
+            self._append({"op": "commit"})
+            os.fsync(self._fd)
+            self._close()
+        prune(self.home)
+
+    def rollback(self) -> RollbackStats:
+        with self._lock:
+            os.fsync(self._fd)
+            stats = _undo(self.path)
+            self._close()
+        return stats
+
+    def _close(self) -> None:
+        if self._fd is not None:
+            os.close(self._fd)  # releases the lock
+            self._fd = None
+
+
+def journal_root(home: Path) -> Path:
+    return home / STATE_DIR / JOURNAL_DIR
+
+
+def read_records(path: Path) -> list[dict]:
+    records = []
+    try:
+        with open(path / JOURNAL_NAME) as f:
+            for line in f:
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    break  # torn final record from a crash; nothing after it was done
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def transactions(home: Path) -> list[tuple[Path, list[dict]]]:
+    """(journal dir, records) for every transaction, newest first."""
+    root = journal_root(home)
+    try:
+        names = sorted((e.name for e in os.scandir(root) if e.is_dir()), reverse=True)
+    except FileNotFoundError:
+        return []
+    return [(root / name, read_records(root / name)) for name in names]
+
+
+def status(records: list[dict]) -> str:
+    """"committed", "rolled back" or "open" (in progress, or abandoned by a crash)."""
+    ops = {r.get("op") for r in records}
+    if "rollback" in ops:
+        return "rolled back"
+    if "commit" in ops:
+        return "committed"
+    return "open"
+
+
+def recover(home: Path) -> int:
+    """Roll back open transactions whose process is gone; returns how many."""
+    recovered = 0
+    for path, records in transactions(home):
+        # No records yet: the transaction is starting up (or died before changing anything)
+        if not records or status(records) != "open":
+            continue
+        try:
+            fd = os.open(path / JOURNAL_NAME, os.O_WRONLY | os.O_APPEND)
+        except FileNotFoundError:
+            continue
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError as e:
+            os.close(fd)
+            if e.errno in (errno.EAGAIN, errno.EACCES):
+                continue  # still running
+            raise
+        try:
+            _undo(path, fd, dead_pid=records[0].get("pid"))
+        finally:
+            os.close(fd)
+        recovered += 1
+    return recovered
+
+
+def rollback_last(home: Path, force: bool = False) -> tuple[dict, RollbackStats]:
+    """Undo the most recent committed transaction; returns its begin record and what changed.
+
+    Raises EditedSinceCommit, changing nothing, if files it would restore were
+    edited since it committed, unless `force`.
+    """
+    recover(home)
+    for path, records in transactions(home):
+        if status(records) == "committed":
+            fd = os.open(path / JOURNAL_NAME, os.O_WRONLY | os.O_APPEND)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                if not force:
+                    edited = [r["path"] for r in records
+                              if r.get("op") == "result" and _fingerprint(r["path"]) != r["sha256"]]
+                    if edited:
+                        raise EditedSinceCommit(edited)
+                stats = _undo(path, fd)
+            finally:
+                os.close(fd)
+            return records[0] if records else {}, stats
+    raise NothingToRollBack(f"nothing to roll back in {home}")
+
+
+def prune(home: Path, keep: int = JOURNAL_KEEP) -> None:
+    """Delete all but the newest `keep` finished transactions."""
+    finished = [path for path, records in transactions(home) if status(records) != "open"]
+    for path in finished[keep:]:
+        _remove(path)
+
+
+def _remove(path: Path) -> None:
+    import shutil
+
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _undo(path: Path, fd: Optional[int] = None, dead_pid: Optional[int] = None) -> RollbackStats:
+    """Replay a journal in reverse, then mark it rolled back.
+
+    With `dead_pid`, the process that died mid-transaction, also remove the
+    temp files its in-flight writes left next to the files it saved.
+    """
+    stats = RollbackStats()
+    swept: set[str] = set()
+    for record in reversed(read_records(path)):
+        op = record.get("op")
+        if op == "save":
+            target = Path(record["path"])
+            if dead_pid is not None and str(target.parent) not in swept:
+                swept.add(str(target.parent))
+                _remove_temp_files(target.parent, dead_pid)
+            if record["backup"] is not None:
+                _restore(path / "backups" / record["backup"], target)
+                stats.restored += 1
+            elif record["symlink"] is not None:
+                target.parent.mkdir(parents=True, exist_ok=True)
+                tmp = temp_path(target)
+                os.symlink(record["symlink"], tmp)
+                os.replace(tmp, target)
+                stats.restored += 1
+            else:
+                try:
+                    target.unlink()
+                    stats.removed += 1
+                except FileNotFoundError:
+                    pass
+        elif op == "mkdir":
+            try:
+                os.rmdir(record["path"])
+                stats.dirs += 1
+            except OSError:
+                pass  # already gone, or holds files that were not ours
+    line = (json.dumps({"op": "rollback", "time": time.time()}) + "\n").encode()
+    if fd is None:
+        with open(path / JOURNAL_NAME, "ab") as f:
+            f.write(line)
+    else:
+        os.write(fd, line)
+    return stats
+
+
+def _remove_temp_files(directory: Path, pid: int) -> None:
+    # Named by fileops.temp_path; saves are recorded before the write, so every directory is swept
+    try:
+        entries = list(os.scandir(directory))
+    except FileNotFoundError:
+        return
+    for entry in entries:
+        name = entry.name
+        if not (name.startswith(".") and name.endswith(".tmp")):
+            continue
+        parts = name[:-4].rsplit(".", 2)    # ".<file>", "<pid>", "<thread>"
+        if len(parts) == 3 and parts[1] == str(pid) and parts[2].isdigit():
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+
+
+def _fingerprint(path: str) -> Optional[str]:
+    """The file's content hash, "symlink:<target>", or None if it does not exist."""
+    try:
+        if os.path.islink(path):
+            return "symlink:" + os.readlink(path)
+        return sha256_file(Path(path))
+    except FileNotFoundError:
+        return None
+
+
+def _preserve(src: str, backup: Path) -> None:
+    # Replaced files get a new inode, so a hardlink is a complete backup
+    copy_file(Path(src), backup, "hardlink")
+
+
+def _restore(backup: Path, target: Path) -> None:
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = temp_path(target)
+    try:
+        copy_file(backup, tmp, "hardlink")
+        if target.exists() and os.path.samefile(tmp, target):
+            os.unlink(tmp)  # never replaced, so there is nothing to put back (and rename would be a no-op)
+        else:
+            os.replace(tmp, target)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except FileNotFoundError:
+            pass
+        raise
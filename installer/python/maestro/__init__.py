@@ -0,0 +1 @@
+# Nexus-AI Maestro - tools for the .ai/MAESTRO.md orchestration state file
@@ -0,0 +1,481 @@
+"""
+Nexus-AI Maestro - Parallel dispatcher
+
+`nexus-ai maestro run` executes the plan in `.ai/MAESTRO.md` directly. Each
+ready task (pending, dependencies done) is handed to its tool's CLI as a
+subprocess, with the exact commands from SPOKE-CONTRACT.md, and up to a
+per-tool limit of spokes run at once. A spoke's result (the contract's
+Status, Summary, Changes, Verification and Issues sections) decides the
+task's new status, which is written back to the table; tasks unblocked by
+it are launched as soon as it is.
+
+An attempt fails on a non-zero exit, a `failed` or `partial` Status, or a
+result that does not follow the contract. Failed attempts are retried with
+exponential backoff and the previous attempt's issues added to the handoff;
+`blocked` is never retried. A timeout (exit 124 in the contract) whose
+output is a complete `success` result still counts as success.
+"""
+
+import asyncio
+import json
+import os
+import random
+import re
+import shlex
+import signal
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from installer.python.maestro.oplog import StateFile
+from installer.python.maestro.state import LOG_FILE, Task, TaskStore, tool_id
+
+# The spoke contract's commands; PROMPT is replaced by the handoff
+PROMPT = "{prompt}"
+COMMANDS = {
+    "claude": ("claude", "-p", PROMPT, "--output-format", "json", "--dangerously-skip-permissions"),
+    "gemini": ("gemini", "-p", PROMPT, "-y", "-o", "json"),
+    "codex": ("codex", "exec", PROMPT, "--full-auto", "--json"),
+}
+
+# Defaults: spokes per tool at once, retries after the first attempt, seconds before the first retry
+LIMIT = 2
+RETRIES = 2
+BACKOFF = 2.0
+
+EXIT_TIMEOUT = 124
+
+# Who status transitions are recorded as, in the operations log
+ACTOR = "nexus-ai maestro run"
+
+RESULT_STATUSES = ("success", "partial", "failed", "blocked")
+RESULT_SECTIONS = ("Status", "Summary", "Changes", "Verification", "Issues")
+
+_HEADING = re.compile(r"^##\s+(.+?)\s*$")
+
+GUARDRAILS = """\
+> **🚨 STRICT RULES — VIOLATIONS WILL CAUSE TASK REJECTION**
+>
+> 1. **ONLY modify files explicitly listed** — Do not touch any other files
+> 2. **ONLY run commands required for THIS task** — No exploratory commands
+> 3. **DO NOT install dependencies** unless explicitly requested
+> 4. **DO NOT expand scope** — If additional work is needed, report it in Issues
+> 5. **STOP if blocked** — Do not improvise solutions; report blockers instead"""
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# SPOKE I/O
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+@dataclass
+class SpokeResult:
+    """A spoke's answer, per the contract's Result Submission Template."""
+    status: str = ""        # one of RESULT_STATUSES, or "" if missing or unknown
+    summary: str = ""
+    changes: list[str] = field(default_factory=list)
+    verification: list[str] = field(default_factory=list)
+    issues: str = ""
+    missing: list[str] = field(default_factory=list)   # required sections that are absent
+
+    @property
+    def compliant(self) -> bool:
+        return bool(self.status) and not self.missing
+
+
+def handoff(task: Task, goal: str, dependencies: list[Task], notes: list[str] = ()) -> str:
+    """The Task Handoff Template for a task; `notes` are earlier attempts' outcomes."""
+    context = [f"Task {task.id} ({task.specialist or 'code'} specialist) of the plan: {goal or 'see task'}."]
+    if dependencies:
+        context.append("Completed tasks this one builds on:")
+        context += [f"- Task {d.id}: {d.description}" for d in dependencies]
+    if notes:
+        context.append("Earlier attempts at this task did not succeed:")
+        context += [f"- {note}" for note in notes]
+    return "\n".join([
+        "## Task", task.description, "",
+        "## Context", *context, "",
+        "## Success Criteria", f"- [ ] {task.description}", "",
+        "## Constraints",
+        "- Work on this task only; other tasks of the plan are running at the same time",
+        "- Do not edit .ai/MAESTRO.md; the hub updates it", "",
+        "## Guardrails", "", GUARDRAILS, "",
+        "## Output Format",
+        "Return result as markdown with Status, Summary, Changes, Verification, Issues sections.", "",
+        "**You MUST use this exact format. Non-compliant responses will be rejected.**",
+    ])
+
+
+def spoke_output(stdout: str) -> tuple[str, Optional[int]]:
+    """(response text, tokens used or None) from a spoke CLI's JSON output."""
+    stdout = stdout.strip()
+    try:
+        data = json.loads(stdout)
+    except ValueError:
+        data = None
+    if isinstance(data, dict):
+        # claude --output-format json has "result", gemini -o json has "response"
+        for key in ("result", "response"):
+            if isinstance(data.get(key), str):
+                return data[key], _tokens(data)
+        return stdout, _tokens(data)
+
+    # codex exec --json prints one event per line; the answer is the last agent message
+    text, tokens = None, None
+    for line in stdout.splitlines():
+        try:
+            event = json.loads(line)
+        except ValueError:
+            continue
+        if not isinstance(event, dict):
+            continue
+        item = event.get("item")
+        if isinstance(item, dict) and item.get("type") == "agent_message" and isinstance(item.get("text"), str):
+            text = item["text"]
+        used = _tokens(event)
+        if used:
+            tokens = (tokens or 0) + used
+    return (stdout if text is None else text), tokens
+
+
+def _tokens(data: dict) -> Optional[int]:
+    usage = data.get("usage")
+    if isinstance(usage, dict):
+        return sum(v for k, v in usage.items() if k in ("input_tokens", "output_tokens") and isinstance(v, int))
+    models = data.get("stats", {}).get("models") if isinstance(data.get("stats"), dict) else None
+    if isinstance(models, dict):
+        return sum(m["tokens"].get("total", 0) for m in models.values()
+                   if isinstance(m, dict) and isinstance(m.get("tokens"), dict))
+    return None
+
+
+def parse_result(text: str) -> SpokeResult:
+    """The contract sections of a spoke's markdown answer."""
+    sections: dict[str, list[str]] = {}
+    current: Optional[list[str]] = None
+    for line in text.splitlines():
+        match = _HEADING.match(line.strip())
+        if match:
+            name = match.group(1).strip("*").capitalize()
+            current = sections.setdefault(name, []) if name in RESULT_SECTIONS else None
+        elif current is not None:
+            current.append(line.strip())
+
+    def body(name: str) -> str:
+        return "\n".join(sections.get(name, [])).strip()
+
+    def items(name: str) -> list[str]:
+        return [line[1:].strip() for line in sections.get(name, []) if line[:1] in ("-", "*")]
+
+    words = body("Status").strip("[]`*_ ").lower().split()
+    status = words[0].strip("[]`*_.") if words else ""
+    return SpokeResult(
+        status=status if status in RESULT_STATUSES else "",
+        summary=body("Summary"),
+        changes=items("Changes"),
+        verification=items("Verification"),
+        issues=body("Issues"),
+        missing=[name for name in RESULT_SECTIONS if name not in sections],
+    )
+
+
+def read_goal(text: str) -> str:
+    """The first line under the state file's `## Goal` heading."""
+    lines = iter(text.splitlines())
+    for line in lines:
+        if re.match(r"^##\s+Goal\s*$", line):
+            return next((line.strip() for line in lines if line.strip()), "")
+    return ""
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# DISPATCHER
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+@dataclass
+class Attempt:
+    task_id: int
+    tool: str
+    number: int             # 1 for the first try
+    exit_code: int
+    seconds: float
+    result: SpokeResult
+    tokens: Optional[int] = None
+    problem: str = ""       # why the attempt does not count as success; "" if it does
+
+    @property
+    def ok(self) -> bool:
+        return not self.problem
+
+
+@dataclass
+class TaskResult:
+    task_id: int
+    tool: str
+    status: str             # what was written back: done, failed or blocked
+    attempts: list[Attempt] = field(default_factory=list)
+    seconds: float = 0.0
+    problem: str = ""       # for tasks that could not be dispatched at all
+
+
+@dataclass
+class RunResult:
+    tasks: list[TaskResult] = field(default_factory=list)
+    not_run: list[int] = field(default_factory=list)    # tasks still pending at the end
+    seconds: float = 0.0
+    interrupted: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return not self.interrupted and all(t.status == "done" for t in self.tasks)
+
+
+class Dispatcher:
+    """Runs the ready tasks of a project's plan on their spokes until nothing more can run."""
+
+    def __init__(
+        self,
+        root: Path,
+        limits: Optional[dict[str, int]] = None,
+        jobs: Optional[int] = None,
+        retries: int = RETRIES,
+        backoff: float = BACKOFF,
+        timeout: Optional[float] = None,
+        spokes: Optional[dict[str, str]] = None,
+        only: Optional[set[int]] = None,
+        keep_going: bool = False,
+        log: bool = False,
+        on_attempt: Optional[Callable[[Attempt], None]] = None,
+        on_result: Optional[Callable[[TaskResult], None]] = None,
+    ) -> None:
+        self.root = Path(root)
+        self.state = StateFile(self.root)
+        self.limits = {tool: LIMIT for tool in COMMANDS}
+        self.limits.update(limits or {})
+        self.jobs = jobs                # total spokes at once; None for just the per-tool limits
+        self.retries = retries
+        self.backoff = backoff
+        self.timeout = timeout          # seconds per attempt
+        self.only = only                # task ids to run; None for all
+        self.keep_going = keep_going    # launch more tasks after one failed
+        self.log = log
+        self.on_attempt = on_attempt
+        self.on_result = on_result
+        # A spoke override ("python stub.py") replaces the program, the contract's flags stay
+        self.commands = {tool: shlex.split(spokes[tool]) + list(cmd[1:]) if spokes and tool in spokes else list(cmd)
+                         for tool, cmd in COMMANDS.items()}
+        self.goal = ""
+        self._running: set[int] = set()     # tasks this run marked running in the file
+        self._logged = False
+
+    def command(self, tool: str, prompt: str) -> list[str]:
+        return [prompt if arg == PROMPT else arg for arg in self.commands[tool]]
+
+    def run(self) -> RunResult:
+        """Dispatch until done; on Ctrl-C or SIGTERM, kill the spokes and put their tasks back to pending."""
+        try:
+            return asyncio.run(self._main())
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            # dispatch() has cancelled the attempts, which kills their spokes
+            if self._running:
+                self.state.append(dict.fromkeys(self._running, "pending"), ACTOR)
+            self.state.compact()
+            return RunResult(interrupted=True, not_run=sorted(self._running))
+
+    def select(self, store: TaskStore, busy: dict[str, int]) -> list[Task]:
+        """The ready tasks that fit in the limits, given `busy` spokes per tool."""
+        busy = dict(busy)
+        selected = []
+        in_flight = sum(busy.values())
+        for task_id in store.ready():
+            if self.only is not None and task_id not in self.only:
+                continue
+            if self.jobs and in_flight + len(selected) >= self.jobs:
+                break
+            task = store.task(task_id)
+            tool = tool_id(task.tool)
+            if tool in COMMANDS:
+                if busy.get(tool, 0) >= self.limits.get(tool, LIMIT):
+                    continue
+                busy[tool] = busy.get(tool, 0) + 1
+            selected.append(task)   # unknown tools too; dispatch() marks them blocked
+        return selected
+
+    async def _main(self) -> RunResult:
+        main = asyncio.current_task()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, main.cancel)
+            except (NotImplementedError, RuntimeError, ValueError):
+                pass    # not the main thread, or Windows: Ctrl-C still raises KeyboardInterrupt
+        return await self.dispatch()
+
+    async def dispatch(self) -> RunResult:
+        start = time.perf_counter()
+        text = self.state.snapshot().text
+        store = TaskStore.parse(text)
+        self.goal = read_goal(text)
+        result = RunResult()
+        flying: dict[asyncio.Future, int] = {}
+        busy = dict.fromkeys(COMMANDS, 0)
+        stopping = False
+        try:
+            while True:
+                changes: dict[int, str] = {}
+                launch = []
+                for task in [] if stopping else self.select(store, busy):
+                    tool = tool_id(task.tool)
+                    if tool not in COMMANDS:
+                        changes[task.id] = "blocked"
+                        blocked = TaskResult(task.id, tool, "blocked", problem=f"unknown tool {task.tool!r}")
+                        result.tasks.append(blocked)
+                        if self.on_result:
+                            self.on_result(blocked)
+                        stopping = not self.keep_going
+                        continue
+                    changes[task.id] = "running"
+                    busy[tool] += 1
+                    launch.append(task)
+                if changes:
+                    self._record(store, changes)
+                for task in launch:
+                    self._running.add(task.id)
+                    dependencies = [store.task(d) for d in task.depends]
+                    flying[asyncio.ensure_future(self._run_task(task, dependencies))] = task.id
+                if not flying:
+                    break
+
+                done, _ = await asyncio.wait(flying, return_when=asyncio.FIRST_COMPLETED)
+                finished = {}
+                for future in done:
+                    del flying[future]
+                    task_result = future.result()
+                    busy[task_result.tool] -= 1
+                    finished[task_result.task_id] = task_result.status
+                    result.tasks.append(task_result)
+                    if self.on_result:
+                        self.on_result(task_result)
+                    if task_result.status != "done" and not self.keep_going:
+                        stopping = True     # let the running spokes finish, start no more
+                self._record(store, finished)
+                self._running.difference_update(finished)
+        finally:
+            for future in flying:
+                future.cancel()
+            if flying:
+                await asyncio.gather(*flying, return_exceptions=True)
+
+        self.state.compact()
+        result.not_run = [task.id for task in store if task.status == "pending"
+                          and (self.only is None or task.id in self.only)]
+        result.seconds = time.perf_counter() - start
+        return result
+
+    def _record(self, store: TaskStore, changes: dict[int, str]) -> None:
+        """Log status transitions and bring `store` up to date, with other writers' changes too."""
+        self.state.append(changes, ACTOR)
+        store.update(self.state.snapshot().text)
+
+    async def _run_task(self, task: Task, dependencies: list[Task]) -> TaskResult:
+        tool = tool_id(task.tool)
+        start = time.perf_counter()
+        attempts: list[Attempt] = []
+        notes: list[str] = []
+        status = "failed"
+        for number in range(1, self.retries + 2):
+            if number > 1:
+                # Exponential backoff with jitter, so retries of a rate-limited tool spread out
+                await asyncio.sleep(self.backoff * 2 ** (number - 2) * random.uniform(0.5, 1.0))
+            attempt = await self._attempt(task, tool, number, handoff(task, self.goal, dependencies, notes))
+            attempts.append(attempt)
+            if self.on_attempt:
+                self.on_attempt(attempt)
+            if self.log:
+                self._log(task, attempt)
+            if attempt.ok:
+                status = "done"
+                break
+            if attempt.result.status == "blocked":
+                status = "blocked"
+                break
+            issues = attempt.result.issues
+            notes.append(f"Attempt {number}: {attempt.problem}"
+                         + (f". Issues: {issues}" if issues and issues.lower() != "none" else ""))
+        return TaskResult(task.id, tool, status, attempts, time.perf_counter() - start)
+
+    async def _attempt(self, task: Task, tool: str, number: int, prompt: str) -> Attempt:
+        start = time.perf_counter()
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *self.command(tool, prompt), cwd=self.root, stdin=asyncio.subprocess.DEVNULL,
+                stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE,
+                start_new_session=True,     # so a kill reaches everything the spoke started
+            )
+        except OSError as e:
+            return Attempt(task.id, tool, number, 127, 0.0, SpokeResult(),
+                           problem=f"cannot run {self.commands[tool][0]}: {e.strerror or e}")
+
+        output = asyncio.ensure_future(proc.communicate())
+        try:
+            stdout, stderr = await asyncio.wait_for(asyncio.shield(output), self.timeout)
+            code = proc.returncode
+        except asyncio.TimeoutError:
+            _kill(proc)
+            stdout, stderr = await output
+            code = EXIT_TIMEOUT
+        except asyncio.CancelledError:
+            _kill(proc)
+            await asyncio.gather(output, return_exceptions=True)
+            raise
+
+        text, tokens = spoke_output(stdout.decode(errors="replace"))
+        result = parse_result(text)
+        if code not in (0, EXIT_TIMEOUT):
+            last = stderr.decode(errors="replace").strip().splitlines()[-1:]
+            problem = f"exit {code}" + (f": {last[0]}" if last else "")
+        elif not result.compliant:
+            problem = (f"timed out after {self.timeout:g} s" if code == EXIT_TIMEOUT
+                       else "result does not follow the spoke contract"
+                       + (f" (no {', '.join(result.missing)})" if result.missing else " (no valid Status)"))
+        elif result.status != "success":
+            problem = f"status {result.status}"
+        else:
+            problem = ""    # a timeout with a complete success result is a soft success
+        return Attempt(task.id, tool, number, code, time.perf_counter() - start, result, tokens, problem)
+
+    def _log(self, task: Task, attempt: Attempt) -> None:
+        """Append the attempt to the execution log, in the state file spec's format."""
+        path = self.root / LOG_FILE
+        lines = []
+        if not self._logged:
+            if not path.exists():
+                lines.append("# Maestro Execution Log")
+            lines += [f"\n## Session: {_utc_now()}", f"**Goal:** {self.goal}", "",
+                      "| Time | Actor | Action | Target | Tokens | Duration | Outcome | Notes |",
+                      "|------|-------|--------|--------|--------|----------|---------|-------|"]
+            self._logged = True
+        target = f"{(task.tool.split() or [attempt.tool])[0]} ({task.specialist or 'code'})"
+        tokens = f"{attempt.tokens:,}" if attempt.tokens is not None else "-"
+        outcome = attempt.result.status or "failed"
+        summary = attempt.result.summary.splitlines()[0] if attempt.result.summary else "complete"
+        note = f"Task {task.id}: {attempt.problem or summary}".replace("|", "/")
+        action = "Dispatch" if attempt.number == 1 else "Retry"
+        lines.append(f"| {time.strftime('%H:%M:%S', time.gmtime())} | Hub | {action} | {target} | {tokens} "
+                     f"| {attempt.seconds:.0f}s | {outcome} | {note} |")
+        with open(path, "a", encoding="utf-8") as f:
+            f.write("\n".join(lines) + "\n")
+
+
+def _kill(proc) -> None:
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except ProcessLookupError:
+        pass
+
+
+def _utc_now() -> str:
+    return time.strftime("%Y-%m-%d %H:%M UTC", time.gmtime())
@@ -0,0 +1,353 @@
+"""
+Nexus-AI Maestro - Execution log analytics
+
+Totals for `/maestro report` from `.ai/MAESTRO-LOG.md` (STATE-FILE-SPEC.md,
+Execution Log Format), computed in one pass over the file, a line at a
+time: per session, per tool and per specialist, the rows, dispatches and
+retries (and the retry rate), token sums, outcome counts, and p50/p95
+durations. Durations go into log-spaced histogram buckets (each about 4%
+wide), so memory does not grow with the number of rows.
+
+The parser's state and the aggregates are saved to a sidecar index,
+`.ai/MAESTRO-LOG.idx`, together with the byte offset they cover and a
+fingerprint of the bytes before it. The next run resumes from that offset
+and reads only rows appended since; if the log was rewritten or truncated,
+it starts over.
+"""
+
+import hashlib
+import json
+import math
+import re
+from pathlib import Path
+from typing import Optional
+
+from installer.python.fileops import atomic_write_bytes
+from installer.python.maestro.state import LOG_FILE, split_row, tool_id
+
+LOG_INDEX = ".ai/MAESTRO-LOG.idx"
+INDEX_VERSION = 1
+
+# Histogram bucket k holds durations in [BASE * 2**(k/16), BASE * 2**((k+1)/16))
+_BASE = 0.001
+_STEPS = 16
+
+# Bytes hashed at the start of the log and just before the index's offset
+_FINGERPRINT = 4096
+
+_SESSION = re.compile(rb"^##\s+Session:\s*(.*?)\s*$")
+_GOAL = re.compile(rb"^\*\*Goal:\*\*\s*(.*?)\s*$")
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)\s*(ms|h|m|s)?")
+_UNITS = {"ms": 0.001, "s": 1.0, "m": 60.0, "h": 3600.0, None: 1.0}
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# FIELDS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def parse_duration(text: str) -> Optional[float]:
+    """Seconds in "45s", "1m 30s", "850ms", "2.5s", "1h 2m" or a bare number; None if unreadable."""
+    text = text.strip().lower()
+    if text[:-1].isdigit() and text[-1:] == "s":
+        return float(text[:-1])     # the common case: whole seconds
+    if not text or text == "-":
+        return None
+    parts = _DURATION_PART.findall(text)
+    if not parts:
+        return None
+    return sum(float(value) * _UNITS[unit or None] for value, unit in parts)
+
+
+def parse_tokens(text: str) -> Optional[int]:
+    """27316 from "27,316"; None for "-" or anything else that is not a count."""
+    digits = text.strip().replace(",", "").replace("_", "")
+    return int(digits) if digits.isdigit() else None
+
+
+def parse_target(text: str) -> tuple[str, str]:
+    """("gemini", "code") from "Gemini (code)"; ("subagents", "") from "Explore subagent"."""
+    name, _, rest = text.partition("(")
+    specialist = rest.rstrip(") ").strip().lower()
+    if "subagent" in name.lower():
+        return "subagents", specialist
+    return tool_id(name) or "unknown", specialist
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# AGGREGATES
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class Histogram:
+    """Counts of durations in log-spaced buckets; quantiles to within a bucket's width."""
+
+    def __init__(self, counts: Optional[dict[int, int]] = None, total: float = 0.0, peak: float = 0.0) -> None:
+        self.counts = counts or {}
+        self.n = sum(self.counts.values())
+        self.total = total
+        self.peak = peak
+
+    def add(self, seconds: float) -> None:
+        bucket = math.floor(math.log2(seconds / _BASE) * _STEPS) if seconds > _BASE else -1
+        self.counts[bucket] = self.counts.get(bucket, 0) + 1
+        self.n += 1
+        self.total += seconds
+        self.peak = max(self.peak, seconds)
+
+    def merge(self, other: "Histogram") -> None:
+        for bucket, count in other.counts.items():
+            self.counts[bucket] = self.counts.get(bucket, 0) + count
+        self.n += other.n
+        self.total += other.total
+        self.peak = max(self.peak, other.peak)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.n:
+            return None
+        rank = max(1, math.ceil(q * self.n))
+        seen = 0
+        for bucket in sorted(self.counts):
+            seen += self.counts[bucket]
+            if seen >= rank:
+                if bucket < 0:
+                    return 0.0
+                # The bucket's geometric middle, never past the largest value seen
+                return min(self.peak, _BASE * 2 ** ((bucket + 0.5) / _STEPS))
+        return self.peak
+
+    def to_json(self) -> dict:
+        return {"counts": {str(k): v for k, v in self.counts.items()}, "total": self.total, "peak": self.peak}
+
+    @classmethod
+    def from_json(cls, data: dict) -> "Histogram":
+        return cls({int(k): v for k, v in data["counts"].items()}, data["total"], data["peak"])
+
+
+class Stats:
+    """Running totals for one group of log rows."""
+
+    def __init__(self) -> None:
+        self.rows = 0
+        self.dispatches = 0
+        self.retries = 0
+        self.tokens = 0
+        self.outcomes: dict[str, int] = {}
+        self.durations = Histogram()
+
+    def add(self, action: str, tokens: Optional[int], seconds: Optional[float], outcome: str) -> None:
+        self.rows += 1
+        if action == "dispatch":
+            self.dispatches += 1
+        elif action == "retry":
+            self.retries += 1
+        if tokens is not None:
+            self.tokens += tokens
+        if seconds is not None:
+            self.durations.add(seconds)
+        if outcome:
+            self.outcomes[outcome] = self.outcomes.get(outcome, 0) + 1
+
+    def merge(self, other: "Stats") -> "Stats":
+        self.rows += other.rows
+        self.dispatches += other.dispatches
+        self.retries += other.retries
+        self.tokens += other.tokens
+        for outcome, count in other.outcomes.items():
+            self.outcomes[outcome] = self.outcomes.get(outcome, 0) + count
+        self.durations.merge(other.durations)
+        return self
+
+    def summary(self) -> dict:
+        """The JSON the report consumes; durations in seconds."""
+        def rounded(value: Optional[float]) -> Optional[float]:
+            return None if value is None else round(value, 3)
+
+        return {
+            "rows": self.rows,
+            "dispatches": self.dispatches,
+            "retries": self.retries,
+            "retry_rate": round(self.retries / self.dispatches, 4) if self.dispatches else None,
+            "tokens": self.tokens,
+            "outcomes": dict(sorted(self.outcomes.items())),
+            "duration": {
+                "count": self.durations.n,
+                "total": rounded(self.durations.total),
+                "p50": rounded(self.durations.quantile(0.5)),
+                "p95": rounded(self.durations.quantile(0.95)),
+                "max": rounded(self.durations.peak) if self.durations.n else None,
+            },
+        }
+
+    def to_json(self) -> dict:
+        return {"rows": self.rows, "dispatches": self.dispatches, "retries": self.retries, "tokens": self.tokens,
+                "outcomes": self.outcomes, "durations": self.durations.to_json()}
+
+    @classmethod
+    def from_json(cls, data: dict) -> "Stats":
+        stats = cls()
+        stats.rows, stats.dispatches, stats.retries = data["rows"], data["dispatches"], data["retries"]
+        stats.tokens, stats.outcomes = data["tokens"], data["outcomes"]
+        stats.durations = Histogram.from_json(data["durations"])
+        return stats
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# SCANNER
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+# Columns read from a log table, in the order LogScanner._columns holds their indexes
+_COLUMNS = ("action", "target", "tokens", "duration", "outcome")
+
+
+class LogScanner:
+    """Reads log lines in order, keeping only the aggregates and the current table's layout.
+
+    Each row is added to one cell, (session, tool, specialist); the per-session,
+    per-tool and per-specialist totals are merged from the cells when reported.
+    """
+
+    def __init__(self) -> None:
+        self.offset = 0                 # bytes of the log consumed (whole lines only)
+        self.rows = 0
+        self.sessions: list[dict] = []  # {"session", "goal"} in log order
+        self.cells: dict[tuple[int, str, str], Stats] = {}
+        self._columns: Optional[list[int]] = None     # index of each of _COLUMNS in the current table, or -1
+        self._in_table = False          # the previous line was a table line
+
+    def scan(self, f) -> int:
+        """Consume a binary file from self.offset to its last complete line; returns rows added."""
+        before = self.rows
+        f.seek(self.offset)
+        for line in f:
+            if not line.endswith(b"\n"):
+                break       # still being appended; the next scan picks it up
+            self.offset += len(line)
+            self.feed(line)
+        return self.rows - before
+
+    def feed(self, line: bytes) -> None:
+        stripped = line.strip()
+        if not stripped.startswith(b"|"):
+            self._in_table = False
+            if stripped.startswith(b"#"):
+                match = _SESSION.match(stripped)
+                if match:
+                    self.sessions.append({"session": match.group(1).decode("utf-8", "replace"), "goal": ""})
+                self._columns = None
+            elif self.sessions and not self.sessions[-1]["goal"]:
+                match = _GOAL.match(stripped)
+                if match:
+                    self.sessions[-1]["goal"] = match.group(1).decode("utf-8", "replace")
+            return
+
+        cells = split_row(stripped.decode("utf-8", "replace"))
+        if not self._in_table:
+            # A table's first line is its header; tables without Action and Target (Totals) are skipped
+            self._in_table = True
+            names = [c.lower() for c in cells]
+            self._columns = ([names.index(c) if c in names else -1 for c in _COLUMNS]
+                             if "action" in names and "target" in names else None)
+            return
+        if self._columns is None or cells[0].startswith("-") or cells[0].startswith(":"):
+            return      # another table, or the |---|---| separator
+        self._add(cells)
+
+    def _add(self, cells: list[str]) -> None:
+        action, target, tokens, duration, outcome = (cells[i] if 0 <= i < len(cells) else ""
+                                                     for i in self._columns)
+        tool, specialist = parse_target(target)
+        if not self.sessions:
+            self.sessions.append({"session": "", "goal": ""})
+        key = (len(self.sessions) - 1, tool, specialist)
+        stats = self.cells.get(key)
+        if stats is None:
+            stats = self.cells[key] = Stats()
+        stats.add(action.lower(), parse_tokens(tokens), parse_duration(duration), outcome.lower())
+        self.rows += 1
+
+    def report(self) -> dict:
+        sessions = [Stats() for _ in self.sessions]
+        pairs: dict[tuple[str, str], Stats] = {}
+        for (session, tool, specialist), stats in self.cells.items():
+            sessions[session].merge(stats)
+            pairs.setdefault((tool, specialist), Stats()).merge(stats)
+        # Far fewer (tool, specialist) pairs than cells: total the rest from them
+        total = Stats()
+        tools: dict[str, Stats] = {}
+        specialists: dict[str, Stats] = {}
+        for (tool, specialist), stats in pairs.items():
+            total.merge(stats)
+            tools.setdefault(tool, Stats()).merge(stats)
+            if specialist:
+                specialists.setdefault(specialist, Stats()).merge(stats)
+        return {
+            "rows": self.rows,
+            "total": total.summary(),
+            "sessions": [{**s, **stats.summary()} for s, stats in zip(self.sessions, sessions)],
+            "tools": {name: stats.summary() for name, stats in sorted(tools.items())},
+            "specialists": {name: stats.summary() for name, stats in sorted(specialists.items())},
+        }
+
+    # ── Index ──────────────────────────────────────────────────────────────────
+
+    def to_json(self) -> dict:
+        return {
+            "offset": self.offset,
+            "rows": self.rows,
+            "sessions": self.sessions,
+            "cells": [[*key, stats.to_json()] for key, stats in self.cells.items()],
+            "columns": self._columns,
+            "in_table": self._in_table,
+        }
+
+    @classmethod
+    def from_json(cls, data: dict) -> "LogScanner":
+        scanner = cls()
+        scanner.offset, scanner.rows, scanner.sessions = data["offset"], data["rows"], data["sessions"]
+        scanner.cells = {(session, tool, specialist): Stats.from_json(stats)
+                         for session, tool, specialist, stats in data["cells"]}
+        scanner._columns = data["columns"]
+        scanner._in_table = data["in_table"]
+        return scanner
+
+
+def _fingerprint(f, offset: int) -> str:
+    """Hash of the log's first bytes and of the bytes just before offset."""
+    digest = hashlib.sha256()
+    f.seek(0)
+    digest.update(f.read(min(offset, _FINGERPRINT)))
+    f.seek(max(0, offset - _FINGERPRINT))
+    digest.update(f.read(offset - max(0, offset - _FINGERPRINT)))
+    return digest.hexdigest()
+
+
+def analyze(root: Path, use_index: bool = True) -> dict:
+    """The report JSON for a project's execution log; raises FileNotFoundError if there is none.
+
+    Adds "new_rows" (rows read this time) and "resumed" (whether the index was used).
+    """
+    root = Path(root)
+    log = root / LOG_FILE
+    index = root / LOG_INDEX
+    with open(log, "rb") as f:
+        scanner, resumed = None, False
+        if use_index:
+            try:
+                data = json.loads(index.read_bytes())
+                size = f.seek(0, 2)
+                if (data.get("version") == INDEX_VERSION and data["scanner"]["offset"] <= size
+                        and data["fingerprint"] == _fingerprint(f, data["scanner"]["offset"])):
+                    scanner, resumed = LogScanner.from_json(data["scanner"]), True
+            except (OSError, ValueError, KeyError, TypeError):
+                pass    # no index, or one from another version: start over
+        if scanner is None:
+            scanner = LogScanner()
+        new_rows = scanner.scan(f)
+        fingerprint = _fingerprint(f, scanner.offset)
+
+    if use_index and (new_rows or not resumed):
+        state = {"version": INDEX_VERSION, "fingerprint": fingerprint, "scanner": scanner.to_json()}
+        try:
+            atomic_write_bytes(index, json.dumps(state, separators=(",", ":")).encode())
+        except OSError:
+            pass    # a read-only checkout still gets its report
+    return {"log": str(log), **scanner.report(), "new_rows": new_rows, "resumed": resumed}
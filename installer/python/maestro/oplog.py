@@ -0,0 +1,152 @@
+"""
+Nexus-AI Maestro - Operations log for the state file
+
+Several writers (parallel dispatchers, a hub, spokes reporting back) change
+task statuses in `.ai/MAESTRO.md` at once; each rewriting the whole file
+from what it read a moment ago loses the others' changes. Instead, status
+transitions are appended to `.ai/MAESTRO.ops`, one line each:
+
+    2026-01-16T14:30:05Z<TAB>3<TAB>done<TAB>nexus-ai maestro run
+
+under an advisory lock on `.ai/MAESTRO.md.lock`. Compaction, under the same
+lock, folds the log into the Tasks table (the last transition of a task
+wins), replaces the state file, and then replaces the log with an empty one.
+It runs when the log passes COMPACT_BYTES and whenever asked for.
+
+Readers take no lock. Both files are only ever replaced by rename, never
+rewritten in place, so a reader that opens the state file and then the log,
+and finds the state file was not replaced in between, holds a consistent
+pair: at worst a log that was already folded in, and replaying it again
+gives the same table.
+"""
+
+import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from installer.python.fileops import atomic_write_bytes, file_lock
+from installer.python.maestro.state import STATE_FILE, STATUSES, TaskStore, set_status
+
+OPS_FILE = ".ai/MAESTRO.ops"
+
+# Compact once the log is this big (about 400 transitions)
+COMPACT_BYTES = 16 * 1024
+
+# Attempts at a consistent read before giving up (each retry means a compaction just ran)
+_SNAPSHOT_TRIES = 100
+
+
+@dataclass
+class Op:
+    task_id: int
+    status: str
+    time: str = ""      # UTC, ISO 8601
+    actor: str = ""
+
+
+@dataclass
+class Snapshot:
+    text: str           # the state file with the pending transitions applied
+    pending: int        # transitions in the log that are not compacted yet
+
+
+def format_op(op: Op) -> str:
+    actor = " ".join(op.actor.split())     # no tabs or newlines in a field
+    return f"{op.time}\t{op.task_id}\t{op.status}\t{actor}\n"
+
+
+def parse_ops(data: bytes) -> list[Op]:
+    """The complete, well-formed lines of a log (a torn or hand-mangled line is skipped)."""
+    ops = []
+    for line in data.decode("utf-8", errors="replace").split("\n")[:-1]:
+        fields = line.split("\t")
+        if len(fields) < 3 or fields[2] not in STATUSES:
+            continue
+        try:
+            ops.append(Op(int(fields[1]), fields[2], fields[0], fields[3] if len(fields) > 3 else ""))
+        except ValueError:
+            continue
+    return ops
+
+
+def _changes(ops: list[Op]) -> dict[int, str]:
+    return {op.task_id: op.status for op in ops}
+
+
+class StateFile:
+    """A project's `.ai/MAESTRO.md` and its operations log."""
+
+    def __init__(self, root: Path, compact_bytes: int = COMPACT_BYTES) -> None:
+        self.root = Path(root)
+        self.path = self.root / STATE_FILE
+        self.ops_path = self.root / OPS_FILE
+        self.compact_bytes = compact_bytes
+
+    def append(self, changes: dict[int, str], actor: str = "") -> None:
+        """Record status transitions (task id -> status); compacts when the log is big enough."""
+        for status in changes.values():
+            if status not in STATUSES:
+                raise ValueError(f"unknown status {status!r}")
+        if not changes:
+            return
+        now = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        data = "".join(format_op(Op(task_id, status, now, actor)) for task_id, status in changes.items()).encode()
+        with file_lock(self.path):
+            # Opened under the lock: a compaction may have just replaced the log
+            fd = os.open(self.ops_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o666)
+            try:
+                os.write(fd, data)      # one write, so a lock-free reader sees whole lines or none
+                size = os.fstat(fd).st_size
+            finally:
+                os.close(fd)
+            if size >= self.compact_bytes:
+                self._compact()
+
+    def compact(self) -> int:
+        """Fold the log into the Tasks table; returns how many transitions it held."""
+        with file_lock(self.path):
+            return self._compact()
+
+    def _compact(self) -> int:
+        try:
+            data = self.ops_path.read_bytes()
+        except FileNotFoundError:
+            return 0
+        if not data:
+            return 0
+        ops = parse_ops(data)
+        if ops:
+            text = self.path.read_text(encoding="utf-8")
+            now = time.strftime("%Y-%m-%d %H:%M UTC", time.gmtime())
+            # Transitions of tasks removed from the table since are dropped
+            atomic_write_bytes(self.path, set_status(text, _changes(ops), now, strict=False).encode("utf-8"))
+        # After the state file: a reader that sees the new log also sees the new state file
+        atomic_write_bytes(self.ops_path, b"")
+        return len(ops)
+
+    def snapshot(self) -> Snapshot:
+        """The current table, pending transitions included, without taking the lock."""
+        for _ in range(_SNAPSHOT_TRIES):
+            with open(self.path, "rb") as state:
+                ops_file: Optional[BinaryIO] = None
+                try:
+                    ops_file = open(self.ops_path, "rb")
+                except FileNotFoundError:
+                    pass
+                try:
+                    if os.fstat(state.fileno()).st_ino != os.stat(self.path).st_ino:
+                        continue    # compacted between the two opens; this log may be the next one
+                    text = state.read().decode("utf-8")
+                    ops = parse_ops(ops_file.read()) if ops_file else []
+                finally:
+                    if ops_file:
+                        ops_file.close()
+            if ops:
+                text = set_status(text, _changes(ops), strict=False)
+            return Snapshot(text, len(ops))
+        raise OSError(f"{self.path} kept changing while it was read")
+
+    def load(self) -> TaskStore:
+        return TaskStore.parse(self.snapshot().text)
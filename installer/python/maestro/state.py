@@ -0,0 +1,456 @@
+"""
+Nexus-AI Maestro - State file engine
+
+Parses the Tasks table of `.ai/MAESTRO.md` (features/maestro/docs/
+STATE-FILE-SPEC.md) into a column store: one array per field, tool and
+specialist names interned to small codes, and dependencies in CSR form (an
+offsets array into one flat array of row indices). Queries run on the arrays:
+
+    ready()            pending tasks whose dependencies are all done
+    find_cycle()       a dependency cycle, if there is one
+    topo_order()       task ids, dependencies first
+    critical_path()    the longest chain of unfinished work
+
+`update(text)` re-parses only the rows whose lines changed. A status change,
+which is what the hub writes after every task, patches that row in place and
+keeps the dependency graph; other edits rebuild the arrays from the rows
+that are already parsed. `set_status()` goes the other way: it rewrites the
+Status cells of a few rows and leaves the rest of the text alone (oplog.py
+writes the file with it).
+"""
+
+import re
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+
+STATE_FILE = ".ai/MAESTRO.md"
+LOG_FILE = ".ai/MAESTRO-LOG.md"
+
+STATUSES = ("pending", "running", "done", "failed", "blocked")
+PENDING, RUNNING, DONE, FAILED, BLOCKED = range(len(STATUSES))
+_STATUS_CODES = {name: code for code, name in enumerate(STATUSES)}
+
+# Table columns (the spec's header names, lowercased), in the order parse_row reads them
+FIELDS = ("id", "description", "status", "specialist", "tool", "depends")
+_REQUIRED = ("id", "status", "depends")
+
+# A dependency on an id that is not in the table; never satisfied
+MISSING = -1
+
+_TASKS_HEADING = re.compile(r"^##\s+Tasks\s*$")
+_CELL_SPLIT = re.compile(r"(?<!\\)\|")
+_DEP_ID = re.compile(r"\d+")
+
+
+class StateFileError(ValueError):
+    """The state file has no readable Tasks table."""
+
+
+class CycleError(ValueError):
+    """The dependencies contain a cycle."""
+
+    def __init__(self, cycle: list[int]) -> None:
+        super().__init__("dependency cycle: " + " -> ".join(str(i) for i in cycle + cycle[:1]))
+        self.cycle = cycle
+
+
+@dataclass
+class Task:
+    id: int
+    description: str
+    status: str
+    specialist: str
+    tool: str
+    depends: list[int]
+
+
+@dataclass
+class _Row:
+    """One parsed table line, before it is packed into the arrays."""
+    id: int
+    description: str
+    status: int
+    specialist: str
+    tool: str
+    depends: tuple[int, ...]
+    problem: str = ""
+
+
+def tool_id(name: str) -> str:
+    """"Gemini CLI" / "Gemini" -> "gemini", "Claude Code" -> "claude"; the installer's tool ids."""
+    words = name.strip().lower().split()
+    return words[0] if words else ""
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# PARSING
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def split_row(line: str) -> list[str]:
+    """Cells of a markdown table line (`\\|` is a literal pipe)."""
+    line = line.strip()
+    escaped = "\\|" in line
+    cells = _CELL_SPLIT.split(line) if escaped else line.split("|")
+    if cells and cells[0] == "":
+        cells = cells[1:]
+    if cells and cells[-1] == "":
+        cells = cells[:-1]
+    if escaped:
+        return [c.strip().replace("\\|", "|") for c in cells]
+    return [c.strip() for c in cells]
+
+
+def find_header(lines: list[str]) -> tuple[int, tuple[int, ...]]:
+    """(first row line, column of each of FIELDS or -1) of the Tasks table."""
+    heading = next((i for i, line in enumerate(lines) if _TASKS_HEADING.match(line)), None)
+    if heading is None:
+        raise StateFileError("no '## Tasks' section")
+    header = heading + 1
+    while header < len(lines) and not lines[header].lstrip().startswith("|"):
+        if lines[header].startswith("#"):
+            raise StateFileError("the '## Tasks' section has no table")
+        header += 1
+    if header + 1 >= len(lines):
+        raise StateFileError("the '## Tasks' section has no table")
+    names = [name.lower() for name in split_row(lines[header])]
+    missing = [name for name in _REQUIRED if name not in names]
+    if missing:
+        raise StateFileError(f"Tasks table has no {', '.join(missing)} column")
+    return header + 2, tuple(names.index(field) if field in names else -1 for field in FIELDS)  # skip |---|
+
+
+def find_table(lines: list[str]) -> tuple[int, int, tuple[int, ...]]:
+    """(first row line, end line, column of each of FIELDS or -1) of the Tasks table."""
+    start, columns = find_header(lines)
+    end = next((i for i in range(start, len(lines))
+                if lines[i][:1] != "|" and not lines[i].lstrip().startswith("|")), len(lines))
+    return start, end, columns
+
+
+def parse_row(line: str, columns: tuple[int, ...]) -> _Row:
+    cells = split_row(line)
+    count = len(cells)
+    cells.append("")    # what absent columns (-1) and short rows read
+    raw_id, description, raw_status, specialist, tool, depends = (cells[i] if i < count else "" for i in columns)
+
+    problem = ""
+    try:
+        task_id = int(raw_id)
+    except ValueError:
+        task_id = 0
+        problem = f"bad task id {raw_id!r}"
+    status = _STATUS_CODES.get(raw_status.lower())
+    if status is None:
+        problem = problem or f"unknown status {raw_status!r}"
+        status = BLOCKED
+    deps = () if depends in ("", "-") else tuple(map(int, _DEP_ID.findall(depends)))
+    return _Row(task_id, description, status, specialist, tool, deps, problem)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# TASK STORE
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class TaskStore:
+    """The Tasks table as parallel arrays, indexed by row."""
+
+    def __init__(self) -> None:
+        self.ids = array("q")
+        self.status = array("b")
+        self.tool = array("h")          # code into self.tool_names
+        self.specialist = array("h")    # code into self.specialist_names
+        self.descriptions: list[str] = []
+        self.dep_offsets = array("q", [0])  # row i's dependencies: deps[dep_offsets[i]:dep_offsets[i + 1]]
+        self.deps = array("q")          # row indices, or MISSING
+        self.tool_names: list[str] = []
+        self.specialist_names: list[str] = []
+        self.index: dict[int, int] = {}     # task id -> row
+        self.problems: list[str] = []
+        self.lines: list[str] = []          # raw table rows, for incremental re-parse
+        self.line_start = 0                 # file line number of the first row
+        self._columns: tuple[int, ...] = ()
+        self._rows: list[_Row] = []
+        self._interned: dict[str, dict[str, int]] = {"tool": {}, "specialist": {}}
+        self._order: Optional[list[int]] = None     # cached topo order (rows)
+
+    @classmethod
+    def parse(cls, text: str) -> "TaskStore":
+        store = cls()
+        store.update(text)
+        return store
+
+    @classmethod
+    def load(cls, path: Path) -> "TaskStore":
+        return cls.parse(Path(path).read_text(encoding="utf-8"))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[Task]:
+        return (self.task_at(row) for row in range(len(self.ids)))
+
+    def task(self, task_id: int) -> Task:
+        return self.task_at(self.index[task_id])
+
+    def task_at(self, row: int) -> Task:
+        return Task(
+            self.ids[row],
+            self.descriptions[row],
+            STATUSES[self.status[row]],
+            self.specialist_names[self.specialist[row]],
+            self.tool_names[self.tool[row]],
+            [self.ids[d] if d != MISSING else self._rows[row].depends[k]
+             for k, d in enumerate(self.deps[self.dep_offsets[row]:self.dep_offsets[row + 1]])],
+        )
+
+    def dependencies(self, row: int) -> array:
+        return self.deps[self.dep_offsets[row]:self.dep_offsets[row + 1]]
+
+    def counts(self) -> dict[str, int]:
+        counts = dict.fromkeys(STATUSES, 0)
+        for code in self.status:
+            counts[STATUSES[code]] += 1
+        return counts
+
+    # ── Parsing ────────────────────────────────────────────────────────────────
+
+    def update(self, text: str) -> int:
+        """Bring the store up to date with `text`; returns how many rows were re-parsed."""
+        lines = text.splitlines()
+        start, end, columns = find_table(lines)
+        rows = lines[start:end]
+        self.line_start = start
+
+        if columns == self._columns and len(rows) == len(self.lines):
+            changed = [i for i, (old, new) in enumerate(zip(self.lines, rows)) if old != new]
+            parsed = [parse_row(rows[i], columns) for i in changed]
+            if all(p.id == self._rows[i].id and p.depends == self._rows[i].depends and not p.problem
+                   and not self._rows[i].problem for i, p in zip(changed, parsed)):
+                for i, row in zip(changed, parsed):
+                    self._patch(i, row)
+                    self.lines[i] = rows[i]
+                return len(changed)
+
+        # Rows whose lines are unchanged are reused without parsing
+        known = {line: row for line, row in zip(self.lines, self._rows)} if columns == self._columns else {}
+        reparsed = 0
+        new_rows = []
+        for line in rows:
+            row = known.get(line)
+            if row is None:
+                row = parse_row(line, columns)
+                reparsed += 1
+            new_rows.append(row)
+        self._columns = columns
+        self.lines = rows
+        self._build(new_rows)
+        return reparsed
+
+    def _patch(self, i: int, row: _Row) -> None:
+        self._rows[i] = row
+        self.status[i] = row.status
+        self.tool[i] = self._intern("tool", row.tool)
+        self.specialist[i] = self._intern("specialist", row.specialist)
+        self.descriptions[i] = row.description
+
+    def _intern(self, kind: str, name: str) -> int:
+        table = self._interned[kind]
+        code = table.get(name)
+        if code is None:
+            names = self.tool_names if kind == "tool" else self.specialist_names
+            code = table[name] = len(names)
+            names.append(name)
+        return code
+
+    def _build(self, rows: list[_Row]) -> None:
+        self._rows = rows
+        self.problems = []
+        self.index = {}
+        for i, row in enumerate(rows):
+            if row.problem:
+                self.problems.append(f"line {self.line_start + i + 1}: {row.problem}")
+            if row.id in self.index:
+                self.problems.append(f"line {self.line_start + i + 1}: duplicate task id {row.id}")
+                continue
+            self.index[row.id] = i
+        self.ids = array("q", (row.id for row in rows))
+        self.status = array("b", (row.status for row in rows))
+        self.tool = array("h", (self._intern("tool", row.tool) for row in rows))
+        self.specialist = array("h", (self._intern("specialist", row.specialist) for row in rows))
+        self.descriptions = [row.description for row in rows]
+
+        offsets = array("q", [0])
+        deps = array("q")
+        index = self.index
+        for i, row in enumerate(rows):
+            for dep in row.depends:
+                target = index.get(dep, MISSING)
+                if target == MISSING:
+                    self.problems.append(f"task {row.id} depends on unknown task {dep}")
+                deps.append(target)
+            offsets.append(len(deps))
+        self.dep_offsets = offsets
+        self.deps = deps
+        self._order = None
+
+    # ── Graph queries ──────────────────────────────────────────────────────────
+
+    def _topo_rows(self) -> tuple[list[int], list[int]]:
+        """(rows in dependency order, rows left over because they are on or behind a cycle)."""
+        if self._order is not None:
+            return self._order, []
+        n = len(self.ids)
+        # Plain lists for the loops: indexing an array boxes a new int every time
+        offsets = self.dep_offsets.tolist()
+        deps = self.deps.tolist()
+        waiting = [0] * n
+        dependents: list[list[int]] = [[] for _ in range(n)]
+        for row in range(n):
+            for dep in deps[offsets[row]:offsets[row + 1]]:
+                if dep != MISSING:  # unknown dependencies are reported as problems, not edges
+                    waiting[row] += 1
+                    dependents[dep].append(row)
+        order = [row for row in range(n) if not waiting[row]]
+        for row in order:   # grows while iterating
+            for dependent in dependents[row]:
+                waiting[dependent] -= 1
+                if not waiting[dependent]:
+                    order.append(dependent)
+        if len(order) == n:
+            self._order = order
+            return order, []
+        return order, [row for row in range(n) if waiting[row] > 0]
+
+    def find_cycle(self) -> Optional[list[int]]:
+        """Task ids forming one dependency cycle (each depends on the next), or None."""
+        _, left = self._topo_rows()
+        if not left:
+            return None
+        remaining = set(left)
+        # Every leftover row depends on another leftover row, so walking dependencies must repeat
+        row = left[0]
+        seen: dict[int, int] = {}
+        path = []
+        while row not in seen:
+            seen[row] = len(path)
+            path.append(row)
+            row = next(d for d in self.dependencies(row) if d in remaining)
+        return [self.ids[r] for r in path[seen[row]:]]
+
+    def topo_order(self) -> list[int]:
+        """Task ids with every task after its dependencies; raises CycleError."""
+        order, left = self._topo_rows()
+        if left:
+            raise CycleError(self.find_cycle())
+        return [self.ids[row] for row in order]
+
+    def ready(self) -> list[int]:
+        """Ids of pending tasks whose dependencies are all done, in table order."""
+        status = self.status.tolist()
+        offsets = self.dep_offsets.tolist()
+        deps = self.deps.tolist()
+        ready = []
+        for row in range(len(status)):
+            if status[row] != PENDING:
+                continue
+            for dep in deps[offsets[row]:offsets[row + 1]]:
+                if dep == MISSING or status[dep] != DONE:
+                    break
+            else:
+                ready.append(self.ids[row])
+        return ready
+
+    def critical_path(self, weight: Optional[Callable[[Task], float]] = None) -> list[int]:
+        """Ids of the longest chain of unfinished tasks (by `weight`, default 1 each), first task first.
+
+        Done tasks weigh nothing and are left out. Raises CycleError.
+        """
+        order, left = self._topo_rows()
+        if left:
+            raise CycleError(self.find_cycle())
+        n = len(self.ids)
+        if not n:
+            return []
+        cost = [0.0] * n
+        best = [0.0] * n
+        prev = [-1] * n
+        status = self.status.tolist()
+        for row in range(n):
+            if status[row] != DONE:
+                cost[row] = weight(self.task_at(row)) if weight else 1.0
+        offsets = self.dep_offsets.tolist()
+        deps = self.deps.tolist()
+        for row in order:
+            top, via = 0.0, -1
+            for dep in deps[offsets[row]:offsets[row + 1]]:
+                if dep != MISSING and best[dep] > top:
+                    top, via = best[dep], dep
+            best[row] = top + cost[row]
+            prev[row] = via
+        end = max(range(n), key=best.__getitem__)
+        if best[end] == 0:
+            return []
+        path = []
+        while end != -1:
+            if status[end] != DONE:
+                path.append(self.ids[end])
+            end = prev[end]
+        return path[::-1]
+
+
+def load_state(root: Path = Path(".")) -> TaskStore:
+    """The Tasks table of the state file under a project root."""
+    return TaskStore.load(Path(root) / STATE_FILE)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# WRITING
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+_SOURCE_HEADING = re.compile(r"^##\s+Source\s*$")
+_SOURCE_TIME = re.compile(r"\d{4}-\d{2}-\d{2} \d{2}:\d{2} UTC")
+
+
+def set_status(text: str, changes: dict[int, str], now: Optional[str] = None, strict: bool = True) -> str:
+    """`text` with the Status cell of each task in `changes` (id -> status) replaced.
+
+    Only that cell changes, so the rest of the row keeps its formatting and
+    TaskStore.update() sees a status-only edit. The Source timestamp is set
+    to `now` ("YYYY-MM-DD HH:MM UTC") when given. Ids not in the table raise
+    KeyError, or are skipped if not `strict`.
+    """
+    for status in changes.values():
+        if status not in _STATUS_CODES:
+            raise ValueError(f"unknown status {status!r}")
+    lines = text.splitlines(keepends=True)
+    start, columns = find_header(lines)     # line ends do not matter to it
+    column = columns[FIELDS.index("status")]
+    id_column = columns[FIELDS.index("id")]
+    left = dict(changes)
+    for i in range(start, len(lines)):
+        line = lines[i]
+        if not left or line[:1] != "|" and not line.lstrip().startswith("|"):
+            break
+        # Find the id with a plain split first; most rows are not in `changes`
+        cells = _CELL_SPLIT.split(line, id_column + 2) if "\\" in line else line.split("|", id_column + 2)
+        try:
+            status = left.pop(int(cells[id_column + 1]), None)
+        except (IndexError, ValueError):
+            continue
+        if status is None:
+            continue
+        pipes = [m.start() for m in _CELL_SPLIT.finditer(line)]
+        if len(pipes) <= column + 1:
+            continue    # a short row; parse_row reports it
+        lines[i] = f"{line[:pipes[column] + 1]} {status} {line[pipes[column + 1]:]}"
+    if left and strict:
+        raise KeyError(f"no task {', '.join(map(str, sorted(left)))} in the Tasks table")
+
+    if now:
+        for i, line in enumerate(lines[:-1]):
+            if _SOURCE_HEADING.match(line.rstrip()):
+                lines[i + 1] = _SOURCE_TIME.sub(now, lines[i + 1], count=1)
+                break
+    return "".join(lines)
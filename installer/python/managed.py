@@ -0,0 +1,301 @@
+"""
+Nexus-AI Installer - Managed config blocks
+
+Rewrites the `<!-- Nexus-AI:START -->` ... `<!-- Nexus-AI:END -->` block in
+CLAUDE.md / GEMINI.md / AGENTS.md. The destination is memory-mapped and
+scanned once for the markers; the user content before and after the block is
+streamed into a temp file that is renamed into place, so memory use does not
+grow with the size of the user's file. Nothing is written when the new block
+is byte-identical to the old one.
+
+Inside the block each feature has its own sub-section tagged with the sha256
+of its source config:
+
+    <!-- Nexus-AI:FEATURE <feature> sha256=<hash> -->
+    ...
+    <!-- Nexus-AI:FEATURE-END <feature> -->
+
+A section whose hash is unchanged is carried over as-is, so installing,
+updating or removing one feature only reads and renders that feature.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+from pathlib import Path
+
+from installer.python.fileops import atomic_writer
+from installer.python.manifest import sha256_file
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, Collection, Optional
+
+START_MARKER = "<!-- Nexus-AI:START -->"
+END_MARKER = "<!-- Nexus-AI:END -->"
+
+FEATURE_START = "<!-- Nexus-AI:FEATURE {feature} sha256={sha256} -->"
+FEATURE_END = "<!-- Nexus-AI:FEATURE-END {feature} -->"
+
+_SECTION_START_RE = re.compile(
+    rb"<!-- Nexus-AI:FEATURE (?P<feature>[^\s>]+) sha256=(?P<sha256>[0-9a-f]{64}) -->\n"
+)
+
+_CHUNK = 1024 * 1024
+
+
+class Section:
+    """One feature's config source; sha256 is the source file's hash (from the catalog).
+
+    `data` holds the source bytes when they were already read (fleet installs).
+    """
+    __slots__ = ("feature", "src", "sha256", "data")
+
+    def __init__(self, feature: str, src: Path, sha256: str, data: Optional[bytes] = None) -> None:
+        self.feature = feature
+        self.src = src
+        self.sha256 = sha256
+        self.data = data
+
+    @classmethod
+    def from_path(cls, src: Path) -> "Section":
+        return cls(src.stem, src, sha256_file(src) if src.exists() else "")
+
+
+def render_section(section: Section) -> bytes:
+    """A feature's tagged sub-block, or b"" if its source is missing or empty."""
+    if section.data is not None:
+        content = section.data.decode("utf-8").strip()
+    elif section.src.exists():
+        content = section.src.read_text(encoding="utf-8").strip()
+    else:
+        return b""
+    if not content:
+        return b""
+    return "\n".join([
+        FEATURE_START.format(feature=section.feature, sha256=section.sha256),
+        content,
+        FEATURE_END.format(feature=section.feature),
+    ]).encode("utf-8")
+
+
+def parse_sections(block: bytes) -> dict[str, tuple[str, bytes]]:
+    """feature -> (sha256, sub-block bytes) for every tagged section in a managed block."""
+    sections = {}
+    pos = 0
+    while True:
+        # Match only the header; bytes.find locates the end tag far faster than a lazy .*? would
+        m = _SECTION_START_RE.search(block, pos)
+        if m is None:
+            return sections
+        feature = m.group("feature")
+        end_tag = b"\n" + FEATURE_END.format(feature=feature.decode()).encode()
+        end = block.find(end_tag, m.end())
+        if end == -1:
+            pos = m.end()
+            continue
+        end += len(end_tag)
+        sections[feature.decode()] = (m.group("sha256").decode(), block[m.start():end])
+        pos = end
+
+
+def read_sections(path: Path) -> dict[str, tuple[str, bytes]]:
+    """parse_sections for the managed block in a config file ({} if it has none)."""
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return {}
+    start, end = find_block(data)
+    return parse_sections(data[start:end]) if start != -1 else {}
+
+
+def build_managed_block(sections: list[Section], existing: bytes = b"", refresh: Collection[str] = (),
+                        only: Optional[Collection[str]] = None) -> bytes:
+    """Assemble the managed block (empty if there is nothing to merge).
+
+    Sections whose hash matches the one already in `existing` are reused
+    verbatim without reading their source file, unless their feature is in
+    `refresh` (the section was edited in place). With `only`, just those
+    features' sections change (replaced by `sections`, or dropped if it has
+    none); every other section in `existing` is kept in place, and new ones
+    are appended. Without it the block holds exactly `sections`.
+    """
+    current = parse_sections(existing) if existing else {}
+    parts = []
+
+    def add(section: Section) -> None:
+        old = current.get(section.feature)
+        if old is not None and section.sha256 and old[0] == section.sha256 and section.feature not in refresh:
+            parts.append(old[1])
+            return
+        rendered = render_section(section)
+        if rendered:
+            parts.append(rendered)
+
+    if only is not None:
+        selected = {section.feature: section for section in sections}
+        for feature, (_, old) in current.items():
+            if feature in selected:
+                add(selected.pop(feature))
+            elif feature not in only:
+                parts.append(old)
+        sections = list(selected.values())
+    for section in sections:
+        add(section)
+
+    if not parts:
+        return b""
+
+    return _assemble(parts)
+
+
+def _assemble(parts: list[bytes]) -> bytes:
+    header = f"{START_MARKER}\n# Global Instructions\n\n".encode()
+    return header + b"\n\n".join(parts) + f"\n{END_MARKER}".encode()
+
+
+def find_block(buf, start_marker: bytes = START_MARKER.encode(),
+               end_marker: bytes = END_MARKER.encode()) -> tuple[int, int]:
+    """(start, end) byte offsets of the managed block in buf, or (-1, -1)."""
+    start = buf.find(start_marker)
+    if start == -1:
+        return -1, -1
+    end = buf.find(end_marker, start + len(start_marker))
+    if end == -1:
+        return -1, -1
+    return start, end + len(end_marker)
+
+
+def managed_config_action(dst_path: Path, sections: list[Section], only: Optional[Collection[str]] = None) -> str:
+    """What write_managed_config would do: "create", "overwrite" or "skip" (no write)."""
+    dst_path = Path(os.path.realpath(dst_path))
+    try:
+        f = open(dst_path, "rb")
+    except FileNotFoundError:
+        return "create" if build_managed_block(sections) else "skip"
+
+    with f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return "overwrite" if build_managed_block(sections) else "skip"
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start, end = find_block(mm)
+            existing = mm[start:end] if start != -1 else b""
+            block = build_managed_block(sections, existing, only=only)
+            return "skip" if not block or block == existing else "overwrite"
+
+
+def write_managed_config(dst_path: Path, sections: list,
+                         on_write: Optional[Callable[[Path], None]] = None, refresh: Collection[str] = (),
+                         only: Optional[Collection[str]] = None) -> bool:
+    """Rebuild the managed block from per-feature sections.
+
+    `sections` are Section objects; plain source paths are accepted too and
+    named after the file stem. `refresh` names features to re-render even if
+    their hash is unchanged. With `only`, the other features' sections are
+    kept (see build_managed_block); without it the block is replaced entirely.
+    `on_write(path)` is called just before the (resolved) destination is
+    replaced. Returns True if it was written.
+    """
+    sections = [s if isinstance(s, Section) else Section.from_path(s) for s in sections]
+    # Write through symlinks (e.g. dotfile managers) rather than replacing the link
+    dst_path = Path(os.path.realpath(dst_path))
+
+    try:
+        f = open(dst_path, "rb")
+    except FileNotFoundError:
+        block = build_managed_block(sections)
+        if not block:
+            return False
+        if on_write:
+            on_write(dst_path)
+        with atomic_writer(dst_path) as out:
+            out.write(block)
+        return True
+
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            block = build_managed_block(sections)
+            if not block:
+                return False
+            if on_write:
+                on_write(dst_path)
+            with atomic_writer(dst_path) as out:
+                out.write(b"\n" + block)
+            return True
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start, end = find_block(mm)
+            existing = mm[start:end] if start != -1 else b""
+            block = build_managed_block(sections, existing, refresh, only)
+            if not block or block == existing:
+                return False
+            if on_write:
+                on_write(dst_path)
+            if start == -1:
+                # No existing block, append new one
+                _splice(dst_path, mm, size, size, b"\n" + block)
+            else:
+                # Replace existing managed block entirely
+                _splice(dst_path, mm, start, end, block)
+    return True
+
+
+def remove_managed_sections(dst_path: Path, features: list[str],
+                            on_write: Optional[Callable[[Path], None]] = None) -> bool:
+    """Drop features' sections from the managed block, keeping the others verbatim.
+
+    When no section is left the whole block goes, with the newline the
+    installer added before it; a file left empty is deleted. Returns True if
+    the destination changed.
+    """
+    dst_path = Path(os.path.realpath(dst_path))
+    try:
+        f = open(dst_path, "rb")
+    except FileNotFoundError:
+        return False
+
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return False
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start, end = find_block(mm)
+            if start == -1:
+                return False
+            current = parse_sections(mm[start:end])
+            if not any(feature in current for feature in features):
+                return False
+            kept = [sub for feature, (_, sub) in current.items() if feature not in features]
+            if kept:
+                block = _assemble(kept)
+            else:
+                block = b""
+                if start > 0 and mm[start - 1:start] == b"\n":
+                    start -= 1
+            if on_write:
+                on_write(dst_path)
+            if not block and start == 0 and end == size:
+                dst_path.unlink()
+            else:
+                _splice(dst_path, mm, start, end, block)
+    return True
+
+
+def _splice(dst_path: Path, mm, start: int, end: int, replacement: bytes) -> None:
+    """Atomically rewrite dst_path as mm[:start] + replacement + mm[end:], streaming."""
+    view = memoryview(mm)
+    try:
+        with atomic_writer(dst_path) as out:
+            _stream(out, view, 0, start)
+            out.write(replacement)
+            _stream(out, view, end, len(mm))
+    finally:
+        view.release()
+
+
+def _stream(out, view: memoryview, start: int, stop: int) -> None:
+    for offset in range(start, stop, _CHUNK):
+        out.write(view[offset:min(offset + _CHUNK, stop)])
@@ -0,0 +1,132 @@
+"""
+Nexus-AI Installer - Install manifest
+
+Records every file the installer wrote (sha256, size, mtime) in
+~/.nexus-ai/manifest.json so re-runs only rewrite files whose source content
+changed, and can clean up files a feature no longer ships.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+
+from installer.python.fileops import atomic_write_bytes
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional
+
+STATE_DIR = ".nexus-ai"
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+
+def sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class SyncStats:
+    __slots__ = ("written", "skipped", "removed", "unlinked", "unlinked_reason")
+
+    def __init__(self, written: int = 0, skipped: int = 0, removed: int = 0,
+                 unlinked: int = 0, unlinked_reason: str = "") -> None:
+        self.written = written
+        self.skipped = skipped
+        self.removed = removed
+        self.unlinked = unlinked                # written files copied because the store could not link them
+        self.unlinked_reason = unlinked_reason  # why, for the first of them
+
+    def add(self, other: "SyncStats") -> None:
+        self.written += other.written
+        self.skipped += other.skipped
+        self.removed += other.removed
+        self.unlinked += other.unlinked
+        self.unlinked_reason = self.unlinked_reason or other.unlinked_reason
+
+
+class Manifest:
+    """Files written by the installer, keyed by path relative to the target home.
+
+    Safe to share between the engine's per-tool worker threads.
+    """
+
+    def __init__(self, home: Path, files: Optional[dict] = None) -> None:
+        self.home = home
+        self.path = home / STATE_DIR / MANIFEST_NAME
+        self.files = files or {}
+        self.stats = SyncStats()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, home: Path) -> "Manifest":
+        path = home / STATE_DIR / MANIFEST_NAME
+        try:
+            data = json.loads(path.read_text())
+        except FileNotFoundError:
+            return cls(home)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            # A damaged manifest only costs one full rewrite; never fail the install over it
+            return cls(home)
+        if not isinstance(data, dict) or data.get("version") != MANIFEST_VERSION:
+            return cls(home)
+        files = data.get("files", {})
+        return cls(home, files if isinstance(files, dict) else {})
+
+    def save(self) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._lock:
+            payload = json.dumps({"version": MANIFEST_VERSION, "files": self.files}, indent=2, sort_keys=True)
+        atomic_write_bytes(self.path, payload.encode())
+
+    def key(self, dst: Path) -> str:
+        return dst.relative_to(self.home).as_posix()
+
+    def is_current(self, dst: Path, sha256: str) -> bool:
+        """True if dst is still exactly what we last wrote and that matches sha256."""
+        with self._lock:
+            entry = self.files.get(self.key(dst))
+        if entry is None or entry["sha256"] != sha256:
+            return False
+        try:
+            st = dst.lstat()
+        except FileNotFoundError:
+            return False
+        return st.st_size == entry["size"] and st.st_mtime_ns == entry["mtime_ns"]
+
+    def record(self, dst: Path, sha256: str, tool_id: str, feature_id: str) -> None:
+        st = dst.stat()
+        with self._lock:
+            self.files[self.key(dst)] = {
+                "sha256": sha256,
+                "size": st.st_size,
+                "mtime_ns": st.st_mtime_ns,
+                "tool": tool_id,
+                "feature": feature_id,
+            }
+
+    def owned(self, tool_id: str, feature_id: str) -> list[str]:
+        """Manifest keys previously installed for a (tool, feature) pair."""
+        with self._lock:
+            return [
+                key for key, entry in self.files.items()
+                if entry["tool"] == tool_id and entry["feature"] == feature_id
+            ]
+
+    def forget(self, key: str) -> Optional[dict]:
+        with self._lock:
+            return self.files.pop(key, None)
+
+    def count(self, written: int = 0, skipped: int = 0, removed: int = 0) -> None:
+        with self._lock:
+            self.stats.add(SyncStats(written, skipped, removed))
+
+    def count_unlinked(self, reason: str) -> None:
+        with self._lock:
+            self.stats.add(SyncStats(unlinked=1, unlinked_reason=reason))
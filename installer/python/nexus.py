@@ -1,804 +1,847 @@
 #!/usr/bin/env python3
 """
-Nexus-AI Installer - Python + Textual Version
-Fraternal colors: Red, White, Navy Blue, Gold
+Nexus-AI Installer - command-line entry point
+
+Runs the Textual TUI by default. `nexus-ai install` is a headless path for
+scripted installs; it never imports textual, so it works without a TTY.
 """
 
-import asyncio
 import os
-import json
-from pathlib import Path
-from dataclasses import dataclass
-
-from textual import on, work
-
-
-def get_features_path() -> Path:
-    """Get the path to features directory, works both in dev and installed."""
-    # Method 1: Try package resources (for pip/brew installs)
-    try:
-        from importlib.resources import files
-        pkg_features = files("installer.python").joinpath("features")
-        # Check if it's a real directory (not just a namespace)
-        if hasattr(pkg_features, '_path'):
-            pkg_path = Path(str(pkg_features._path))
-            if pkg_path.exists() and pkg_path.is_dir():
-                return pkg_path
-        # For newer Python, try direct path conversion
-        pkg_path = Path(str(pkg_features))
-        if pkg_path.exists() and pkg_path.is_dir():
-            return pkg_path
-    except (TypeError, FileNotFoundError, AttributeError, ModuleNotFoundError):
-        pass
-
-    # Method 2: Fall back to relative path from this file (development mode)
-    dev_features = Path(__file__).parent / "features"
-    if dev_features.exists() and dev_features.is_dir():
-        return dev_features
-
-    # Method 3: Legacy - look for features at repo root (backwards compat for install.sh)
-    repo_root = Path(__file__).parent.parent.parent
-    legacy_features = repo_root / "features"
-    if legacy_features.exists() and legacy_features.is_dir():
-        return legacy_features
-
-    raise FileNotFoundError(
-        "Could not locate features directory. "
-        "Expected at installer/python/features/ or repo root features/"
-    )
-
-
-from textual.app import App, ComposeResult
-from textual.binding import Binding
-from textual.containers import Container, Vertical, Center, Middle
-from textual.screen import Screen
-from textual.widgets import Static, Footer, Label, Button
-from textual.widget import Widget
-from rich.text import Text
-from rich.style import Style
-
-# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-# FRATERNAL COLORS
-# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-RED = "#C41E3A"
-WHITE = "#FFFFFF"
-NAVY = "#1E3A8A"
-GOLD = "#E8C547"
-
-BG_MAIN = "#0f172a"
-BG_PANEL = "#1e293b"
-TEXT_PRIMARY = "#f1f5f9"
-TEXT_MUTED = "#64748b"
-SUCCESS = "#34d399"
-
-# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-# NEXUS BANNER
-# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-NEXUS_BANNER = [
-    "███╗   ██╗███████╗██╗  ██╗██╗   ██╗███████╗",
-    "████╗  ██║██╔════╝╚██╗██╔╝██║   ██║██╔════╝",
-    "██╔██╗ ██║█████╗   ╚███╔╝ ██║   ██║███████╗",
-    "██║╚██╗██║██╔══╝   ██╔██╗ ██║   ██║╚════██║",
-    "██║ ╚████║███████╗██╔╝ ██╗╚██████╔╝███████║",
-    "╚═╝  ╚═══╝╚══════╝╚═╝  ╚═╝ ╚═════╝ ╚══════╝",
-]
-
-BANNER_COLORS = [NAVY, RED, WHITE, GOLD, RED, NAVY]
-
-
-def render_banner() -> Text:
-    """Render the NEXUS banner with nested solid color borders."""
-    text = Text()
-
-    # Banner dimensions
-    banner_width = len(NEXUS_BANNER[0])  # 44 chars
-
-    # Border characters
-    h = "─"
-    v = "│"
-    tl = "╭"
-    tr = "╮"
-    bl = "╰"
-    br = "╯"
-
-    # Sparkles
-    text.append("✦   ✦   ✦\n\n", style=Style(color=GOLD, bold=True))
-
-    # Widths for each border (outer to inner)
-    w_navy = banner_width + 14
-    w_red = banner_width + 10
-    w_gold = banner_width + 6
-    w_white = banner_width + 2
-
-    # Navy top
-    text.append(f"{tl}{h * w_navy}{tr}\n", style=Style(color=NAVY))
-
-    # Red top
-    text.append(f"{v}  ", style=Style(color=NAVY))
-    text.append(f"{tl}{h * w_red}{tr}", style=Style(color=RED))
-    text.append(f"  {v}\n", style=Style(color=NAVY))
-
-    # Gold top
-    text.append(f"{v}  ", style=Style(color=NAVY))
-    text.append(f"{v}  ", style=Style(color=RED))
-    text.append(f"{tl}{h * w_gold}{tr}", style=Style(color=GOLD))
-    text.append(f"  {v}", style=Style(color=RED))
-    text.append(f"  {v}\n", style=Style(color=NAVY))
-
-    # White top
-    text.append(f"{v}  ", style=Style(color=NAVY))
-    text.append(f"{v}  ", style=Style(color=RED))
-    text.append(f"{v}  ", style=Style(color=GOLD))
-    text.append(f"{tl}{h * w_white}{tr}", style=Style(color=WHITE))
-    text.append(f"  {v}", style=Style(color=GOLD))
-    text.append(f"  {v}", style=Style(color=RED))
-    text.append(f"  {v}\n", style=Style(color=NAVY))
-
-    # Banner content
-    for i, line in enumerate(NEXUS_BANNER):
-        color = BANNER_COLORS[i % len(BANNER_COLORS)]
-        text.append(f"{v}  ", style=Style(color=NAVY))
-        text.append(f"{v}  ", style=Style(color=RED))
-        text.append(f"{v}  ", style=Style(color=GOLD))
-        text.append(f"{v} ", style=Style(color=WHITE))
-        text.append(line, style=Style(color=color, bold=True))
-        text.append(f" {v}", style=Style(color=WHITE))
-        text.append(f"  {v}", style=Style(color=GOLD))
-        text.append(f"  {v}", style=Style(color=RED))
-        text.append(f"  {v}\n", style=Style(color=NAVY))
-
-    # White bottom
-    text.append(f"{v}  ", style=Style(color=NAVY))
-    text.append(f"{v}  ", style=Style(color=RED))
-    text.append(f"{v}  ", style=Style(color=GOLD))
-    text.append(f"{bl}{h * w_white}{br}", style=Style(color=WHITE))
-    text.append(f"  {v}", style=Style(color=GOLD))
-    text.append(f"  {v}", style=Style(color=RED))
-    text.append(f"  {v}\n", style=Style(color=NAVY))
-
-    # Gold bottom
-    text.append(f"{v}  ", style=Style(color=NAVY))
-    text.append(f"{v}  ", style=Style(color=RED))
-    text.append(f"{bl}{h * w_gold}{br}", style=Style(color=GOLD))
-    text.append(f"  {v}", style=Style(color=RED))
-    text.append(f"  {v}\n", style=Style(color=NAVY))
-
-    # Red bottom
-    text.append(f"{v}  ", style=Style(color=NAVY))
-    text.append(f"{bl}{h * w_red}{br}", style=Style(color=RED))
-    text.append(f"  {v}\n", style=Style(color=NAVY))
-
-    # Navy bottom
-    text.append(f"{bl}{h * w_navy}{br}\n", style=Style(color=NAVY))
-
-    return text
+import sys
+
+if __package__ in (None, ""):
+    # Direct script execution (./install.sh): make the `installer` package importable
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.realpath(__file__)))))
+
+# Everything below the entry point is imported on first use, so `--version` and
+# `--help` only pay for argparse. The modules a headless install loads (catalog,
+# core, engine, journal, manifest, managed, store, fileops, events, timing) also
+# avoid dataclasses and import typing only for type checkers, which together
+# cost more than the rest of the install's imports. benchmarks/bench_startup.py
+# keeps this honest.
+_CORE_EXPORTS = (
+    "END_MARKER",
+    "START_MARKER",
+    "TOOLS",
+    "get_features_path",
+    "load_features",
+    "update_enablement",
+    "write_managed_config",
+)
+
+
+def __getattr__(name: str):
+    """Lazy re-exports of installer.python.core (kept for smoke tests)."""
+    if name in _CORE_EXPORTS:
+        from installer.python import core
+        return getattr(core, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-# DATA
+# HEADLESS INSTALL
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-@dataclass
-class Tool:
-    id: str
-    name: str
-    description: str
-    selected: bool = True
-
-
-@dataclass
-class Feature:
-    id: str
-    name: str
-    description: str
-    selected: bool = True
-
-
-TOOLS = [
-    Tool("claude", "Claude Code", "Anthropic's AI coding assistant", True),
-    Tool("gemini", "Gemini CLI", "Google's AI command-line interface", True),
-    Tool("codex", "Codex CLI", "OpenAI's coding assistant", False),
-]
-
-FEATURES = [
-    Feature("continuity", "continuity", "Session continuity tracking across projects", True),
-    Feature("maestro", "maestro", "Multi-agent orchestration with hub-spoke model", False),
-]
+def parse_selection(value: str, choices: list[str], kind: str) -> list[str]:
+    """Parse a comma-separated --tools/--features value, validating each id."""
+    if value == "all":
+        return list(choices)
+    ids = [v.strip() for v in value.split(",") if v.strip()]
+    unknown = [v for v in ids if v not in choices]
+    if unknown:
+        raise ValueError(
+            f"unknown {kind}: {', '.join(unknown)} (choose from {', '.join(choices)})"
+        )
+    return ids
+
+
+def confirm(tool_ids: list[str], feature_ids: list[str], home, verb: str = "Install",
+            preposition: str = "into") -> bool:
+    """Ask before changing anything when running interactively without --yes."""
+    if not sys.stdin.isatty():
+        print(f"nexus-ai: refusing to {verb.lower()} without --yes (stdin is not a terminal)", file=sys.stderr)
+        return False
+    print(f"{verb} {', '.join(feature_ids)} for {', '.join(tool_ids)} {preposition} {home}?")
+    answer = input("Proceed? [y/N] ").strip().lower()
+    return answer in ("y", "yes")
+
+
+def run_install(catalog, tool_ids: list[str], feature_ids: list[str], home, copy_mode: str = "copy",
+                sources=None, store=None) -> int:
+    """Install the selected features for the selected tools without the TUI."""
+    import threading
+
+    from installer.python.engine import InstallEngine
+
+    # Steps finish on one thread per tool; a print from each could interleave mid-line
+    output = threading.Lock()
+
+    def on_step(step, status: str) -> None:
+        if status in ("done", "failed"):
+            with output:
+                print(f"{'✓' if status == 'done' else '✗'} {step.label}", flush=True)
+
+    engine = InstallEngine(home, catalog, tool_ids, feature_ids, copy_mode, sources, store)
+    result = engine.run(on_step)
+
+    for step, error in result.errors:
+        print(f"nexus-ai: {step.label} failed: {error}", file=sys.stderr)
+    if not result.ok:
+        if result.rolled_back:
+            print("nexus-ai: nothing was changed (the install was rolled back)", file=sys.stderr)
+        return 1
+
+    print(f"Installation complete: {len(feature_ids)} feature(s), {len(tool_ids)} tool(s)")
+    print(f"Files: {result.files.written} written, {result.files.skipped} unchanged, "
+          f"{result.files.removed} removed")
+    if result.files.unlinked:
+        print(f"nexus-ai: {result.files.unlinked} file(s) copied instead of linked from the store: "
+              f"{result.files.unlinked_reason}", file=sys.stderr)
+    return 0
+
+
+def resolve_selection(args):
+    """(catalog, tool_ids, feature_ids) for --tools/--features; raises ValueError on unknown ids."""
+    from installer.python import timing
+    from installer.python.catalog import Catalog
+    from installer.python.core import TOOLS, get_features_path, load_features
+
+    with timing.span("features path"):
+        root = get_features_path()
+    with timing.span("load catalog"):
+        catalog = Catalog.load(root)
+    features = load_features(catalog)
+    tool_ids = parse_selection(
+        args.tools or ",".join(t.id for t in TOOLS if t.selected),
+        [t.id for t in TOOLS], "tool",
+    )
+    feature_ids = parse_selection(
+        args.features or ",".join(f.id for f in features if f.selected),
+        [f.id for f in features], "feature",
+    )
+    return catalog, tool_ids, feature_ids
 
 
-# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-# CUSTOM WIDGETS
-# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+def resolve_homes(args, default) -> list:
+    """Target homes from --home/--homes-from, or [default]."""
+    from pathlib import Path
 
-class Banner(Static):
-    """Static NEXUS banner."""
+    homes = [Path(h) for h in args.home or []]
+    if args.homes_from:
+        from installer.python.fleet import read_homes
+        homes.extend(read_homes(args.homes_from))
+    return homes or [Path(default)]
 
-    def on_mount(self) -> None:
-        self.update(render_banner())
 
+def resolve_store(args):
+    """The object store to link from (--store), or None; raises ValueError for a DIR without one."""
+    from installer.python.store import find_store
 
-class SelectableItem(Static):
-    """A selectable item with checkbox."""
+    store = find_store(args.store)
+    if store is not None and not store.objects.is_dir():
+        raise ValueError(f"no object store in {store.root} (create one with `nexus-ai store populate --store DIR`)")
+    return store
 
-    def __init__(self, name: str, description: str, selected: bool = False, highlighted: bool = False) -> None:
-        super().__init__()
-        self.item_name = name
-        self.description = description
-        self.selected = selected
-        self.highlighted = highlighted
 
-    def on_mount(self) -> None:
-        self.render_item()
+def cmd_install(args) -> int:
+    from pathlib import Path
 
-    def render_item(self) -> None:
-        text = Text()
+    try:
+        catalog, tool_ids, feature_ids = resolve_selection(args)
+        store = resolve_store(args)
+    except ValueError as e:
+        print(f"nexus-ai: {e}", file=sys.stderr)
+        return 2
 
-        # Cursor
-        if self.highlighted:
-            text.append("› ", style=Style(color=GOLD, bold=True))
-        else:
-            text.append("  ")
+    homes = resolve_homes(args, Path.home())
+    if len(homes) > 1:
+        if not args.yes and not confirm(tool_ids, feature_ids, f"{len(homes)} home directories"):
+            return 1
+        return run_fleet_install(catalog, tool_ids, feature_ids, homes, args.copy_mode, args.jobs, store=store)
 
-        # Checkbox
-        if self.selected:
-            text.append("◉ ", style=Style(color=GOLD, bold=True))
-        else:
-            text.append("○ ", style=Style(color=TEXT_MUTED))
+    home = homes[0]
+    if not args.yes and not confirm(tool_ids, feature_ids, home):
+        return 1
+    return run_install(catalog, tool_ids, feature_ids, home, args.copy_mode, store=store)
 
-        # Name
-        if self.highlighted:
-            text.append(self.item_name, style=Style(color=GOLD, bold=True))
-        else:
-            text.append(self.item_name, style=Style(color=TEXT_PRIMARY))
 
-        text.append(f"\n      {self.description}", style=Style(color=TEXT_MUTED))
+def cmd_plan(args) -> int:
+    from pathlib import Path
 
-        self.update(text)
+    from installer.python.plan import build_plan, format_plan
 
-    def set_highlighted(self, highlighted: bool) -> None:
-        self.highlighted = highlighted
-        self.render_item()
+    try:
+        catalog, tool_ids, feature_ids = resolve_selection(args)
+    except ValueError as e:
+        print(f"nexus-ai: {e}", file=sys.stderr)
+        return 2
 
-    def toggle_selected(self) -> None:
-        self.selected = not self.selected
-        self.render_item()
+    home = Path(args.home) if args.home else Path.home()
+    plan = build_plan(home, catalog, tool_ids, feature_ids, args.copy_mode, args.embed)
 
+    # Keep stdout clean for the plan itself with `--out -`
+    report = sys.stderr if args.out == "-" else sys.stdout
+    for line in format_plan(plan, args.verbose):
+        print(line, file=report)
+    if args.out == "-":
+        print(plan.dumps())
+    elif args.out:
+        from installer.python.fileops import atomic_write_bytes
+        atomic_write_bytes(Path(args.out), plan.dumps().encode())
+        print(f"Plan written to {args.out}", file=report)
+    return 0
 
-class ProgressItem(Static):
-    """A progress item with status."""
 
-    def __init__(self, label: str, status: str = "pending") -> None:
-        super().__init__()
-        self.label_text = label
-        self.status = status
+def cmd_apply(args) -> int:
+    from pathlib import Path
 
-    def on_mount(self) -> None:
-        self.render_item()
+    from installer.python.plan import Plan, StalePlanError, format_plan
 
-    def render_item(self) -> None:
-        text = Text()
+    from installer.python import timing
 
-        if self.status == "done":
-            text.append("  ✓ ", style=Style(color=SUCCESS, bold=True))
-            text.append(self.label_text, style=Style(color=SUCCESS))
-        elif self.status == "active":
-            text.append("  ● ", style=Style(color=GOLD))
-            text.append(self.label_text, style=Style(color=GOLD))
+    try:
+        with timing.span("load plan"):
+            text = sys.stdin.read() if args.plan == "-" else Path(args.plan).read_text()
+            plan = Plan.loads(text, args.plan)
+            catalog = plan.to_catalog()
+        store = resolve_store(args)
+    except (OSError, ValueError, StalePlanError) as e:
+        print(f"nexus-ai: {e}", file=sys.stderr)
+        return 2
+
+    homes = resolve_homes(args, plan.home)
+    if len(homes) > 1:
+        if not args.yes and not confirm(plan.tool_ids, plan.feature_ids, f"{len(homes)} home directories"):
+            return 1
+        return run_fleet_install(catalog, plan.tool_ids, plan.feature_ids, homes, plan.copy_mode, args.jobs,
+                                 plan.sources, store)
+
+    home = homes[0]
+    if not args.yes:
+        # The recorded diff is only meaningful for the home it was planned against
+        if str(home) == plan.home:
+            for line in format_plan(plan):
+                print(line)
+        if not confirm(plan.tool_ids, plan.feature_ids, home):
+            return 1
+    return run_install(catalog, plan.tool_ids, plan.feature_ids, home, plan.copy_mode, plan.sources, store)
+
+
+def cmd_uninstall(args) -> int:
+    from pathlib import Path
+
+    from installer.python.catalog import Catalog
+    from installer.python.core import TOOLS, get_features_path
+    from installer.python.engine import uninstall
+    from installer.python.manifest import Manifest
+
+    home = Path(args.home) if args.home else Path.home()
+    manifest = Manifest.load(home)
+    installed = sorted({entry["feature"] for entry in manifest.files.values()})
+    try:
+        tool_ids = parse_selection(args.tools or "all", [t.id for t in TOOLS], "tool")
+        feature_ids = parse_selection(args.features, installed, "installed feature")
+    except ValueError as e:
+        print(f"nexus-ai: {e}", file=sys.stderr)
+        return 2
+
+    if not args.yes and not confirm(tool_ids, feature_ids, home, verb="Uninstall", preposition="from"):
+        return 1
+
+    result = uninstall(home, tool_ids, feature_ids, Catalog.load(get_features_path()))
+    for tool_id, error in result.errors:
+        print(f"nexus-ai: uninstalling from {tool_id} failed: {error}", file=sys.stderr)
+    if not result.ok:
+        print("nexus-ai: nothing was changed (the uninstall was rolled back)", file=sys.stderr)
+        return 1
+    for key in result.kept:
+        print(f"kept {key} (edited since it was installed)")
+    print(f"Uninstalled {', '.join(feature_ids)}: {result.removed} file(s) removed, {len(result.kept)} kept")
+    return 0
+
+
+def cmd_rollback(args) -> int:
+    import time
+    from pathlib import Path
+
+    from installer.python.journal import EditedSinceCommit, NothingToRollBack, recover, rollback_last
+
+    home = Path(args.home) if args.home else Path.home()
+    if not args.yes:
+        if not sys.stdin.isatty():
+            print("nexus-ai: refusing to roll back without --yes (stdin is not a terminal)", file=sys.stderr)
+            return 1
+        if input(f"Undo the last install or uninstall in {home}? [y/N] ").strip().lower() not in ("y", "yes"):
+            return 1
+    # An install that was killed part-way is what needs undoing first
+    interrupted = recover(home)
+    if interrupted:
+        print(f"Rolled back {interrupted} interrupted transaction(s)")
+        return 0
+    try:
+        begin, stats = rollback_last(home, args.force)
+    except NothingToRollBack as e:
+        print(f"nexus-ai: {e}", file=sys.stderr)
+        return 1
+    except EditedSinceCommit as e:
+        print("nexus-ai: nothing was rolled back; these files were edited since:", file=sys.stderr)
+        for path in e.paths:
+            print(f"  {path}", file=sys.stderr)
+        print("nexus-ai: re-run with --force to roll back anyway (those edits are lost)", file=sys.stderr)
+        return 1
+    when = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(begin.get("time", 0)))
+    print(f"Rolled back {begin.get('command', 'transaction')} from {when}: "
+          f"{stats.restored} file(s) restored, {stats.removed} removed")
+    return 0
+
+
+def cmd_store(args) -> int:
+    from pathlib import Path
+
+    from installer.python.catalog import Catalog
+    from installer.python.core import get_features_path
+    from installer.python.store import DEFAULT_STORE, ObjectStore, catalog_objects
+
+    store = ObjectStore(Path(args.store or os.environ.get("NEXUS_AI_STORE") or DEFAULT_STORE))
+    try:
+        if args.action == "populate":
+            added, size = store.populate(Catalog.load(get_features_path()))
+            print(f"Added {added} object(s) ({size} bytes) to {store.objects}")
+        elif args.action == "status":
+            stats = store.stats()
+            print(f"{store.root}: {stats.objects} object(s) ({stats.copies} per-user copies), {stats.bytes} bytes")
+            print(f"Installed files linking to them save {stats.shared_bytes} bytes; "
+                  f"{stats.unreferenced} object(s) are not linked anywhere")
         else:
-            text.append("  ○ ", style=Style(color=TEXT_MUTED))
-            text.append(self.label_text, style=Style(color=TEXT_MUTED))
-
-        self.update(text)
-
-    def set_status(self, status: str) -> None:
-        self.status = status
-        self.render_item()
-
-
-# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-# SCREENS
-# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+            keep = set() if args.all else catalog_objects(Catalog.load(get_features_path()))
+            removed, size = store.gc(keep, args.dry_run)
+            verb = "Would remove" if args.dry_run else "Removed"
+            print(f"{verb} {removed} unreferenced object(s) ({size} bytes)")
+    except (OSError, ValueError) as e:
+        print(f"nexus-ai: {e}", file=sys.stderr)
+        return 1
+    return 0
 
-class WelcomeScreen(Screen):
-    """Welcome screen."""
 
-    BINDINGS = [
-        Binding("enter", "continue_app", "Continue"),
-        Binding("q", "quit", "Quit"),
-    ]
+def cmd_doctor(args) -> int:
+    from pathlib import Path
 
-    def compose(self) -> ComposeResult:
-        yield Container(
-            Banner(id="banner"),
-            Static("AI Assistant Configuration", id="subtitle"),
-            Static("Press enter to continue • q to quit", id="help"),
-            id="welcome-container"
-        )
+    from installer.python import events, timing
+    from installer.python.catalog import Catalog
+    from installer.python.core import get_features_path
+    from installer.python.doctor import check, fix, format_report
 
-    def action_continue_app(self) -> None:
-        self.app.push_screen(ToolsScreen())
-
-    def action_quit(self) -> None:
-        self.app.exit()
-
-
-class ToolsScreen(Screen):
-    """Tool selection screen."""
-
-    BINDINGS = [
-        Binding("up", "move_up", "Up"),
-        Binding("down", "move_down", "Down"),
-        Binding("k", "move_up", "Up", show=False),
-        Binding("j", "move_down", "Down", show=False),
-        Binding("space", "toggle", "Toggle"),
-        Binding("enter", "confirm", "Confirm"),
-        Binding("escape", "back", "Back"),
-        Binding("q", "quit", "Quit"),
-    ]
-
-    cursor = 0
-
-    def compose(self) -> ComposeResult:
-        yield Container(
-            Banner(id="banner"),
-            Container(
-                Static("Select Tools", id="panel-title"),
-                Static("Choose which AI assistants to configure", id="panel-subtitle"),
-                *[SelectableItem(t.name, t.description, t.selected, i == 0) for i, t in enumerate(TOOLS)],
-                Static("↑/↓ navigate • space toggle • enter confirm • esc back", id="panel-help"),
-                id="panel"
-            ),
-            id="main-container"
-        )
-
-    def on_mount(self) -> None:
-        self.cursor = 0
-        self._update_highlights()
-
-    def _update_highlights(self) -> None:
-        items = list(self.query(SelectableItem))
-        for i, item in enumerate(items):
-            item.set_highlighted(i == self.cursor)
-
-    def action_move_up(self) -> None:
-        if self.cursor > 0:
-            self.cursor -= 1
-            self._update_highlights()
-
-    def action_move_down(self) -> None:
-        if self.cursor < len(TOOLS) - 1:
-            self.cursor += 1
-            self._update_highlights()
-
-    def action_toggle(self) -> None:
-        items = list(self.query(SelectableItem))
-        items[self.cursor].toggle_selected()
-        TOOLS[self.cursor].selected = items[self.cursor].selected
-
-    def action_confirm(self) -> None:
-        self.app.push_screen(FeaturesScreen())
-
-    def action_back(self) -> None:
-        self.app.pop_screen()
-
-    def action_quit(self) -> None:
-        self.app.exit()
-
-
-class FeaturesScreen(Screen):
-    """Feature selection screen."""
-
-    BINDINGS = [
-        Binding("up", "move_up", "Up"),
-        Binding("down", "move_down", "Down"),
-        Binding("k", "move_up", "Up", show=False),
-        Binding("j", "move_down", "Down", show=False),
-        Binding("space", "toggle", "Toggle"),
-        Binding("enter", "install", "Install"),
-        Binding("escape", "back", "Back"),
-        Binding("q", "quit", "Quit"),
-    ]
-
-    cursor = 0
-
-    def compose(self) -> ComposeResult:
-        yield Container(
-            Banner(id="banner"),
-            Container(
-                Static("Select Features", id="panel-title"),
-                Static("Choose features to install", id="panel-subtitle"),
-                *[SelectableItem(f.name, f.description, f.selected, i == 0) for i, f in enumerate(FEATURES)],
-                Static("↑/↓ navigate • space toggle • enter install • esc back", id="panel-help"),
-                id="panel"
-            ),
-            id="main-container"
-        )
+    home = Path(args.home) if args.home else Path.home()
+    try:
+        with timing.span("load catalog"):
+            catalog = Catalog.load(get_features_path())
+        store = resolve_store(args) if args.fix else None
+    except (OSError, ValueError) as e:
+        print(f"nexus-ai: {e}", file=sys.stderr)
+        return 2
+
+    events.emit("start", command="doctor", home=str(home), fix=args.fix)
+    report = check(home, catalog, args.jobs)
+    for line in format_report(report):
+        print(line)
+    if report.ok or not args.fix:
+        events.emit("summary", ok=report.ok, files=report.files, sections=report.sections,
+                    drift=len(report.drift), seconds=round(report.seconds, 6))
+        return 0 if report.ok else 1
+
+    if not args.yes:
+        if not sys.stdin.isatty():
+            print("nexus-ai: refusing to repair without --yes (stdin is not a terminal)", file=sys.stderr)
+            return 1
+        if input(f"Repair {len(report.drift)} drifted item(s) in {home}? [y/N] ").strip().lower() not in ("y", "yes"):
+            return 1
+    result = fix(report, catalog, store)
+    events.emit("summary", ok=result.ok, rolled_back=result.rolled_back, files=report.files,
+                sections=report.sections, drift=len(report.drift), repaired=result.repaired,
+                kept=len(result.kept), errors=len(result.errors), seconds=round(report.seconds, 6))
+    for error in result.errors:
+        print(f"nexus-ai: repairing {error}", file=sys.stderr)
+    if not result.ok:
+        print("nexus-ai: nothing was changed (the repair was rolled back)", file=sys.stderr)
+        return 1
+    for key in result.kept:
+        print(f"kept {key} (edited since it was installed)")
+    print(f"Repaired {result.repaired} item(s); undo with `nexus-ai rollback`")
+    return 0
+
+
+def cmd_watch(args) -> int:
+    import time
+    from pathlib import Path
+
+    from installer.python import events
+    from installer.python.core import installed_features
+    from installer.python.manifest import Manifest
+    from installer.python.watch import PollingWatcher, Syncer, open_watcher, watch
+
+    home = Path(args.home) if args.home else Path.home()
+    try:
+        catalog, tool_ids, feature_ids = resolve_selection(args)
+    except ValueError as e:
+        print(f"nexus-ai: {e}", file=sys.stderr)
+        return 2
+    if args.tools or args.features:
+        selection = {tool_id: set(feature_ids) for tool_id in tool_ids}
+    else:
+        # By default, mirror exactly what is installed
+        selection = {tool_id: set(f) for tool_id, f in installed_features(home, Manifest.load(home)).items()}
+        if not selection:
+            print(f"nexus-ai: nothing is installed in {home}; run `nexus-ai install` first, "
+                  "or pass --tools/--features", file=sys.stderr)
+            return 2
+
+    watcher = open_watcher(catalog.root, args.poll, args.poll_interval)
+    how = f"polling every {args.poll_interval:g} s" if isinstance(watcher, PollingWatcher) else "inotify"
+    watched = sorted(set().union(*selection.values()))
+    print(f"Watching {catalog.root} ({how}) for {', '.join(watched)}; syncing into {home}. Ctrl-C to stop.",
+          flush=True)
+    events.emit("start", command="watch", home=str(home), tools=sorted(selection), features=watched)
+
+    def on_sync(result) -> None:
+        events.emit("sync", features=result.features, written=result.written, removed=result.removed,
+                    configs=result.configs, errors=result.errors, seconds=round(result.seconds, 6))
+        if not result.written and not result.removed and not result.configs and not result.errors:
+            return
+        when = time.strftime("%H:%M:%S")
+        for error in result.errors:
+            print(f"{when} ✗ {', '.join(result.features)}: {error}", file=sys.stderr, flush=True)
+        if not result.errors:
+            configs = f", {', '.join(result.configs)}" if result.configs else ""
+            print(f"{when} ✓ {', '.join(result.features)}: {result.written} written, {result.removed} removed"
+                  f"{configs} in {result.seconds * 1000:.0f} ms", flush=True)
+
+    import signal
+
+    # Stop cleanly when run as a service, too
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    try:
+        watch(watcher, Syncer(home, catalog, selection, args.copy_mode), args.debounce / 1000, on_sync)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        watcher.close()
+    return 0
 
-    def on_mount(self) -> None:
-        self.cursor = 0
-        self._update_highlights()
 
-    def _update_highlights(self) -> None:
-        items = list(self.query(SelectableItem))
-        for i, item in enumerate(items):
-            item.set_highlighted(i == self.cursor)
+def cmd_maestro_check(args) -> int:
+    import json
+    from pathlib import Path
 
-    def action_move_up(self) -> None:
-        if self.cursor > 0:
-            self.cursor -= 1
-            self._update_highlights()
+    from installer.python.maestro.oplog import StateFile
+    from installer.python.maestro.state import CycleError, StateFileError, TaskStore
 
-    def action_move_down(self) -> None:
-        if self.cursor < len(FEATURES) - 1:
-            self.cursor += 1
-            self._update_highlights()
+    state = StateFile(Path(args.root))
+    path = state.path
+    try:
+        snapshot = state.snapshot()
+        store = TaskStore.parse(snapshot.text)
+    except (OSError, StateFileError) as e:
+        print(f"nexus-ai: {path}: {e}", file=sys.stderr)
+        return 2
+
+    problems = list(store.problems)
+    cycle = store.find_cycle()
+    if cycle:
+        problems.append(str(CycleError(cycle)))
+    ready = store.ready()
+    critical = [] if cycle else store.critical_path()
+    counts = store.counts()
+
+    if args.json:
+        print(json.dumps({"tasks": len(store), "counts": counts, "ready": ready, "critical_path": critical,
+                          "cycle": cycle, "problems": problems, "pending_transitions": snapshot.pending},
+                         indent=2))
+    else:
+        summary = ", ".join(f"{n} {status}" for status, n in counts.items() if n)
+        print(f"{path}: {len(store)} task(s){': ' + summary if summary else ''}")
+        if snapshot.pending:
+            print(f"({snapshot.pending} status change(s) in {state.ops_path.name} not compacted yet)")
+        print(f"Ready: {', '.join(map(str, ready)) or 'none'}")
+        if critical:
+            print(f"Critical path: {' -> '.join(map(str, critical))}")
+        for problem in problems:
+            print(f"problem: {problem}")
+    return 1 if problems else 0
+
+
+def cmd_maestro_run(args) -> int:
+    import shlex
+    import time
+    from pathlib import Path
+
+    from installer.python import events
+    from installer.python.maestro.dispatch import COMMANDS, Dispatcher, handoff, read_goal
+    from installer.python.maestro.oplog import StateFile
+    from installer.python.maestro.state import StateFileError, tool_id
+
+    def pairs(values: list[str], what: str, convert=str) -> dict:
+        parsed = {}
+        for value in values or []:
+            tool, sep, rest = value.partition("=")
+            tool = tool_id(tool)
+            if not sep or tool not in COMMANDS:
+                raise ValueError(f"--{what} wants TOOL=VALUE with TOOL one of {', '.join(COMMANDS)}: {value!r}")
+            parsed[tool] = convert(rest)
+        return parsed
 
-    def action_toggle(self) -> None:
-        items = list(self.query(SelectableItem))
-        items[self.cursor].toggle_selected()
-        FEATURES[self.cursor].selected = items[self.cursor].selected
+    try:
+        limits = pairs(args.limit, "limit", int)
+        # Spokes run in the project directory; paths given here are relative to ours
+        spokes = {tool: shlex.join(str(Path(word).resolve()) if os.sep in word and Path(word).exists() else word
+                                   for word in shlex.split(command))
+                  for tool, command in pairs(args.spoke, "spoke").items()}
+    except ValueError as e:
+        print(f"nexus-ai: {e}", file=sys.stderr)
+        return 2
+
+    state = StateFile(Path(args.root))
+    path = state.path
+    try:
+        store = state.load()
+    except (OSError, StateFileError) as e:
+        print(f"nexus-ai: {path}: {e}", file=sys.stderr)
+        return 2
+    if store.problems or store.find_cycle():
+        print(f"nexus-ai: {path} has problems; see `nexus-ai maestro check`", file=sys.stderr)
+        return 2
+    only = set(args.ids) if args.ids else None
+    if only:
+        unknown = sorted(only - set(store.index))
+        if unknown:
+            print(f"nexus-ai: no task {', '.join(map(str, unknown))} in {path}", file=sys.stderr)
+            return 2
+
+    def on_attempt(attempt) -> None:
+        events.emit("attempt", task=attempt.task_id, tool=attempt.tool, attempt=attempt.number,
+                    exit_code=attempt.exit_code, status=attempt.result.status, problem=attempt.problem,
+                    tokens=attempt.tokens, seconds=round(attempt.seconds, 6))
+        if attempt.problem:
+            print(f"{time.strftime('%H:%M:%S')} ✗ task {attempt.task_id} ({attempt.tool}, attempt {attempt.number}): "
+                  f"{attempt.problem}", file=sys.stderr, flush=True)
+
+    def on_result(result) -> None:
+        events.emit("task", task=result.task_id, tool=result.tool, status=result.status,
+                    attempts=len(result.attempts), problem=result.problem, seconds=round(result.seconds, 6))
+        last = result.attempts[-1] if result.attempts else None
+        detail = result.problem or (last.result.summary.splitlines()[0] if last and last.result.summary else "")
+        mark = "✓" if result.status == "done" else "✗"
+        print(f"{time.strftime('%H:%M:%S')} {mark} task {result.task_id} {result.status} ({result.tool}, {result.seconds:.1f} s)"
+              f"{': ' + detail if detail else ''}", flush=True)
+
+    dispatcher = Dispatcher(args.root, limits, args.jobs, args.retries, args.backoff, args.timeout, spokes, only,
+                            args.keep_going, args.log, on_attempt, on_result)
+
+    if args.dry_run:
+        goal = read_goal(path.read_text(encoding="utf-8"))
+        tasks = dispatcher.select(store, {})
+        if not tasks:
+            print("No tasks are ready to run.")
+        for task in tasks:
+            tool = tool_id(task.tool)
+            if tool not in COMMANDS:
+                print(f"task {task.id}: unknown tool {task.tool!r}; would be marked blocked")
+                continue
+            command = dispatcher.command(tool, "<handoff>")
+            print(f"task {task.id} ({task.specialist}): {shlex.join(command)}")
+            if args.verbose:
+                print(handoff(task, goal, [store.task(d) for d in task.depends]) + "\n")
+        return 0
+
+    events.emit("start", command="maestro run", root=str(Path(args.root).resolve()),
+                limits=dispatcher.limits, jobs=args.jobs, tasks=sorted(only) if only else None)
+    try:
+        result = dispatcher.run()
+    except (OSError, StateFileError, KeyError) as e:
+        # The state file went away or lost its table (or a task row) mid-run
+        print(f"nexus-ai: {path}: {e}", file=sys.stderr)
+        return 1
+
+    counts: dict[str, int] = {}
+    for task in result.tasks:
+        counts[task.status] = counts.get(task.status, 0) + 1
+    events.emit("summary", ok=result.ok, interrupted=result.interrupted, counts=counts,
+                not_run=result.not_run, seconds=round(result.seconds, 6))
+    if result.interrupted:
+        print(f"nexus-ai: interrupted; task(s) {', '.join(map(str, result.not_run)) or 'none'} set back to pending",
+              file=sys.stderr)
+        return 130
+    summary = ", ".join(f"{n} {status}" for status, n in sorted(counts.items())) or "nothing ran"
+    print(f"{summary} in {result.seconds:.1f} s"
+          + (f"; still pending: {', '.join(map(str, result.not_run))}" if result.not_run else ""))
+    return 0 if result.ok else 1
+
+
+def cmd_maestro_set(args) -> int:
+    from pathlib import Path
+
+    from installer.python.maestro.oplog import StateFile
+    from installer.python.maestro.state import StateFileError
+
+    state = StateFile(Path(args.root))
+    try:
+        store = state.load()
+        unknown = [str(i) for i in args.ids if i not in store.index]
+        if unknown:
+            print(f"nexus-ai: no task {', '.join(unknown)} in {state.path}", file=sys.stderr)
+            return 2
+        state.append(dict.fromkeys(args.ids, args.status), args.actor)
+        if args.compact:
+            state.compact()
+    except (OSError, StateFileError) as e:
+        print(f"nexus-ai: {state.path}: {e}", file=sys.stderr)
+        return 2
+    return 0
+
+
+def cmd_maestro_compact(args) -> int:
+    from pathlib import Path
+
+    from installer.python.maestro.oplog import StateFile
+    from installer.python.maestro.state import StateFileError
+
+    state = StateFile(Path(args.root))
+    try:
+        applied = state.compact()
+    except (OSError, StateFileError) as e:
+        print(f"nexus-ai: {state.path}: {e}", file=sys.stderr)
+        return 2
+    print(f"Folded {applied} status change(s) into {state.path}")
+    return 0
 
-    def action_install(self) -> None:
-        self.app.push_screen(InstallingScreen())
 
-    def action_back(self) -> None:
-        self.app.pop_screen()
+def cmd_maestro_stats(args) -> int:
+    import json
+    from pathlib import Path
 
-    def action_quit(self) -> None:
-        self.app.exit()
+    from installer.python.maestro.logstats import analyze
 
+    root = Path(args.root)
+    try:
+        report = analyze(root, use_index=not args.no_index)
+    except FileNotFoundError:
+        print(f"nexus-ai: no execution log in {root / '.ai'} (run with --log to record one)", file=sys.stderr)
+        return 2
+    except OSError as e:
+        print(f"nexus-ai: {e}", file=sys.stderr)
+        return 2
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return 0
+
+    def line(name: str, stats: dict) -> str:
+        duration = stats["duration"]
+        rate = "-" if stats["retry_rate"] is None else f"{stats['retry_rate']:.0%}"
+        p50 = "-" if duration["p50"] is None else f"{duration['p50']:.1f}s"
+        p95 = "-" if duration["p95"] is None else f"{duration['p95']:.1f}s"
+        return (f"{name:<24}{stats['rows']:>7}{stats['dispatches']:>11}{stats['retries']:>9}{rate:>7}"
+                f"{stats['tokens']:>12,}{p50:>9}{p95:>9}")
+
+    header = f"{'':<24}{'rows':>7}{'dispatches':>11}{'retries':>9}{'rate':>7}{'tokens':>12}{'p50':>9}{'p95':>9}"
+    new = f" ({report['new_rows']} new since the last run)" if report["resumed"] else ""
+    print(f"{report['log']}: {report['rows']} row(s), {len(report['sessions'])} session(s){new}")
+    for title, groups in (("Sessions", {s["session"] or "(no session)": s for s in report["sessions"]}),
+                          ("Tools", report["tools"]), ("Specialists", report["specialists"])):
+        if groups:
+            print(f"\n{title}\n{header}")
+            for name, stats in groups.items():
+                print(line(name, stats))
+    print(f"\n{line('Total', report['total'])}")
+    return 0
+
+
+def cmd_continuity_scan(args) -> int:
+    import json
+    import time
+    from pathlib import Path
+
+    from installer.python import events, timing
+    from installer.python.continuity import INDEX_FILE, scan
+
+    roots = [Path(r) for r in args.roots]
+    for root in roots:
+        if not root.is_dir():
+            print(f"nexus-ai: {root}: not a directory", file=sys.stderr)
+            return 2
+    index = None if args.no_index else Path(args.index) if args.index else INDEX_FILE
+
+    events.emit("start", command="continuity scan", roots=[str(r) for r in roots])
+    with timing.span("scan", roots=len(roots)):
+        result = scan(roots, index, args.jobs)
+    now = time.time()
+    files = [f for f in result.files
+             if (not args.legacy or f.legacy)
+             and (args.stale is None or (f.age_days(now) or float("inf")) > args.stale)]
+    for error in result.errors:
+        print(f"nexus-ai: {error}", file=sys.stderr)
+
+    def age(f):
+        days = f.age_days(now)
+        return None if days is None else round(days, 1)
+
+    for f in files:
+        events.emit("continuity", project=f.project, path=f.path, tool=f.tool, updated=f.updated,
+                    age_days=age(f), legacy=f.legacy, legacy_checked=f.legacy_checked)
+    events.emit("summary", ok=not result.errors, files=len(files), projects=len({f.project for f in files}),
+                directories=result.directories, listed=result.listed, seconds=round(result.seconds, 6))
+
+    if args.json:
+        print(json.dumps([{"project": f.project, "path": f.path, "tool": f.tool, "updated": f.updated,
+                           "age_days": age(f), "legacy": f.legacy, "legacy_checked": f.legacy_checked}
+                          for f in files], indent=2))
+        return 0
+
+    project = None
+    for f in files:
+        if f.project != project:
+            project = f.project
+            print(project)
+        source = " | ".join(p for p in (f.tool, f.updated) if p) or "no Source line"
+        days = age(f)
+        notes = [f"{days:.0f} days" if days is not None else "", f"legacy: {f.legacy}" if f.legacy else "",
+                 f"checked {f.legacy_checked}" if f.legacy and f.legacy_checked else ""]
+        print(f"  {f.path:<24}{source}  {'  '.join(n for n in notes if n)}".rstrip())
+    legacy = sum(1 for f in files if f.legacy)
+    print(f"{len(files)} continuity file(s) in {len({f.project for f in files})} project(s), {legacy} legacy; "
+          f"{result.directories} directories ({result.listed} listed) in {result.seconds:.2f} s")
+    return 0
+
+
+def run_fleet_install(catalog, tool_ids: list[str], feature_ids: list[str], homes: list,
+                      copy_mode: str, jobs, sources=None, store=None) -> int:
+    """Install into many homes in parallel and print a per-home summary."""
+    import time
+
+    from installer.python import events
+    from installer.python.fleet import run_fleet
+
+    def on_result(r) -> None:
+        if r.ok:
+            print(f"✓ {r.home}  {r.seconds * 1000:.1f} ms  "
+                  f"{r.written} written, {r.skipped} unchanged, {r.removed} removed"
+                  + (f", {r.unlinked} copied instead of linked ({r.unlinked_reason})" if r.unlinked else ""),
+                  flush=True)
+        else:
+            print(f"✗ {r.home}  {r.seconds * 1000:.1f} ms  {'; '.join(r.errors)}", flush=True)
 
-class InstallingScreen(Screen):
-    """Installation progress screen."""
+    events.emit("start", command="fleet", homes=len(homes), tools=tool_ids, features=feature_ids)
+    start = time.perf_counter()
+    results = run_fleet(homes, catalog, tool_ids, feature_ids, copy_mode, jobs, on_result, sources, store)
+    failed = [r for r in results if not r.ok]
+    events.emit("summary", ok=not failed, homes=len(results), failed=len(failed),
+                written=sum(r.written for r in results), skipped=sum(r.skipped for r in results),
+                removed=sum(r.removed for r in results), unlinked=sum(r.unlinked for r in results),
+                seconds=round(time.perf_counter() - start, 6))
+    print(f"{len(results)} home(s): {len(results) - len(failed)} ok, {len(failed)} failed "
+          f"in {time.perf_counter() - start:.2f} s")
+    return 1 if failed else 0
 
-    def __init__(self) -> None:
-        super().__init__()
-        self.steps = []
 
-    def compose(self) -> ComposeResult:
-        # Build steps
-        self.steps = []
-        for feature in FEATURES:
-            if not feature.selected:
-                continue
-            for tool in TOOLS:
-                if not tool.selected:
-                    continue
-                self.steps.append((f"Installing {feature.name} for {tool.name}", tool.id, feature.id))
-
-        yield Container(
-            Banner(id="banner"),
-            Container(
-                Static("Installing", id="panel-title"),
-                *[ProgressItem(step[0], "pending") for step in self.steps],
-                id="panel"
-            ),
-            id="main-container"
-        )
+def run_profiled(args) -> int:
+    """Run a subcommand with timing spans recorded, then report them."""
+    from pathlib import Path
 
-    def on_mount(self) -> None:
-        self.run_installation()
-
-    @work(exclusive=True)
-    async def run_installation(self) -> None:
-        items = list(self.query(ProgressItem))
-        home = Path.home()
-        features = self.app.features_path
-
-        # Get selected features
-        selected_features = [f.id for f in FEATURES if f.selected]
-
-        # Write managed configs once per tool (rebuild from all selected features)
-        # Create tool directories if needed and write config files
-        selected_tools = [t.id for t in TOOLS if t.selected]
-        if "claude" in selected_tools:
-            claude_dir = home / ".claude"
-            claude_dir.mkdir(parents=True, exist_ok=True)
-            src_paths = [features / f / "claude" / "CLAUDE.md" for f in selected_features]
-            write_managed_config(claude_dir / "CLAUDE.md", src_paths)
-        if "gemini" in selected_tools:
-            gemini_dir = home / ".gemini"
-            gemini_dir.mkdir(parents=True, exist_ok=True)
-            src_paths = [features / f / "gemini" / "GEMINI.md" for f in selected_features]
-            write_managed_config(gemini_dir / "GEMINI.md", src_paths)
-        if "codex" in selected_tools:
-            codex_dir = home / ".codex"
-            codex_dir.mkdir(parents=True, exist_ok=True)
-            src_paths = [features / f / "codex" / "AGENTS.md" for f in selected_features]
-            write_managed_config(codex_dir / "AGENTS.md", src_paths)
-
-        # Install command files per feature
-        for i, (step_name, tool_id, feature_id) in enumerate(self.steps):
-            items[i].set_status("active")
-            await self.install_step(tool_id, feature_id)
-            await asyncio.sleep(0.3)
-            items[i].set_status("done")
-
-        await asyncio.sleep(0.5)
-        self.app.push_screen(DoneScreen())
-
-    async def install_step(self, tool_id: str, feature_id: str) -> None:
-        home = Path.home()
-        features = self.app.features_path
-
-        if tool_id == "claude":
-            await self.install_claude(home, features, feature_id)
-        elif tool_id == "gemini":
-            await self.install_gemini(home, features, feature_id)
-        elif tool_id == "codex":
-            await self.install_codex(home, features, feature_id)
-
-    async def install_claude(self, home: Path, features: Path, feature: str) -> None:
-        claude_dir = home / ".claude"
-        commands_dir = claude_dir / "commands"
-        commands_dir.mkdir(parents=True, exist_ok=True)
-
-        # Install command files matching feature name pattern: <feature>.md or <feature>-*.md
-        src_commands_dir = features / feature / "claude" / "commands"
-        if src_commands_dir.exists():
-            # Collect files matching either single-command or multi-command pattern
-            src_files = list(src_commands_dir.glob(f"{feature}.md"))
-            src_files.extend(src_commands_dir.glob(f"{feature}-*.md"))
-            for src_cmd in src_files:
-                dst_cmd = commands_dir / src_cmd.name
-                if dst_cmd.exists() or dst_cmd.is_symlink():
-                    dst_cmd.unlink()
-                dst_cmd.write_text(src_cmd.read_text())
-
-    async def install_gemini(self, home: Path, features: Path, feature: str) -> None:
-        gemini_dir = home / ".gemini"
-        ext_dir = gemini_dir / "extensions" / feature
-        cmd_dir = ext_dir / "commands"
-        cmd_dir.mkdir(parents=True, exist_ok=True)
-
-        src_ext = features / feature / "gemini" / "extensions" / feature
-        (ext_dir / "gemini-extension.json").write_text((src_ext / "gemini-extension.json").read_text())
-
-        # Install command files matching feature name pattern: <feature>.toml or <feature>-*.toml
-        src_commands_dir = src_ext / "commands"
-        if src_commands_dir.exists():
-            # Collect files matching either single-command or multi-command pattern
-            src_files = list(src_commands_dir.glob(f"{feature}.toml"))
-            src_files.extend(src_commands_dir.glob(f"{feature}-*.toml"))
-            for src_cmd in src_files:
-                (cmd_dir / src_cmd.name).write_text(src_cmd.read_text())
-
-        enablement_path = gemini_dir / "extensions" / "extension-enablement.json"
-        update_enablement(enablement_path, feature)
-
-    async def install_codex(self, home: Path, features: Path, feature: str) -> None:
-        codex_dir = home / ".codex"
-        prompts_dir = codex_dir / "prompts"
-        prompts_dir.mkdir(parents=True, exist_ok=True)
-
-        # Install prompt files matching feature name pattern: <feature>.md or <feature>-*.md
-        src_prompts_dir = features / feature / "codex" / "prompts"
-        if src_prompts_dir.exists():
-            # Collect files matching either single-command or multi-command pattern
-            src_files = list(src_prompts_dir.glob(f"{feature}.md"))
-            src_files.extend(src_prompts_dir.glob(f"{feature}-*.md"))
-            for src_prompt in src_files:
-                dst_prompt = prompts_dir / src_prompt.name
-                if dst_prompt.exists() or dst_prompt.is_symlink():
-                    dst_prompt.unlink()
-                dst_prompt.write_text(src_prompt.read_text())
-
-
-class DoneScreen(Screen):
-    """Completion screen."""
-
-    BINDINGS = [
-        Binding("enter", "quit", "Exit"),
-        Binding("q", "quit", "Exit"),
-    ]
-
-    def compose(self) -> ComposeResult:
-        tools = [t.name for t in TOOLS if t.selected]
-        features = [f.name for f in FEATURES if f.selected]
-
-        yield Container(
-            Banner(id="banner"),
-            Container(
-                Static(Text("✓ Installation Complete", style=Style(color=SUCCESS, bold=True)), id="panel-title"),
-                Static(Text.assemble(
-                    ("Tools: ", Style(color=TEXT_MUTED)),
-                    (", ".join(tools), Style(color=GOLD))
-                ), id="summary-tools"),
-                Static(Text.assemble(
-                    ("Features: ", Style(color=TEXT_MUTED)),
-                    (", ".join(features), Style(color=GOLD))
-                ), id="summary-features"),
-                Static("Press enter or q to exit", id="panel-help"),
-                id="panel"
-            ),
-            id="main-container"
-        )
+    from installer.python import timing
 
-    def action_quit(self) -> None:
-        self.app.exit()
+    recorder = timing.enable()
+    try:
+        return args.func(args)
+    finally:
+        timing.disable()
+        if args.profile:
+            for line in timing.format_summary(recorder):
+                print(line, file=sys.stderr)
+        if args.trace:
+            timing.write_trace(recorder, Path(args.trace))
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-# HELPERS
+# ENTRY POINT
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-START_MARKER = "<!-- Nexus-AI:START -->"
-END_MARKER = "<!-- Nexus-AI:END -->"
-
-
-def write_managed_config(dst_path: Path, src_paths: list[Path]) -> None:
-    """Rebuild managed block from all feature configs (replaces existing block entirely)."""
-    # Collect content from all source files that exist
-    contents = []
-    for src_path in src_paths:
-        if src_path.exists():
-            content = src_path.read_text().strip()
-            if content:
-                contents.append(content)
-
-    if not contents:
-        return
-
-    # Build the managed block from all features with global header
-    merged = "\n\n".join(contents)
-    managed_block = f"{START_MARKER}\n# Global Instructions\n\n{merged}\n{END_MARKER}"
-
-    if not dst_path.exists():
-        dst_path.write_text(managed_block)
-        return
-
-    existing = dst_path.read_text()
-
-    if START_MARKER in existing and END_MARKER in existing:
-        # Replace existing managed block entirely
-        block_start = existing.index(START_MARKER)
-        block_end = existing.index(END_MARKER) + len(END_MARKER)
-        content = existing[:block_start] + managed_block + existing[block_end:]
-    else:
-        # No existing block, append new one
-        content = existing + "\n" + managed_block
-
-    dst_path.write_text(content)
+def add_selection_arguments(parser) -> None:
+    parser.add_argument(
+        "--tools",
+        help="comma-separated tool ids, or 'all' (default: the tools preselected in the TUI)",
+    )
+    parser.add_argument(
+        "--features",
+        help="comma-separated feature ids, or 'all' (default: the features preselected in the TUI)",
+    )
+    parser.add_argument(
+        "--copy-mode",
+        choices=["copy", "hardlink", "reflink"],
+        default="copy",
+        help="how to place feature files: byte copy (default), hardlink to the "
+             "packaged files, or copy-on-write reflink; falls back to copy when unsupported",
+    )
 
 
-def update_enablement(path: Path, extension_name: str) -> None:
-    if path.exists():
-        try:
-            data = json.loads(path.read_text())
-        except json.JSONDecodeError:
-            data = {}
-    else:
-        path.parent.mkdir(parents=True, exist_ok=True)
-        data = {}
+def add_store_argument(parser) -> None:
+    parser.add_argument(
+        "--store",
+        metavar="DIR",
+        help="link files from the shared object store in DIR ('none' to copy; default: "
+             "$NEXUS_AI_STORE or /var/lib/nexus-ai, if it exists)",
+    )
 
-    data[extension_name] = True
-    path.write_text(json.dumps(data, indent=2))
 
+def add_home_arguments(parser, default_home: str) -> None:
+    parser.add_argument(
+        "--home",
+        action="append",
+        metavar="DIR",
+        help=f"install into DIR instead of {default_home} (repeatable)",
+    )
+    parser.add_argument(
+        "--homes-from",
+        metavar="FILE",
+        help="read target home directories from FILE, one per line ('-' for stdin)",
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        help="parallel worker processes when installing into several homes (default: CPU count)",
+    )
+    parser.add_argument(
+        "--yes", "-y",
+        action="store_true",
+        help="do not ask for confirmation",
+    )
 
-# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-# APP
-# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-class NexusInstaller(App):
-    """NEXUS Installer Application."""
-
-    CSS = """
-    Screen {
-        background: #0f172a;
-    }
-
-    #welcome-container {
-        width: 100%;
-        height: 100%;
-        align: center middle;
-        background: #0f172a;
-    }
-
-    #main-container {
-        width: 100%;
-        height: 100%;
-        align: center top;
-        background: #0f172a;
-        padding-top: 1;
-    }
-
-    #banner {
-        width: 100%;
-        height: auto;
-        content-align: center middle;
-        text-align: center;
-        background: #0f172a;
-        padding: 1;
-    }
-
-    #subtitle {
-        width: 100%;
-        height: auto;
-        content-align: center middle;
-        text-align: center;
-        color: #94a3b8;
-        text-style: italic;
-        background: #0f172a;
-    }
-
-    #help {
-        width: 100%;
-        height: auto;
-        content-align: center middle;
-        text-align: center;
-        color: #64748b;
-        background: #0f172a;
-        margin-top: 1;
-    }
-
-    #panel {
-        width: 70;
-        height: auto;
-        background: #1e293b;
-        border: round #334155;
-        padding: 1 2;
-        margin: 1;
-    }
-
-    #panel-title {
-        color: #f1f5f9;
-        text-style: bold;
-        background: #1e293b;
-        width: 100%;
-    }
-
-    #panel-subtitle {
-        color: #94a3b8;
-        text-style: italic;
-        background: #1e293b;
-        width: 100%;
-        margin-bottom: 1;
-    }
-
-    #panel-help {
-        color: #64748b;
-        background: #1e293b;
-        width: 100%;
-        margin-top: 1;
-    }
-
-    #summary-tools, #summary-features {
-        background: #1e293b;
-        width: 100%;
-        padding: 0 0 1 0;
-    }
-
-    SelectableItem {
-        width: 100%;
-        height: auto;
-        background: #1e293b;
-        padding: 1 0;
-    }
-
-    ProgressItem {
-        width: 100%;
-        height: auto;
-        background: #1e293b;
-        padding: 0 0 1 0;
-    }
-    """
-
-    BINDINGS = [
-        Binding("ctrl+c", "quit", "Quit"),
-    ]
-
-    def __init__(self) -> None:
-        super().__init__()
-        self.features_path = get_features_path()
-
-    def on_mount(self) -> None:
-        self.push_screen(WelcomeScreen())
+def add_report_arguments(parser) -> None:
+    parser.add_argument(
+        "--events",
+        choices=["ndjson"],
+        help="emit machine-readable progress events (step start/finish, file write/skip, "
+             "errors, summary), one JSON object per line",
+    )
+    parser.add_argument(
+        "--events-to",
+        metavar="PATH",
+        default="-",
+        help="where --events go: '-' for stdout (default; other output moves to stderr), "
+             "or a file or fifo",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="print a per-phase and per-step timing table (to stderr) when done",
+    )
+    parser.add_argument(
+        "--trace",
+        metavar="FILE",
+        help="write the timing spans to FILE as Chrome trace JSON (chrome://tracing, Perfetto)",
+    )
 
 
-def main():
-    """Entry point for the nexus-ai command."""
+def build_parser():
     import argparse
 
     try:
@@ -815,11 +858,290 @@ def main():
         action="version",
         version=f"nexus-ai {__version__}"
     )
+    banner_modes = ["auto", "full", "compact", "none"]
+    env_banner = os.environ.get("NEXUS_AI_BANNER", "auto")
+    parser.add_argument(
+        "--banner",
+        choices=banner_modes,
+        default=env_banner if env_banner in banner_modes else "auto",
+        help="TUI banner: auto (fit the terminal), full, compact, or none for slow links "
+             "(default: $NEXUS_AI_BANNER or auto)",
+    )
+    subparsers = parser.add_subparsers(dest="command", metavar="COMMAND")
+
+    install = subparsers.add_parser(
+        "install",
+        help="install features without the TUI",
+        description="Install features non-interactively (no TTY required).",
+    )
+    add_selection_arguments(install)
+    add_store_argument(install)
+    add_home_arguments(install, "your home directory")
+    add_report_arguments(install)
+    install.set_defaults(func=cmd_install)
+
+    plan = subparsers.add_parser(
+        "plan",
+        help="show what an install would change, optionally saving it as a plan",
+        description="Compute the changes an install would make, without making them.",
+    )
+    add_selection_arguments(plan)
+    plan.add_argument(
+        "--home",
+        metavar="DIR",
+        help="plan against DIR instead of your home directory",
+    )
+    plan.add_argument(
+        "--out", "-o",
+        metavar="FILE",
+        help="write the plan as JSON to FILE ('-' for stdout) for `nexus-ai apply`",
+    )
+    plan.add_argument(
+        "--embed",
+        action="store_true",
+        help="include the feature files in the plan, so it applies without the features directory",
+    )
+    plan.add_argument(
+        "--verbose",
+        action="store_true",
+        help="also list unchanged files",
+    )
+    plan.set_defaults(func=cmd_plan)
+
+    apply = subparsers.add_parser(
+        "apply",
+        help="apply a saved plan",
+        description="Apply a plan from `nexus-ai plan --out` without rescanning the features directory.",
+    )
+    apply.add_argument("plan", metavar="PLAN", help="plan file ('-' for stdin)")
+    add_store_argument(apply)
+    add_home_arguments(apply, "the home the plan was made for")
+    add_report_arguments(apply)
+    apply.set_defaults(func=cmd_apply)
+
+    uninstall = subparsers.add_parser(
+        "uninstall",
+        help="remove installed features",
+        description="Remove features' files, managed-block sections and extension enablement. "
+                    "Files you edited since installing are kept. Undo with `nexus-ai rollback`.",
+    )
+    uninstall.add_argument(
+        "--features",
+        required=True,
+        help="comma-separated installed feature ids, or 'all'",
+    )
+    uninstall.add_argument(
+        "--tools",
+        help="comma-separated tool ids, or 'all' (default: all)",
+    )
+    uninstall.add_argument("--home", metavar="DIR", help="uninstall from DIR instead of your home directory")
+    uninstall.add_argument("--yes", "-y", action="store_true", help="do not ask for confirmation")
+    add_report_arguments(uninstall)
+    uninstall.set_defaults(func=cmd_uninstall)
+
+    rollback = subparsers.add_parser(
+        "rollback",
+        help="undo the last install or uninstall",
+        description="Restore every file the last install or uninstall changed, from its journal. "
+                    "Repeat to step further back.",
+    )
+    rollback.add_argument("--home", metavar="DIR", help="roll back DIR instead of your home directory")
+    rollback.add_argument("--yes", "-y", action="store_true", help="do not ask for confirmation")
+    rollback.add_argument("--force", action="store_true",
+                          help="roll back even files edited since the install or uninstall (losing the edits)")
+    rollback.set_defaults(func=cmd_rollback)
+
+    watch = subparsers.add_parser(
+        "watch",
+        help="keep a home in sync with the features directory while you edit it",
+        description="Watch the features directory and re-install each changed feature as soon as it is "
+                    "saved: changed files are copied, removed ones deleted, and only that feature's "
+                    "managed-block section is re-rendered. Without --tools/--features it syncs what is "
+                    "installed in the home.",
+    )
+    add_selection_arguments(watch)
+    watch.add_argument("--home", metavar="DIR", help="sync into DIR instead of your home directory")
+    watch.add_argument("--debounce", type=float, default=20, metavar="MS",
+                       help="quiet period that ends a batch of changes (default: 20)")
+    watch.add_argument("--poll", action="store_true", help="poll instead of using inotify")
+    watch.add_argument("--poll-interval", type=float, default=0.25, metavar="SECONDS",
+                       help="seconds between scans when polling (default: 0.25)")
+    watch.add_argument(
+        "--events",
+        choices=["ndjson"],
+        help="emit a `sync` event per batch (and `file` events), one JSON object per line",
+    )
+    watch.add_argument("--events-to", metavar="PATH", default="-",
+                       help="where --events go: '-' for stdout (default), or a file or fifo")
+    watch.set_defaults(func=cmd_watch)
+
+    doctor = subparsers.add_parser(
+        "doctor",
+        help="check installed files against the features and repair drift",
+        description="Hash installed command files and extension manifests, compare managed-block "
+                    "sections and extension enablement with the features, and report what drifted "
+                    "(missing, modified, outdated or stale). With --fix, repair only those items.",
+    )
+    doctor.add_argument("--home", metavar="DIR", help="check DIR instead of your home directory")
+    doctor.add_argument("--fix", action="store_true",
+                        help="repair what drifted, as one transaction `nexus-ai rollback` can undo")
+    doctor.add_argument("--jobs", "-j", type=int, help="hashing threads (default: CPU count + 4, at most 32)")
+    doctor.add_argument("--yes", "-y", action="store_true", help="do not ask before repairing")
+    add_store_argument(doctor)
+    add_report_arguments(doctor)
+    doctor.set_defaults(func=cmd_doctor)
+
+    store = subparsers.add_parser(
+        "store",
+        help="manage the shared object store that installs link to",
+        description="Manage the system-wide, content-addressed store of feature files. Installs that "
+                    "find it hardlink (or reflink) each file to its object instead of copying it.",
+    )
+    store.add_argument("action", choices=["populate", "status", "gc"],
+                       help="populate: add the current feature files; status: show usage; "
+                            "gc: delete objects no installed file links to")
+    store.add_argument("--store", metavar="DIR",
+                       help="store directory (default: $NEXUS_AI_STORE or /var/lib/nexus-ai)")
+    store.add_argument("--all", action="store_true",
+                       help="gc: also delete unlinked objects the current features still ship")
+    store.add_argument("--dry-run", "-n", action="store_true", help="gc: only report what would be deleted")
+    store.set_defaults(func=cmd_store)
+
+    continuity = subparsers.add_parser(
+        "continuity",
+        help="find continuity files across many projects",
+        description="Tools for the .ai/CONTINUITY.md files that /continuity keeps in each project.",
+    )
+    continuity_commands = continuity.add_subparsers(dest="continuity_command", metavar="COMMAND", required=True)
+    scan = continuity_commands.add_parser(
+        "scan",
+        help="list every continuity file under ROOTs with its Source line and legacy status",
+        description="Walk the directory trees in parallel, skipping VCS, vendored and dependency "
+                    "directories, and list each project's .ai/CONTINUITY.md and legacy .claude/, "
+                    ".gemini/ and .codex/CONTINUITY.md files with the tool and timestamp of their "
+                    "Source line. An index of directory mtimes makes later scans list only the "
+                    "directories that changed.",
+    )
+    scan.add_argument("roots", nargs="+", metavar="ROOT", help="directory tree(s) to scan")
+    scan.add_argument("--legacy", action="store_true", help="show only legacy files")
+    scan.add_argument("--stale", type=float, metavar="DAYS",
+                      help="show only files whose Source timestamp is older than DAYS (or missing)")
+    scan.add_argument("--jobs", "-j", type=int, help="scanning threads (default: CPU count + 4, at most 32)")
+    scan.add_argument("--index", metavar="FILE",
+                      help="index file (default: $XDG_CACHE_HOME/nexus-ai/continuity-index.json)")
+    scan.add_argument("--no-index", action="store_true", help="walk every directory and save no index")
+    scan.add_argument("--json", action="store_true", help="print the files as JSON")
+    add_report_arguments(scan)
+    scan.set_defaults(func=cmd_continuity_scan)
+
+    maestro = subparsers.add_parser(
+        "maestro",
+        help="work with a project's Maestro orchestration state (.ai/MAESTRO.md)",
+        description="Tools for the Maestro state file that /maestro plan creates in a project.",
+    )
+    maestro_commands = maestro.add_subparsers(dest="maestro_command", metavar="COMMAND", required=True)
+    check = maestro_commands.add_parser(
+        "check",
+        help="validate the task table and show ready tasks and the critical path",
+        description="Parse the Tasks table, report problems (unknown statuses, duplicate ids, unknown "
+                    "dependencies, cycles), and list the tasks ready to run and the critical path.",
+    )
+    check.add_argument("--root", metavar="DIR", default=".", help="project directory (default: .)")
+    check.add_argument("--json", action="store_true", help="print the result as JSON")
+    check.set_defaults(func=cmd_maestro_check)
+
+    run = maestro_commands.add_parser(
+        "run",
+        help="dispatch ready tasks to their tools' CLIs in parallel",
+        description="Run the plan: launch every ready task as a subprocess of its tool's CLI (the spoke "
+                    "contract's commands), with per-tool concurrency limits and retries, and write each "
+                    "status change back to .ai/MAESTRO.md. Stops starting tasks after one fails unless "
+                    "--keep-going.",
+    )
+    run.add_argument("ids", type=int, nargs="*", metavar="ID", help="run only these tasks (default: all)")
+    run.add_argument("--root", metavar="DIR", default=".", help="project directory (default: .)")
+    run.add_argument("--limit", action="append", metavar="TOOL=N",
+                     help="spokes of TOOL running at once (repeatable; default: 2 each)")
+    run.add_argument("--jobs", "-j", type=int, metavar="N", help="spokes running at once in total")
+    run.add_argument("--retries", type=int, default=2, metavar="N",
+                     help="retries after a failed attempt (default: 2; `blocked` is never retried)")
+    run.add_argument("--backoff", type=float, default=2.0, metavar="SECONDS",
+                     help="wait before the first retry, doubled for each next one (default: 2)")
+    run.add_argument("--timeout", type=float, metavar="SECONDS", help="time limit per attempt")
+    run.add_argument("--spoke", action="append", metavar="TOOL=COMMAND",
+                     help="run COMMAND instead of TOOL's CLI, with the same arguments (e.g. a stub spoke)")
+    run.add_argument("--keep-going", "-k", action="store_true", help="keep starting tasks after one fails")
+    run.add_argument("--log", action="store_true", help="append each attempt to .ai/MAESTRO-LOG.md")
+    run.add_argument("--dry-run", "-n", action="store_true", help="show what would be launched first")
+    run.add_argument("--verbose", "-v", action="store_true", help="with --dry-run, also print the handoffs")
+    run.add_argument(
+        "--events",
+        choices=["ndjson"],
+        help="emit `attempt` and `task` events (and start/summary), one JSON object per line",
+    )
+    run.add_argument("--events-to", metavar="PATH", default="-",
+                     help="where --events go: '-' for stdout (default), or a file or fifo")
+    run.set_defaults(func=cmd_maestro_run)
+
+    set_status = maestro_commands.add_parser(
+        "set",
+        help="record a status change for tasks (safe with concurrent writers)",
+        description="Append a status change to .ai/MAESTRO.ops under a lock instead of rewriting "
+                    ".ai/MAESTRO.md; it is folded into the Tasks table when the log grows or on "
+                    "`nexus-ai maestro compact`.",
+    )
+    set_status.add_argument("ids", type=int, nargs="+", metavar="ID", help="task id(s)")
+    set_status.add_argument("status", choices=["pending", "running", "done", "failed", "blocked"],
+                            help="new status")
+    set_status.add_argument("--root", metavar="DIR", default=".", help="project directory (default: .)")
+    set_status.add_argument("--actor", default="", help="who made the change, for the log")
+    set_status.add_argument("--compact", action="store_true", help="fold the log into the state file now")
+    set_status.set_defaults(func=cmd_maestro_set)
+
+    compact = maestro_commands.add_parser(
+        "compact",
+        help="fold recorded status changes into .ai/MAESTRO.md",
+        description="Apply the status changes in .ai/MAESTRO.ops to the Tasks table and empty the log.",
+    )
+    compact.add_argument("--root", metavar="DIR", default=".", help="project directory (default: .)")
+    compact.set_defaults(func=cmd_maestro_compact)
+
+    stats = maestro_commands.add_parser(
+        "stats",
+        help="aggregate the execution log for /maestro report",
+        description="Read .ai/MAESTRO-LOG.md in one pass and total it per session, tool and specialist: "
+                    "dispatches, retries and retry rate, tokens, outcomes, and p50/p95 durations. An index "
+                    "(.ai/MAESTRO-LOG.idx) keeps the totals so the next run reads only appended rows.",
+    )
+    stats.add_argument("--root", metavar="DIR", default=".", help="project directory (default: .)")
+    stats.add_argument("--json", action="store_true", help="print the totals as JSON (for /maestro report)")
+    stats.add_argument("--no-index", action="store_true", help="read the whole log and leave the index alone")
+    stats.set_defaults(func=cmd_maestro_stats)
+
+    return parser
+
+
+def main():
+    """Entry point for the nexus-ai command."""
+    parser = build_parser()
     # Parse args (will exit on --help or --version)
-    parser.parse_args()
+    args = parser.parse_args()
+
+    if args.command is not None:
+        if getattr(args, "events", None):
+            from installer.python import events
+
+            events.open_stream(args.events_to)
+            if args.events_to == "-":
+                sys.stdout = sys.stderr  # stdout carries only events
+        if getattr(args, "profile", False) or getattr(args, "trace", None):
+            sys.exit(run_profiled(args))
+        sys.exit(args.func(args))
 
     # Run the TUI
-    app = NexusInstaller()
+    from installer.python.tui import NexusInstaller
+
+    app = NexusInstaller(banner_mode=args.banner)
     app.run()
 
 
@@ -0,0 +1,222 @@
+"""
+Nexus-AI Installer - Install plans
+
+`nexus-ai plan` resolves a selection once into a serializable plan: the
+catalog entries (with sha256 of every file) for the selected tools and
+features, and the diff against a home directory - every file to create,
+overwrite, skip or delete, plus every managed-block and enablement edit.
+
+`nexus-ai apply plan.json` rebuilds the catalog from the plan instead of
+scanning the features directory, and runs the normal install engine. The
+per-file decisions are re-checked against the target home's manifest (a stat
+per file), so one plan can be applied to many homes or machines. With
+`--embed` the plan carries the source bytes and needs no features directory.
+"""
+
+import base64
+import json
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Optional
+
+from installer.python.catalog import TOOL_LAYOUTS, Catalog, tree_fingerprint
+from installer.python.core import ENABLEMENT_FILE, TOOLS
+from installer.python.managed import Section, managed_config_action
+from installer.python.manifest import Manifest
+
+PLAN_VERSION = 1
+
+# Change actions, in the order they are listed
+ACTIONS = ("create", "overwrite", "delete", "skip")
+
+
+class StalePlanError(Exception):
+    """The features directory changed since the plan was made."""
+
+
+@dataclass
+class Change:
+    kind: str       # "file", "block" (managed config) or "enablement"
+    action: str     # one of ACTIONS
+    path: str       # relative to the home directory
+    tool: str
+    feature: str = ""
+
+
+@dataclass
+class Plan:
+    home: str
+    features_root: str
+    fingerprint: str
+    tool_ids: list[str]
+    feature_ids: list[str]
+    copy_mode: str
+    catalog: dict                   # Catalog.to_dict() restricted to the selection
+    changes: list[Change] = field(default_factory=list)
+    sources: Optional[dict[str, bytes]] = None
+
+    def counts(self) -> dict[str, int]:
+        counts = dict.fromkeys(ACTIONS, 0)
+        for change in self.changes:
+            counts[change.action] += 1
+        return counts
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["version"] = PLAN_VERSION
+        if self.sources is not None:
+            data["sources"] = {src: base64.b64encode(b).decode("ascii") for src, b in self.sources.items()}
+        return data
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "Plan":
+        if data.get("version") != PLAN_VERSION:
+            raise ValueError(f"unsupported plan version: {data.get('version')!r}")
+        sources = data.get("sources")
+        return cls(
+            home=data["home"],
+            features_root=data["features_root"],
+            fingerprint=data["fingerprint"],
+            tool_ids=data["tool_ids"],
+            feature_ids=data["feature_ids"],
+            copy_mode=data["copy_mode"],
+            catalog=data["catalog"],
+            changes=[Change(**c) for c in data["changes"]],
+            sources={src: base64.b64decode(b) for src, b in sources.items()} if sources is not None else None,
+        )
+
+    def dumps(self) -> str:
+        return json.dumps(self.to_dict(), indent=2)
+
+    @classmethod
+    def loads(cls, text: str, name: str = "plan") -> "Plan":
+        try:
+            return cls.from_dict(json.loads(text))
+        except (json.JSONDecodeError, KeyError, TypeError) as e:
+            raise ValueError(f"{name} is not a nexus-ai plan ({e})") from e
+
+    def to_catalog(self, check: bool = True) -> Catalog:
+        """The catalog the plan was made from, without scanning the features directory.
+
+        Unless the plan embeds its sources, the features directory must be
+        unchanged since planning (one stat walk, no hashing) when `check` is set.
+        """
+        root = Path(self.features_root)
+        if self.sources is None and check:
+            try:
+                current = tree_fingerprint(root)
+            except FileNotFoundError:
+                raise StalePlanError(f"features directory not found: {root} (make the plan with --embed)")
+            if current != self.fingerprint:
+                raise StalePlanError(f"{root} changed since the plan was made; run `nexus-ai plan` again")
+        return Catalog.from_dict(root, self.catalog)
+
+
+def build_plan(home: Path, catalog: Catalog, tool_ids: list[str], feature_ids: list[str],
+               copy_mode: str = "copy", embed: bool = False) -> Plan:
+    """Resolve a selection against `home` without changing anything."""
+    data = catalog.to_dict()
+    data["features"] = {
+        fid: {**entry, "tools": {t: a for t, a in entry["tools"].items() if t in tool_ids}}
+        for fid, entry in data["features"].items()
+        if fid in feature_ids
+    }
+    plan = Plan(
+        home=str(home.absolute()),
+        features_root=str(catalog.root),
+        fingerprint=catalog.fingerprint,
+        tool_ids=list(tool_ids),
+        feature_ids=list(feature_ids),
+        copy_mode=copy_mode,
+        catalog=data,
+    )
+    plan.changes = diff(home, catalog, tool_ids, feature_ids)
+    if embed:
+        from installer.python.fleet import read_sources
+        plan.sources = read_sources(catalog, tool_ids, feature_ids)
+    return plan
+
+
+def diff(home: Path, catalog: Catalog, tool_ids: list[str], feature_ids: list[str]) -> list[Change]:
+    """Every change an install of the selection would make to `home`, mirroring sync_files."""
+    manifest = Manifest.load(home)
+    changes = []
+    for tool_id in tool_ids:
+        layout = TOOL_LAYOUTS[tool_id]
+        config_rel = f"{layout['dir']}/{layout['config']}"
+        sections = []
+        for feature_id in feature_ids:
+            assets = catalog.assets(feature_id, tool_id)
+            if assets and assets.config:
+                sections.append(Section(feature_id, catalog.root / assets.config.src, assets.config.sha256))
+        changes.append(Change("block", managed_config_action(home / config_rel, sections, feature_ids), config_rel, tool_id))
+
+        extensions = []
+        for feature_id in feature_ids:
+            assets = catalog.assets(feature_id, tool_id)
+            if assets is None:
+                continue
+            changes.extend(_file_changes(home, manifest, assets.files, tool_id, feature_id))
+            if assets.extension:
+                extensions.append(assets.extension)
+        if extensions:
+            changes.append(Change("enablement", _enablement_action(home / ENABLEMENT_FILE, extensions),
+                                  ENABLEMENT_FILE, tool_id))
+    return changes
+
+
+def _file_changes(home: Path, manifest: Manifest, assets: list, tool_id: str, feature_id: str) -> list[Change]:
+    changes = []
+    wanted = set()
+    for asset in assets:
+        dst = home / asset.dst
+        wanted.add(asset.dst)
+        if manifest.is_current(dst, asset.sha256):
+            action = "skip"
+        elif dst.exists() or dst.is_symlink():
+            action = "overwrite"
+        else:
+            action = "create"
+        changes.append(Change("file", action, asset.dst, tool_id, feature_id))
+
+    for key in manifest.owned(tool_id, feature_id):
+        if key in wanted:
+            continue
+        entry = manifest.files[key]
+        try:
+            st = (home / key).lstat()
+        except FileNotFoundError:
+            continue
+        # Files the user edited since we wrote them are left alone
+        if st.st_size == entry["size"] and st.st_mtime_ns == entry["mtime_ns"]:
+            changes.append(Change("file", "delete", key, tool_id, feature_id))
+    return changes
+
+
+def _enablement_action(path: Path, names: list[str]) -> str:
+    try:
+        data = json.loads(path.read_text() or "{}")
+    except FileNotFoundError:
+        return "create"
+    except json.JSONDecodeError:
+        return "overwrite"  # apply reports the damaged file instead of overwriting it
+    if isinstance(data, dict) and all(data.get(name) is True for name in names):
+        return "skip"
+    return "overwrite"
+
+
+def format_plan(plan: Plan, verbose: bool = False) -> list[str]:
+    """Human-readable diff lines: `+` create, `~` overwrite, `-` delete, `=` skip (verbose only)."""
+    marks = {"create": "+", "overwrite": "~", "delete": "-", "skip": "="}
+    tool_names = {t.id: t.name for t in TOOLS}
+    lines = []
+    for change in sorted(plan.changes, key=lambda c: (c.tool, ACTIONS.index(c.action), c.path)):
+        if change.action == "skip" and not verbose:
+            continue
+        what = {"block": "managed block", "enablement": "extension enablement"}.get(change.kind, "")
+        detail = f"  ({what})" if what else ""
+        lines.append(f"{marks[change.action]} {change.path}{detail}  [{tool_names.get(change.tool, change.tool)}]")
+    counts = plan.counts()
+    lines.append(f"Plan: {counts['create']} to create, {counts['overwrite']} to overwrite, "
+                 f"{counts['delete']} to delete, {counts['skip']} unchanged")
+    return lines
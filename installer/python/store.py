@@ -0,0 +1,287 @@
+"""
+Nexus-AI Installer - Shared object store
+
+A system-wide, content-addressed copy of the feature files for hosts with
+many users:
+
+    /var/lib/nexus-ai/          (or $NEXUS_AI_STORE, or --store DIR)
+        objects/<sha256>        one read-only file per distinct content
+        users/<uid>/<sha256>    per-user copies of objects (see below)
+        tmp/                    objects being written
+        store.lock              serializes populate and gc
+
+`nexus-ai store populate` fills it from the features directory. Installs
+that find a store link each file to its object (hardlink, or reflink with
+--copy-mode reflink) instead of copying it, so a file costs one metadata
+operation and identical files share their blocks across all homes.
+
+Objects belong to whoever populated the store (usually root), and Linux's
+fs.protected_hardlinks lets a user hardlink only files they own (or can
+write); root is exempt. A fleet install as root works as each home's owner
+but switches back to root for the link itself (`link_as_root`), so every
+home on the host shares the one object.
+
+A user installing into their own home cannot do that, so they link to their
+own read-only copy in users/<uid>/, made from the object on first use. All
+of that user's homes share it, but it does not dedupe across users: each
+user who installs this way costs one more copy of every file (unless the
+filesystem reflinks). `users/` is world-writable with the sticky bit, like
+/tmp, and a pool is only used if its owner is that uid. A file without an
+object, or one that cannot be linked, is copied as usual and counted, so
+installs can report it (LinkError says why).
+
+An object's link count says how many installed files share it, so `gc`
+removes objects nobody links to (st_nlink == 1) that the current catalog no
+longer ships, and per-user copies nobody links to. Reflinked copies are
+independent files and never pin objects.
+"""
+
+from __future__ import annotations
+
+import errno
+import os
+import stat
+from pathlib import Path
+
+from installer.python.catalog import Catalog
+from installer.python.fileops import copy_file, file_lock, temp_path
+from installer.python.manifest import sha256_file
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional
+
+DEFAULT_STORE = Path("/var/lib/nexus-ai")
+OBJECTS_DIR = "objects"
+USERS_DIR = "users"
+
+
+class LinkError(Exception):
+    """The store has the object but cannot link it here; the file is copied instead."""
+
+
+class StoreStats:
+    __slots__ = ("objects", "copies", "bytes", "unreferenced", "shared_bytes")
+
+    def __init__(self) -> None:
+        self.objects = 0
+        self.copies = 0          # of those, per-user copies in users/
+        self.bytes = 0
+        self.unreferenced = 0    # objects no installed file links to
+        self.shared_bytes = 0    # bytes saved by installed files linking instead of copying
+
+
+class ObjectStore:
+    def __init__(self, root: Path) -> None:
+        self.root = root
+        self.objects = root / OBJECTS_DIR
+        # Set by fleet workers: root processes installing as a home's owner (seteuid),
+        # which may become root again just to link. seteuid applies to every thread,
+        # so only a single-threaded install may use it (the engine checks).
+        self.link_as_root = False
+
+    def path(self, sha256: str) -> Path:
+        return self.objects / sha256
+
+    def link(self, sha256: str, dst: Path, copy_mode: str = "hardlink") -> bool:
+        """Replace dst with a link to the object (False if there is none).
+
+        `copy_mode` "reflink" clones the object (a byte copy where the
+        filesystem can't); anything else hardlinks it, or raises LinkError.
+        """
+        tmp = temp_path(dst)
+        try:
+            if copy_mode == "reflink":
+                copy_file(self.path(sha256), tmp, "reflink")
+            else:
+                self._hardlink(sha256, tmp)
+        except FileNotFoundError:
+            if not dst.parent.is_dir():
+                raise
+            return False
+        try:
+            os.replace(tmp, dst)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+        return True
+
+    def _hardlink(self, sha256: str, tmp: Path) -> None:
+        obj = self.path(sha256)
+        euid = os.geteuid()
+        try:
+            if euid == 0 or os.stat(obj).st_uid == euid:
+                os.link(obj, tmp)
+            elif self.link_as_root and os.getuid() == 0:
+                _link_as_root(obj, tmp, euid)
+            else:
+                obj = self._user_object(sha256, euid)
+                os.link(obj, tmp)
+        except (FileNotFoundError, LinkError):
+            raise
+        except OSError as e:
+            reason = "the store is on another filesystem" if e.errno == errno.EXDEV else e.strerror
+            raise LinkError(f"cannot link {obj}: {reason}") from e
+
+    def _user_object(self, sha256: str, uid: int) -> Path:
+        """This user's own copy of an object, made on first use."""
+        pool = self.root / USERS_DIR / str(uid)
+        try:
+            pool.mkdir(mode=0o755)
+        except FileExistsError:
+            pass
+        except FileNotFoundError:
+            raise LinkError(f"{pool.parent} is missing (run `nexus-ai store populate` to create it)") from None
+        except OSError as e:
+            raise LinkError(f"cannot create {pool}: {e.strerror}") from e
+        st = os.lstat(pool)
+        # Anyone can create users/<uid>, so only trust a pool that uid owns and alone can write to
+        if not stat.S_ISDIR(st.st_mode) or st.st_uid != uid or st.st_mode & 0o022:
+            raise LinkError(f"{pool} is not a directory that only uid {uid} can write to")
+        obj = pool / sha256
+        if obj.exists():
+            return obj
+        tmp = temp_path(obj)
+        try:
+            copy_file(self.path(sha256), tmp, "reflink")   # shares blocks with the object where it can
+            os.chmod(tmp, 0o444)
+            try:
+                os.link(tmp, obj)
+            except FileExistsError:
+                pass
+        finally:
+            try:
+                os.unlink(tmp)
+            except FileNotFoundError:
+                pass
+        return obj
+
+    def add(self, src: Path, sha256: str) -> bool:
+        """Store src as object sha256 unless present; returns True if it was added.
+
+        Objects are read-only: a user editing a hardlinked file in place would
+        otherwise change it for everyone.
+        """
+        obj = self.path(sha256)
+        if obj.exists():
+            return False
+        tmp = temp_path(self.root / "tmp" / sha256)
+        copy_file(src, tmp)
+        try:
+            if sha256_file(tmp) != sha256:
+                raise ValueError(f"{src} changed while it was being stored")
+            os.chmod(tmp, 0o444)
+            try:
+                os.link(tmp, obj)   # never replaces an object someone already links to
+            except FileExistsError:
+                return False
+        finally:
+            os.unlink(tmp)
+        return True
+
+    def populate(self, catalog: Catalog) -> tuple[int, int]:
+        """Add every file the catalog installs; returns (objects added, bytes added)."""
+        (self.root / "tmp").mkdir(parents=True, exist_ok=True)
+        self.objects.mkdir(exist_ok=True)
+        users = self.root / USERS_DIR
+        users.mkdir(exist_ok=True)
+        if os.stat(users).st_uid == os.geteuid():
+            os.chmod(users, 0o1777)    # every user makes their own users/<uid>; the sticky bit keeps them apart
+        added = size = 0
+        with file_lock(self.root / "store"):
+            for asset in _catalog_assets(catalog):
+                if self.add(catalog.root / asset.src, asset.sha256):
+                    added += 1
+                    size += asset.size
+        return added, size
+
+    def stats(self) -> StoreStats:
+        stats = StoreStats()
+        objects = str(self.objects)
+        for entry in self._entries():
+            st = entry.stat(follow_symlinks=False)
+            stats.objects += 1
+            stats.copies += os.path.dirname(entry.path) != objects
+            stats.bytes += st.st_size
+            if st.st_nlink == 1:
+                stats.unreferenced += 1
+            stats.shared_bytes += st.st_size * (st.st_nlink - 1)
+        return stats
+
+    def gc(self, keep: set[str], dry_run: bool = False) -> tuple[int, int]:
+        """Delete objects with no links that are not in `keep`, and unlinked per-user copies; returns (objects, bytes)."""
+        removed = size = 0
+        objects = str(self.objects)
+        with file_lock(self.root / "store"):
+            for entry in self._entries():
+                st = entry.stat(follow_symlinks=False)
+                # A per-user copy is made again from its object when next needed
+                if st.st_nlink > 1 or (entry.name in keep and os.path.dirname(entry.path) == objects):
+                    continue
+                if not dry_run:
+                    # An install may link it between the stat and here; its file keeps the data
+                    os.unlink(entry.path)
+                removed += 1
+                size += st.st_size
+        return removed, size
+
+    def _entries(self):
+        """Objects, then every per-user copy."""
+        entries = _files(self.objects)
+        try:
+            with os.scandir(self.root / USERS_DIR) as it:
+                pools = [e.path for e in it if e.is_dir(follow_symlinks=False)]
+        except FileNotFoundError:
+            pools = []
+        for pool in pools:
+            entries.extend(_files(pool))
+        return entries
+
+
+def _link_as_root(obj: Path, tmp: Path, euid: int) -> None:
+    """Hardlink obj to tmp with root's exemption from protected_hardlinks, on behalf of euid.
+
+    The directory is opened as euid, and only used if euid owns it, so a
+    symlink planted in the path cannot make root link into someone else's.
+    """
+    fd = os.open(tmp.parent, os.O_RDONLY | os.O_DIRECTORY | os.O_NOFOLLOW)
+    try:
+        if os.fstat(fd).st_uid != euid:
+            raise LinkError(f"{tmp.parent} is not owned by uid {euid}")
+        os.seteuid(0)
+        try:
+            os.link(obj, tmp.name, dst_dir_fd=fd)
+        finally:
+            os.seteuid(euid)
+    finally:
+        os.close(fd)
+
+
+def _files(directory) -> list:
+    try:
+        with os.scandir(directory) as it:
+            return [e for e in it if e.is_file(follow_symlinks=False) and not e.name.startswith(".")]
+    except FileNotFoundError:
+        return []
+
+
+def catalog_objects(catalog: Catalog) -> set[str]:
+    """Hashes of every file the catalog installs."""
+    return {asset.sha256 for asset in _catalog_assets(catalog)}
+
+
+def _catalog_assets(catalog: Catalog):
+    # Managed configs are merged into the user's file, never linked, so only command files count
+    for entry in catalog.features.values():
+        for assets in entry.tools.values():
+            yield from assets.files
+
+
+def find_store(value: Optional[str] = None) -> Optional[ObjectStore]:
+    """The store to install from: --store DIR, "none", or (default) $NEXUS_AI_STORE / DEFAULT_STORE if it exists."""
+    if value == "none":
+        return None
+    if value and value != "auto":
+        return ObjectStore(Path(value))
+    root = Path(os.environ.get("NEXUS_AI_STORE") or DEFAULT_STORE)
+    return ObjectStore(root) if (root / OBJECTS_DIR).is_dir() else None
@@ -0,0 +1,207 @@
+"""
+Nexus-AI Installer - Timing instrumentation
+
+Named spans around install phases and (tool, feature) steps, with counters
+(files written/skipped, bytes) added to the calling thread's innermost span
+and every span it is nested in, so a tool's span totals its steps:
+
+    with timing.span("managed config", tool="gemini"):
+        ...
+        timing.count(written=1, bytes=n)
+
+A span opened on a new thread is nested in the span passed as `parent`
+(usually `timing.current()` on the thread that started it), so the engine's
+per-tool threads add to the install phase too.
+
+Recording is off unless `enable()` was called (`--profile` / `--trace`);
+while off, `span()` and `count()` cost one global lookup. The recorded
+spans can be summarized as a table or written as Chrome trace JSON
+(chrome://tracing, Perfetto, speedscope).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional
+
+COUNTERS = ("written", "skipped", "removed", "bytes")
+
+
+class Span:
+    __slots__ = ("name", "cat", "start_ns", "tid", "thread", "args", "counters", "end_ns", "parent")
+
+    def __init__(self, name: str, cat: str, start_ns: int, tid: int, thread: str, args: Optional[dict] = None,
+                 parent: Optional[Span] = None) -> None:
+        self.name = name
+        self.cat = cat
+        self.start_ns = start_ns
+        self.tid = tid
+        self.thread = thread
+        self.args = args if args is not None else {}
+        self.counters: dict = {}
+        self.end_ns = 0
+        self.parent = parent
+
+    @property
+    def seconds(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e9
+
+
+class Recorder:
+    """Finished spans of one run, from any thread."""
+
+    def __init__(self) -> None:
+        self.origin_ns = time.perf_counter_ns()
+        self.spans: list[Span] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def stack(self) -> list[Span]:
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def finish(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+
+_recorder: Optional[Recorder] = None
+
+
+def enable() -> Recorder:
+    global _recorder
+    _recorder = Recorder()
+    return _recorder
+
+
+def disable() -> None:
+    global _recorder
+    _recorder = None
+
+
+def current() -> Optional[Span]:
+    """The calling thread's innermost open span (None while recording is off)."""
+    recorder = _recorder
+    if recorder is None:
+        return None
+    stack = recorder.stack()
+    return stack[-1] if stack else None
+
+
+@contextmanager
+def span(name: str, cat: str = "phase", parent: Optional[Span] = None, **args):
+    """Time the block as a span; yields the Span (None while recording is off).
+
+    It is nested in the thread's innermost open span, or else in `parent`.
+    """
+    recorder = _recorder
+    if recorder is None:
+        yield None
+        return
+    thread = threading.current_thread()
+    stack = recorder.stack()
+    current = Span(name, cat, time.perf_counter_ns(), thread.ident, thread.name, args,
+                   stack[-1] if stack else parent)
+    stack.append(current)
+    try:
+        yield current
+    finally:
+        current.end_ns = time.perf_counter_ns()
+        stack.pop()
+        recorder.finish(current)
+
+
+def count(**counters: int) -> None:
+    """Add to the counters of the calling thread's innermost span and the spans it is nested in."""
+    recorder = _recorder
+    if recorder is None:
+        return
+    stack = recorder.stack()
+    target = stack[-1] if stack else None
+    # Spans nested in one from another thread share it with that thread
+    with recorder._lock:
+        while target is not None:
+            for key, value in counters.items():
+                target.counters[key] = target.counters.get(key, 0) + value
+            target = target.parent
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# REPORTS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def summary(recorder: Recorder) -> list[dict]:
+    """Spans aggregated by (category, name).
+
+    Phases come in the order they started; each is followed by the tool and
+    step spans that started inside it, grouped by name.
+    """
+    rows: dict[tuple[str, str], dict] = {}
+    for s in sorted(recorder.spans, key=lambda s: s.start_ns):
+        row = rows.setdefault((s.cat, s.name), {"cat": s.cat, "name": s.name, "calls": 0, "seconds": 0.0,
+                                                "start_ns": s.start_ns, "end_ns": s.end_ns,
+                                                "counters": dict.fromkeys(COUNTERS, 0)})
+        row["calls"] += 1
+        row["seconds"] += s.seconds
+        row["end_ns"] = max(row["end_ns"], s.end_ns)
+        for key, value in s.counters.items():
+            row["counters"][key] = row["counters"].get(key, 0) + value
+
+    phases = [r for r in rows.values() if r["cat"] == "phase"]
+    nested = sorted((r for r in rows.values() if r["cat"] != "phase"), key=lambda r: (r["cat"] != "tool", r["name"]))
+    ordered = []
+    for phase in phases:
+        ordered.append(phase)
+        ordered.extend(r for r in nested if phase["start_ns"] <= r["start_ns"] <= phase["end_ns"])
+    seen = {id(r) for r in ordered}
+    ordered.extend(r for r in nested if id(r) not in seen)
+    return ordered
+
+
+def format_summary(recorder: Recorder) -> list[str]:
+    lines = [f"{'span':<40}{'calls':>6}{'ms':>10}{'written':>9}{'skipped':>9}{'removed':>9}{'bytes':>12}"]
+    for row in summary(recorder):
+        c = row["counters"]
+        name = row["name"] if row["cat"] == "phase" else f"  {row['name']}"
+        lines.append(f"{name[:39]:<40}{row['calls']:>6}{row['seconds'] * 1000:>10.2f}"
+                     f"{c['written']:>9}{c['skipped']:>9}{c['removed']:>9}{c['bytes']:>12}")
+    total = (time.perf_counter_ns() - recorder.origin_ns) / 1e6
+    lines.append(f"{'wall time':<40}{'':>6}{total:>10.2f}")
+    return lines
+
+
+def chrome_trace(recorder: Recorder) -> dict:
+    """Trace Event Format: one complete ("X") event per span, timestamps in microseconds."""
+    pid = os.getpid()
+    events = [
+        {
+            "name": s.name,
+            "cat": s.cat,
+            "ph": "X",
+            "ts": (s.start_ns - recorder.origin_ns) / 1000,
+            "dur": (s.end_ns - s.start_ns) / 1000,
+            "pid": pid,
+            "tid": s.tid,
+            "args": {**s.args, **s.counters},
+        }
+        for s in sorted(recorder.spans, key=lambda s: s.start_ns)
+    ]
+    for tid, thread in {s.tid: s.thread for s in recorder.spans}.items():
+        events.append({"name": "thread_name", "ph": "M", "pid": pid, "tid": tid, "args": {"name": thread}})
+    return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+
+def write_trace(recorder: Recorder, path: Path) -> None:
+    from installer.python.fileops import atomic_write_bytes
+
+    atomic_write_bytes(path, json.dumps(chrome_trace(recorder)).encode())
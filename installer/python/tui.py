@@ -0,0 +1,791 @@
+"""
+Nexus-AI Installer - Textual TUI
+Fraternal colors: Red, White, Navy Blue, Gold
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Optional
+
+from textual import events, on, work
+from textual.app import App, ComposeResult
+from textual.binding import Binding
+from textual.containers import Container, Vertical, Center, Middle
+from textual.geometry import Region, Size
+from textual.message import Message
+from textual.screen import Screen
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+from textual.widgets import Static, Footer, Label, Button
+from textual.widget import Widget
+from rich.color import ColorSystem
+from rich.console import Console
+from rich.segment import Segment
+from rich.text import Text
+from rich.style import Style
+
+from installer.python.catalog import Catalog
+from installer.python.core import TOOLS, get_features_path, load_features
+from installer.python.engine import InstallEngine, InstallResult, InstallStep
+from installer.python.store import find_store
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# FRATERNAL COLORS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+RED = "#C41E3A"
+WHITE = "#FFFFFF"
+NAVY = "#1E3A8A"
+GOLD = "#E8C547"
+
+BG_MAIN = "#0f172a"
+BG_PANEL = "#1e293b"
+TEXT_PRIMARY = "#f1f5f9"
+TEXT_MUTED = "#64748b"
+SUCCESS = "#34d399"
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# NEXUS BANNER
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+NEXUS_BANNER = [
+    "███╗   ██╗███████╗██╗  ██╗██╗   ██╗███████╗",
+    "████╗  ██║██╔════╝╚██╗██╔╝██║   ██║██╔════╝",
+    "██╔██╗ ██║█████╗   ╚███╔╝ ██║   ██║███████╗",
+    "██║╚██╗██║██╔══╝   ██╔██╗ ██║   ██║╚════██║",
+    "██║ ╚████║███████╗██╔╝ ██╗╚██████╔╝███████║",
+    "╚═╝  ╚═══╝╚══════╝╚═╝  ╚═╝ ╚═════╝ ╚══════╝",
+]
+
+BANNER_COLORS = [NAVY, RED, WHITE, GOLD, RED, NAVY]
+
+
+def render_banner() -> Text:
+    """Render the NEXUS banner with nested solid color borders."""
+    text = Text()
+
+    # Banner dimensions
+    banner_width = len(NEXUS_BANNER[0])  # 44 chars
+
+    # Border characters
+    h = "─"
+    v = "│"
+    tl = "╭"
+    tr = "╮"
+    bl = "╰"
+    br = "╯"
+
+    # Sparkles
+    text.append("✦   ✦   ✦\n\n", style=Style(color=GOLD, bold=True))
+
+    # Widths for each border (outer to inner)
+    w_navy = banner_width + 14
+    w_red = banner_width + 10
+    w_gold = banner_width + 6
+    w_white = banner_width + 2
+
+    # Navy top
+    text.append(f"{tl}{h * w_navy}{tr}\n", style=Style(color=NAVY))
+
+    # Red top
+    text.append(f"{v}  ", style=Style(color=NAVY))
+    text.append(f"{tl}{h * w_red}{tr}", style=Style(color=RED))
+    text.append(f"  {v}\n", style=Style(color=NAVY))
+
+    # Gold top
+    text.append(f"{v}  ", style=Style(color=NAVY))
+    text.append(f"{v}  ", style=Style(color=RED))
+    text.append(f"{tl}{h * w_gold}{tr}", style=Style(color=GOLD))
+    text.append(f"  {v}", style=Style(color=RED))
+    text.append(f"  {v}\n", style=Style(color=NAVY))
+
+    # White top
+    text.append(f"{v}  ", style=Style(color=NAVY))
+    text.append(f"{v}  ", style=Style(color=RED))
+    text.append(f"{v}  ", style=Style(color=GOLD))
+    text.append(f"{tl}{h * w_white}{tr}", style=Style(color=WHITE))
+    text.append(f"  {v}", style=Style(color=GOLD))
+    text.append(f"  {v}", style=Style(color=RED))
+    text.append(f"  {v}\n", style=Style(color=NAVY))
+
+    # Banner content
+    for i, line in enumerate(NEXUS_BANNER):
+        color = BANNER_COLORS[i % len(BANNER_COLORS)]
+        text.append(f"{v}  ", style=Style(color=NAVY))
+        text.append(f"{v}  ", style=Style(color=RED))
+        text.append(f"{v}  ", style=Style(color=GOLD))
+        text.append(f"{v} ", style=Style(color=WHITE))
+        text.append(line, style=Style(color=color, bold=True))
+        text.append(f" {v}", style=Style(color=WHITE))
+        text.append(f"  {v}", style=Style(color=GOLD))
+        text.append(f"  {v}", style=Style(color=RED))
+        text.append(f"  {v}\n", style=Style(color=NAVY))
+
+    # White bottom
+    text.append(f"{v}  ", style=Style(color=NAVY))
+    text.append(f"{v}  ", style=Style(color=RED))
+    text.append(f"{v}  ", style=Style(color=GOLD))
+    text.append(f"{bl}{h * w_white}{br}", style=Style(color=WHITE))
+    text.append(f"  {v}", style=Style(color=GOLD))
+    text.append(f"  {v}", style=Style(color=RED))
+    text.append(f"  {v}\n", style=Style(color=NAVY))
+
+    # Gold bottom
+    text.append(f"{v}  ", style=Style(color=NAVY))
+    text.append(f"{v}  ", style=Style(color=RED))
+    text.append(f"{bl}{h * w_gold}{br}", style=Style(color=GOLD))
+    text.append(f"  {v}", style=Style(color=RED))
+    text.append(f"  {v}\n", style=Style(color=NAVY))
+
+    # Red bottom
+    text.append(f"{v}  ", style=Style(color=NAVY))
+    text.append(f"{bl}{h * w_red}{br}", style=Style(color=RED))
+    text.append(f"  {v}\n", style=Style(color=NAVY))
+
+    # Navy bottom
+    text.append(f"{bl}{h * w_navy}{br}\n", style=Style(color=NAVY))
+
+    return text
+
+
+def render_compact_banner() -> Text:
+    """The NEXUS letters without the nested borders, for narrow terminals."""
+    text = Text()
+    text.append("✦   ✦   ✦\n\n", style=Style(color=GOLD, bold=True))
+    for i, line in enumerate(NEXUS_BANNER):
+        color = BANNER_COLORS[i % len(BANNER_COLORS)]
+        text.append(f"{line}\n", style=Style(color=color, bold=True))
+    return text
+
+
+def render_wordmark() -> Text:
+    """One line, for terminals too narrow for the letters."""
+    return Text.assemble(("✦ ", Style(color=GOLD, bold=True)), ("N E X U S", Style(color=WHITE, bold=True)),
+                         (" ✦", Style(color=GOLD, bold=True)))
+
+
+FULL_BANNER_WIDTH = len(NEXUS_BANNER[0]) + 16
+COMPACT_BANNER_WIDTH = len(NEXUS_BANNER[0])
+
+_COLOR_SYSTEMS = {
+    "standard": ColorSystem.STANDARD,
+    "256": ColorSystem.EIGHT_BIT,
+    "windows": ColorSystem.WINDOWS,
+}
+
+
+@lru_cache(maxsize=32)
+def banner_strips(width: int, color_system: Optional[str], mode: str = "auto") -> tuple[Strip, ...]:
+    """The banner as centered lines for a content width and color system.
+
+    The art is static, so it is built and rendered once per (width, color
+    system, mode); screens then only copy strips. "auto" picks the largest
+    variant that fits, "compact" never draws the borders. Colors are
+    downgraded here for 8/16/256-color terminals and dropped when color is
+    off (NO_COLOR).
+    """
+    if mode == "full" or (mode == "auto" and width >= FULL_BANNER_WIDTH):
+        text = render_banner()
+    elif width >= COMPACT_BANNER_WIDTH:
+        text = render_compact_banner()
+    else:
+        text = render_wordmark()
+
+    system = _COLOR_SYSTEMS.get(color_system)
+    console = Console(width=max(width, 1), color_system=None)
+    strips = []
+    text.rstrip()
+    for line in text.split("\n", allow_blank=True):
+        segments = []
+        for segment in line.render(console):
+            style = segment.style
+            if style is not None and color_system is None:
+                style = Style(bold=style.bold)
+            elif style is not None and system is not None and style.color is not None:
+                style = Style(color=style.color.downgrade(system), bold=style.bold)
+            segments.append(Segment(segment.text, style))
+        strips.append(Strip(segments).text_align(width, "center"))
+    return tuple(strips)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# CUSTOM WIDGETS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class Banner(Widget):
+    """NEXUS banner; draws cached strips (see banner_strips), hidden in "none" mode."""
+
+    def on_mount(self) -> None:
+        if self.app.banner_mode == "none":
+            self.display = False
+
+    def _strips(self, width: int) -> tuple[Strip, ...]:
+        return banner_strips(width, self.app.console.color_system, self.app.banner_mode)
+
+    def get_content_height(self, container: Size, viewport: Size, width: int) -> int:
+        return len(self._strips(width))
+
+    def render_line(self, y: int) -> Strip:
+        width = self.content_size.width
+        strips = self._strips(width)
+        if y >= len(strips):
+            return Strip.blank(width, self.rich_style)
+        return strips[y].apply_style(self.rich_style)
+
+
+def render_selectable(name: str, description: str, selected: bool, highlighted: bool) -> list[Text]:
+    """The name and description lines of a checkbox row."""
+    text = Text(no_wrap=True, overflow="ellipsis")
+
+    # Cursor
+    if highlighted:
+        text.append("› ", style=Style(color=GOLD, bold=True))
+    else:
+        text.append("  ")
+
+    # Checkbox
+    if selected:
+        text.append("◉ ", style=Style(color=GOLD, bold=True))
+    else:
+        text.append("○ ", style=Style(color=TEXT_MUTED))
+
+    # Name
+    if highlighted:
+        text.append(name, style=Style(color=GOLD, bold=True))
+    else:
+        text.append(name, style=Style(color=TEXT_PRIMARY))
+
+    return [text, Text(f"      {description}", style=Style(color=TEXT_MUTED), no_wrap=True, overflow="ellipsis")]
+
+
+class SelectableList(ScrollView, can_focus=True):
+    """A list of selectable items with checkboxes.
+
+    Items are objects with `name`, `description` and `selected` (tools,
+    features); toggling updates them in place. Only the rows on screen are
+    rendered, each row is cached until its state changes, and moving the
+    cursor repaints just the two rows involved, so a keypress costs the same
+    for 5 items or 5000. `/` filters the list as you type.
+    """
+
+    BINDINGS = [
+        Binding("up", "move_up", "Up"),
+        Binding("down", "move_down", "Down"),
+        Binding("k", "move_up", "Up", show=False),
+        Binding("j", "move_down", "Down", show=False),
+        Binding("pageup", "page_up", "Page Up", show=False),
+        Binding("pagedown", "page_down", "Page Down", show=False),
+        Binding("home", "first", "First", show=False),
+        Binding("end", "last", "Last", show=False),
+        Binding("space", "toggle", "Toggle"),
+        Binding("slash", "start_filter", "Filter"),
+    ]
+
+    ROW_HEIGHT = 4  # padding, name, description, padding
+
+    class FilterChanged(Message):
+        """The filter text or filter mode changed."""
+
+        def __init__(self, selectable_list: "SelectableList") -> None:
+            super().__init__()
+            self.filter_text = selectable_list.filter_text
+            self.filtering = selectable_list.filtering
+            self.matches = len(selectable_list.matches)
+            self.total = len(selectable_list.items)
+
+    def __init__(self, items: list, id: Optional[str] = None) -> None:
+        super().__init__(id=id)
+        self.items = items
+        self.matches = list(range(len(items)))  # indexes of the items shown, in order
+        self.cursor = 0                         # position in matches
+        self.filter_text = ""
+        self.filtering = False
+        self._anchor = 0
+        self._search = [f"{getattr(item, 'id', '')} {item.name} {item.description}".casefold() for item in items]
+        self._rows: dict[int, tuple[tuple, list[Strip]]] = {}
+
+    def on_mount(self) -> None:
+        self._update_virtual_size()
+
+    def on_resize(self) -> None:
+        self._update_virtual_size()
+
+    def _update_virtual_size(self) -> None:
+        self.virtual_size = Size(self.scrollable_content_region.width, len(self.matches) * self.ROW_HEIGHT)
+
+    def render_line(self, y: int) -> Strip:
+        row, line = divmod(round(self.scroll_offset.y) + y, self.ROW_HEIGHT)
+        width = self.scrollable_content_region.width
+        if row >= len(self.matches):
+            return Strip.blank(width, self.rich_style)
+        return self._render_row(row, width)[line]
+
+    def _render_row(self, row: int, width: int) -> list[Strip]:
+        index = self.matches[row]
+        item = self.items[index]
+        state = (item.selected, row == self.cursor, width)
+        cached = self._rows.get(index)
+        if cached is not None and cached[0] == state:
+            return cached[1]
+
+        style = self.rich_style
+        console = self.app.console
+        blank = Strip.blank(width, style)
+        lines = render_selectable(item.name, item.description, item.selected, row == self.cursor)
+        strips = [blank]
+        for text in lines:
+            text.truncate(width, overflow="ellipsis")
+            strips.append(Strip(text.render(console)).adjust_cell_length(width).apply_style(style))
+        strips.append(blank)
+        self._rows[index] = (state, strips)
+        return strips
+
+    def _refresh_row(self, row: int) -> None:
+        top = row * self.ROW_HEIGHT - round(self.scroll_offset.y)
+        self.refresh(Region(0, top, self.size.width, self.ROW_HEIGHT))
+
+    def move_cursor(self, row: int) -> None:
+        if not self.matches:
+            return
+        row = max(0, min(row, len(self.matches) - 1))
+        if row == self.cursor:
+            return
+        previous, self.cursor = self.cursor, row
+        self._scroll_to_cursor()
+        self._refresh_row(previous)
+        self._refresh_row(row)
+
+    def _scroll_to_cursor(self) -> None:
+        region = Region(0, self.cursor * self.ROW_HEIGHT, 1, self.ROW_HEIGHT)
+        self.scroll_to_region(region, animate=False, immediate=True)
+
+    @property
+    def page_rows(self) -> int:
+        return max(1, self.scrollable_content_region.height // self.ROW_HEIGHT)
+
+    def action_move_up(self) -> None:
+        self.move_cursor(self.cursor - 1)
+
+    def action_move_down(self) -> None:
+        self.move_cursor(self.cursor + 1)
+
+    def action_page_up(self) -> None:
+        self.move_cursor(self.cursor - self.page_rows)
+
+    def action_page_down(self) -> None:
+        self.move_cursor(self.cursor + self.page_rows)
+
+    def action_first(self) -> None:
+        self.move_cursor(0)
+
+    def action_last(self) -> None:
+        self.move_cursor(len(self.matches) - 1)
+
+    def action_toggle(self) -> None:
+        if not self.matches:
+            return
+        item = self.items[self.matches[self.cursor]]
+        item.selected = not item.selected
+        self._refresh_row(self.cursor)
+
+    def action_start_filter(self) -> None:
+        self.filtering = True
+        self.post_message(self.FilterChanged(self))
+
+    def set_filter(self, filter_text: str) -> None:
+        """Show only items whose id, name or description contain filter_text (case-insensitive)."""
+        needle = filter_text.casefold()
+        if self.matches:
+            self._anchor = self.matches[self.cursor]  # kept while a query matches nothing
+        # A longer query can only narrow the previous matches
+        if self.filter_text and needle.startswith(self.filter_text.casefold()):
+            pool = self.matches
+        else:
+            pool = range(len(self.items))
+        self.filter_text = filter_text
+        self.matches = [i for i in pool if needle in self._search[i]]
+        self.cursor = self.matches.index(self._anchor) if self._anchor in self.matches else 0
+        self._update_virtual_size()
+        self._scroll_to_cursor()
+        self.refresh()
+        self.post_message(self.FilterChanged(self))
+
+    def on_key(self, event: events.Key) -> None:
+        if event.key == "escape" and (self.filtering or self.filter_text):
+            self.filtering = False
+            self.set_filter("")
+        elif not self.filtering:
+            return
+        elif event.key == "enter":
+            self.filtering = False
+            self.post_message(self.FilterChanged(self))
+        elif event.key == "backspace":
+            self.set_filter(self.filter_text[:-1])
+        elif event.is_printable and event.character:
+            self.set_filter(self.filter_text + event.character)
+        else:
+            return  # navigation keys keep working while filtering
+        event.stop()
+        event.prevent_default()
+
+
+class ProgressItem(Static):
+    """A progress item with status."""
+
+    def __init__(self, label: str, status: str = "pending") -> None:
+        super().__init__()
+        self.label_text = label
+        self.status = status
+
+    def on_mount(self) -> None:
+        self.render_item()
+
+    def render_item(self) -> None:
+        text = Text()
+
+        if self.status == "done":
+            text.append("  ✓ ", style=Style(color=SUCCESS, bold=True))
+            text.append(self.label_text, style=Style(color=SUCCESS))
+        elif self.status == "active":
+            text.append("  ● ", style=Style(color=GOLD))
+            text.append(self.label_text, style=Style(color=GOLD))
+        elif self.status == "failed":
+            text.append("  ✗ ", style=Style(color=RED, bold=True))
+            text.append(self.label_text, style=Style(color=RED))
+        else:
+            text.append("  ○ ", style=Style(color=TEXT_MUTED))
+            text.append(self.label_text, style=Style(color=TEXT_MUTED))
+
+        self.update(text)
+
+    def set_status(self, status: str) -> None:
+        self.status = status
+        self.render_item()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# SCREENS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class WelcomeScreen(Screen):
+    """Welcome screen."""
+
+    BINDINGS = [
+        Binding("enter", "continue_app", "Continue"),
+        Binding("q", "quit", "Quit"),
+    ]
+
+    def compose(self) -> ComposeResult:
+        yield Container(
+            Banner(id="banner"),
+            Static("AI Assistant Configuration", id="subtitle"),
+            Static("Press enter to continue • q to quit", id="help"),
+            id="welcome-container"
+        )
+
+    def action_continue_app(self) -> None:
+        self.app.push_screen(ToolsScreen(TOOLS))
+
+    def action_quit(self) -> None:
+        self.app.exit()
+
+
+class SelectionScreen(Screen):
+    """Base for the tool and feature selection screens."""
+
+    TITLE_TEXT = ""
+    SUBTITLE_TEXT = ""
+    HELP_TEXT = "↑/↓ navigate • space toggle • / filter • enter confirm • esc back"
+
+    BINDINGS = [
+        Binding("enter", "confirm", "Confirm"),
+        Binding("escape", "back", "Back"),
+        Binding("q", "quit", "Quit"),
+    ]
+
+    def __init__(self, items: list) -> None:
+        super().__init__()
+        self.items = items
+
+    def compose(self) -> ComposeResult:
+        yield Container(
+            Banner(id="banner"),
+            Container(
+                Static(self.TITLE_TEXT, id="panel-title"),
+                Static(self.SUBTITLE_TEXT, id="panel-subtitle"),
+                SelectableList(self.items, id="selection"),
+                Static(self.HELP_TEXT, id="panel-help"),
+                id="panel"
+            ),
+            id="main-container"
+        )
+
+    def on_mount(self) -> None:
+        self.query_one(SelectableList).focus()
+
+    def on_selectable_list_filter_changed(self, event: SelectableList.FilterChanged) -> None:
+        subtitle = self.query_one("#panel-subtitle", Static)
+        if event.filtering or event.filter_text:
+            cursor = "▏" if event.filtering else ""
+            line = Text.assemble(
+                ("Filter: ", Style(color=TEXT_MUTED)),
+                (f"{event.filter_text}{cursor}", Style(color=GOLD)),
+                (f"  {event.matches} of {event.total}", Style(color=TEXT_MUTED)),
+                no_wrap=True, overflow="ellipsis",
+            )
+        else:
+            line = Text(self.SUBTITLE_TEXT, no_wrap=True, overflow="ellipsis")
+        # Always one line, so the screen needs no new layout
+        subtitle.update(line, layout=False)
+
+    def action_back(self) -> None:
+        self.app.pop_screen()
+
+    def action_quit(self) -> None:
+        self.app.exit()
+
+
+class ToolsScreen(SelectionScreen):
+    """Tool selection screen."""
+
+    TITLE_TEXT = "Select Tools"
+    SUBTITLE_TEXT = "Choose which AI assistants to configure"
+
+    def action_confirm(self) -> None:
+        self.app.push_screen(FeaturesScreen(self.app.feature_list))
+
+
+class FeaturesScreen(SelectionScreen):
+    """Feature selection screen."""
+
+    TITLE_TEXT = "Select Features"
+    SUBTITLE_TEXT = "Choose features to install"
+    HELP_TEXT = "↑/↓ navigate • space toggle • / filter • enter install • esc back"
+
+    def action_confirm(self) -> None:
+        self.app.push_screen(InstallingScreen())
+
+
+class InstallingScreen(Screen):
+    """Installation progress screen."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.engine = None
+        self.items = {}
+
+    def compose(self) -> ComposeResult:
+        # Build steps
+        self.engine = InstallEngine(
+            Path.home(),
+            self.app.catalog,
+            [t.id for t in TOOLS if t.selected],
+            [f.id for f in self.app.feature_list if f.selected],
+            store=find_store(),
+        )
+
+        yield Container(
+            Banner(id="banner"),
+            Container(
+                Static("Installing", id="panel-title"),
+                *[ProgressItem(step.label, "pending") for step in self.engine.steps],
+                id="panel"
+            ),
+            id="main-container"
+        )
+
+    def on_mount(self) -> None:
+        self.items = dict(zip(self.engine.steps, self.query(ProgressItem)))
+        self.run_installation()
+
+    @work(exclusive=True, thread=True)
+    def run_installation(self) -> None:
+        # Runs in a worker thread so file I/O never blocks the event loop
+        def on_step(step: InstallStep, status: str) -> None:
+            self.app.call_from_thread(self.items[step].set_status, status)
+
+        try:
+            result = self.engine.run(on_step)
+        except Exception as e:
+            # Failures before or around the steps (journal, manifest); the engine rolled back what it did
+            self.app.call_from_thread(self.app.push_screen, DoneScreen(InstallResult(self.engine.steps), e))
+            return
+        self.app.call_from_thread(self.app.push_screen, DoneScreen(result))
+
+
+class DoneScreen(Screen):
+    """Completion screen."""
+
+    BINDINGS = [
+        Binding("enter", "quit", "Exit"),
+        Binding("q", "quit", "Exit"),
+    ]
+
+    def __init__(self, result: InstallResult, error: Optional[BaseException] = None) -> None:
+        super().__init__()
+        self.result = result
+        self.error = error      # the install stopped early with this
+
+    def compose(self) -> ComposeResult:
+        tools = [t.name for t in TOOLS if t.selected]
+        features = [f.name for f in self.app.feature_list if f.selected]
+
+        if self.error is not None:
+            title = Text(f"✗ Installation failed: {self.error}", style=Style(color=RED, bold=True))
+        elif self.result.ok:
+            title = Text("✓ Installation Complete", style=Style(color=SUCCESS, bold=True))
+        elif self.result.rolled_back:
+            title = Text(f"✗ Installation failed with {len(self.result.errors)} error(s); nothing was changed",
+                         style=Style(color=RED, bold=True))
+        else:
+            title = Text(f"✗ Installation finished with {len(self.result.errors)} error(s)", style=Style(color=RED, bold=True))
+
+        yield Container(
+            Banner(id="banner"),
+            Container(
+                Static(title, id="panel-title"),
+                Static(Text.assemble(
+                    ("Tools: ", Style(color=TEXT_MUTED)),
+                    (", ".join(tools), Style(color=GOLD))
+                ), id="summary-tools"),
+                Static(Text.assemble(
+                    ("Features: ", Style(color=TEXT_MUTED)),
+                    (", ".join(features), Style(color=GOLD))
+                ), id="summary-features"),
+                Static(Text.assemble(
+                    ("Files: ", Style(color=TEXT_MUTED)),
+                    (f"{self.result.files.written} written, {self.result.files.skipped} unchanged, "
+                     f"{self.result.files.removed} removed", Style(color=GOLD))
+                ), id="summary-files"),
+                Static("Press enter or q to exit", id="panel-help"),
+                id="panel"
+            ),
+            id="main-container"
+        )
+
+    def action_quit(self) -> None:
+        self.app.exit()
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# APP
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class NexusInstaller(App):
+    """NEXUS Installer Application."""
+
+    CSS = """
+    Screen {
+        background: #0f172a;
+    }
+
+    #welcome-container {
+        width: 100%;
+        height: 100%;
+        align: center middle;
+        background: #0f172a;
+    }
+
+    #main-container {
+        width: 100%;
+        height: 100%;
+        align: center top;
+        background: #0f172a;
+        padding-top: 1;
+    }
+
+    #banner {
+        width: 100%;
+        height: auto;
+        background: #0f172a;
+        padding: 1;
+    }
+
+    #subtitle {
+        width: 100%;
+        height: auto;
+        content-align: center middle;
+        text-align: center;
+        color: #94a3b8;
+        text-style: italic;
+        background: #0f172a;
+    }
+
+    #help {
+        width: 100%;
+        height: auto;
+        content-align: center middle;
+        text-align: center;
+        color: #64748b;
+        background: #0f172a;
+        margin-top: 1;
+    }
+
+    #panel {
+        width: 70;
+        height: auto;
+        background: #1e293b;
+        border: round #334155;
+        padding: 1 2;
+        margin: 1;
+    }
+
+    #panel-title {
+        color: #f1f5f9;
+        text-style: bold;
+        background: #1e293b;
+        width: 100%;
+    }
+
+    #panel-subtitle {
+        color: #94a3b8;
+        text-style: italic;
+        background: #1e293b;
+        width: 100%;
+        margin-bottom: 1;
+    }
+
+    #panel-help {
+        color: #64748b;
+        background: #1e293b;
+        width: 100%;
+        margin-top: 1;
+    }
+
+    #summary-tools, #summary-features, #summary-files {
+        background: #1e293b;
+        width: 100%;
+        padding: 0 0 1 0;
+    }
+
+    SelectableList {
+        width: 100%;
+        height: auto;
+        max-height: 50vh;
+        background: #1e293b;
+        overflow-x: hidden;
+        scrollbar-size-vertical: 1;
+        scrollbar-background: #1e293b;
+        scrollbar-color: #334155;
+    }
+
+    ProgressItem {
+        width: 100%;
+        height: auto;
+        background: #1e293b;
+        padding: 0 0 1 0;
+    }
+    """
+
+    BINDINGS = [
+        Binding("ctrl+c", "quit", "Quit"),
+    ]
+
+    def __init__(self, banner_mode: str = "auto") -> None:
+        super().__init__()
+        self.banner_mode = banner_mode
+        self.catalog = Catalog.load(get_features_path())
+        self.feature_list = load_features(self.catalog)
+
+    def on_mount(self) -> None:
+        self.push_screen(WelcomeScreen())
@@ -0,0 +1,281 @@
+"""
+Nexus-AI Installer - Watch mode for feature authors
+
+`nexus-ai watch` keeps a home directory in sync with the features directory
+while you edit it. Changes are picked up with inotify (through ctypes, no
+dependencies) or, where that is unavailable, by polling a stat snapshot of
+the tree. Events are debounced into batches; each batch re-indexes only the
+features it touched, copies their changed files, removes files they no
+longer ship, and rewrites the managed blocks they have a section in (other
+sections are carried over as-is, see managed.py).
+
+Syncs run without a journal: they only ever write what an install would.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+from installer.python.catalog import TOOL_LAYOUTS, Catalog
+from installer.python.core import (
+    InstallContext,
+    enable_extensions,
+    install_configs,
+    sync_files,
+)
+from installer.python.manifest import Manifest
+
+# Default quiet period that ends a batch of changes
+DEBOUNCE = 0.02
+# Default interval between stat snapshots when polling
+POLL_INTERVAL = 0.25
+
+# A change to the features directory itself (or lost events): every feature is affected
+EVERYTHING = "."
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# WATCHERS
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+# From <sys/inotify.h>
+IN_MODIFY = 0x002
+IN_ATTRIB = 0x004
+IN_CLOSE_WRITE = 0x008
+IN_MOVED_FROM = 0x040
+IN_MOVED_TO = 0x080
+IN_CREATE = 0x100
+IN_DELETE = 0x200
+IN_DELETE_SELF = 0x400
+IN_MOVE_SELF = 0x800
+IN_Q_OVERFLOW = 0x4000
+IN_IGNORED = 0x8000
+IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+               | IN_DELETE_SELF | IN_MOVE_SELF)
+_EVENT = struct.Struct("iIII")
+
+
+class InotifyWatcher:
+    """Recursive inotify watch on a directory tree (Linux)."""
+
+    def __init__(self, root: Path) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        self._add_watch = libc.inotify_add_watch
+        self._add_watch.argtypes = (ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32)
+        self.root = root
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.dirs: dict[int, str] = {}     # watch descriptor -> path relative to root
+        self._watch_tree(root)
+
+    def _watch_tree(self, top: Path) -> None:
+        for dirpath, _, _ in os.walk(top):
+            wd = self._add_watch(self.fd, os.fsencode(dirpath), _WATCH_MASK)
+            if wd < 0:
+                errno = ctypes.get_errno()
+                if dirpath == str(top) and top == self.root:
+                    raise OSError(errno, f"cannot watch {dirpath}: {os.strerror(errno)}")
+                continue    # removed while we walked, or the watch limit is reached
+            rel = os.path.relpath(dirpath, self.root)
+            self.dirs[wd] = "" if rel == "." else rel
+
+    def read(self, timeout: Optional[float]) -> set[str]:
+        """Paths (relative to root) changed within timeout seconds; empty if none."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return set()
+        changed = set()
+        while True:
+            try:
+                buf = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(buf):
+                wd, mask, _, length = _EVENT.unpack_from(buf, offset)
+                offset += _EVENT.size
+                name = buf[offset:offset + length].rstrip(b"\0").decode(errors="surrogateescape")
+                offset += length
+                if mask & IN_Q_OVERFLOW:
+                    changed.add(EVERYTHING)
+                    continue
+                if mask & IN_IGNORED:
+                    self.dirs.pop(wd, None)
+                    continue
+                parent = self.dirs.get(wd)
+                if parent is None:
+                    continue
+                path = os.path.join(parent, name) if name else parent
+                changed.add(path or EVERYTHING)
+                if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                    # Files written into it before the watch was added show up in the walk
+                    self._watch_tree(self.root / path)
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class PollingWatcher:
+    """Compares stat snapshots of the tree; for systems without inotify."""
+
+    def __init__(self, root: Path, interval: float = POLL_INTERVAL) -> None:
+        self.root = root
+        self.interval = interval
+        self.snapshot = self._snapshot()
+
+    def _snapshot(self) -> dict[str, tuple[int, int]]:
+        entries = {}
+        stack = [str(self.root)]
+        while stack:
+            current = stack.pop()
+            try:
+                with os.scandir(current) as it:
+                    for entry in it:
+                        st = entry.stat(follow_symlinks=False)
+                        entries[os.path.relpath(entry.path, self.root)] = (st.st_size, st.st_mtime_ns)
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+            except FileNotFoundError:
+                continue
+        return entries
+
+    def read(self, timeout: Optional[float]) -> set[str]:
+        time.sleep(self.interval if timeout is None else min(timeout, self.interval))
+        old, self.snapshot = self.snapshot, self._snapshot()
+        return {path for path in old.keys() | self.snapshot.keys() if old.get(path) != self.snapshot.get(path)}
+
+    def close(self) -> None:
+        pass
+
+
+def open_watcher(root: Path, poll: bool = False, interval: float = POLL_INTERVAL):
+    """An inotify watcher, or a polling one if asked for or inotify is unavailable."""
+    if not poll:
+        try:
+            return InotifyWatcher(root)
+        except (OSError, AttributeError):
+            pass    # not Linux (no inotify_init1 in libc), or out of inotify instances
+    return PollingWatcher(root, interval)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# SYNC
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+@dataclass
+class SyncResult:
+    features: list[str]
+    written: int = 0
+    removed: int = 0
+    configs: list[str] = field(default_factory=list)    # managed configs rewritten
+    errors: list[str] = field(default_factory=list)
+    seconds: float = 0.0    # from the first change seen to the sync finishing
+
+
+def affected(paths: set[str], catalog: Catalog) -> dict[str, set[str]]:
+    """feature -> tools whose files the changed paths may affect.
+
+    features/<feature>/<tool>/... affects that tool; anything else in a
+    feature (its directory, feature.json) affects all of them.
+    """
+    changes: dict[str, set[str]] = {}
+    for path in paths:
+        parts = path.split(os.sep, 2)
+        if parts[0] == EVERYTHING:
+            features = set(catalog.features) | {
+                e.name for e in os.scandir(catalog.root) if e.is_dir() and not e.name.startswith((".", "_"))
+            }
+            return {feature: set(TOOL_LAYOUTS) for feature in features}
+        tools = {parts[1]} if len(parts) > 1 and parts[1] in TOOL_LAYOUTS else set(TOOL_LAYOUTS)
+        changes.setdefault(parts[0], set()).update(tools)
+    return changes
+
+
+class Syncer:
+    """Re-installs the changed features of a selection into a home."""
+
+    def __init__(self, home: Path, catalog: Catalog, selection: dict[str, set[str]], copy_mode: str = "copy") -> None:
+        self.home = home
+        self.catalog = catalog
+        self.selection = selection      # tool -> feature ids to keep in sync
+        self.copy_mode = copy_mode
+
+    def sync(self, changes: dict[str, set[str]]) -> SyncResult:
+        """Re-install the changed (feature, tool) pairs; `changes` is feature -> tools, as from affected()."""
+        result = SyncResult(sorted(changes))
+        # A section whose source is gone must still be dropped from the block
+        had_config = {(tool_id, f) for f, tools in changes.items() for tool_id in tools
+                      if _has_config(self.catalog, f, tool_id)}
+        self.catalog.rescan(changes)
+
+        manifest = Manifest.load(self.home)
+        ctx = InstallContext(self.home, self.catalog, manifest, self.copy_mode)
+        for tool_id, watched in self.selection.items():
+            changed = sorted(f for f, tools in changes.items() if tool_id in tools and f in watched)
+            if not changed:
+                continue
+            try:
+                for feature_id in changed:
+                    assets = self.catalog.assets(feature_id, tool_id)
+                    if assets is not None:
+                        ctx.makedirs(self.home / TOOL_LAYOUTS[tool_id]["dir"])
+                    # A feature (or tool) that is gone still has its old files removed
+                    sync_files(ctx, assets.files if assets else [], tool_id, feature_id)
+                if any(_has_config(self.catalog, f, tool_id) or (tool_id, f) in had_config for f in changed):
+                    # Features that no longer ship a config have their section dropped
+                    result.configs.extend(install_configs(ctx, [tool_id], changed))
+                if TOOL_LAYOUTS[tool_id]["extension"]:
+                    enable_extensions(ctx, tool_id, [f for f in changed if self.catalog.supports(f, tool_id)])
+            except (OSError, ValueError) as e:
+                result.errors.append(f"{tool_id}: {e}")
+        if manifest.stats.written or manifest.stats.removed:
+            manifest.save()
+        result.written = manifest.stats.written
+        result.removed = manifest.stats.removed
+        return result
+
+
+def _has_config(catalog: Catalog, feature_id: str, tool_id: str) -> bool:
+    assets = catalog.assets(feature_id, tool_id)
+    return bool(assets and assets.config)
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+# LOOP
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+def watch(watcher, syncer: Syncer, debounce: float = DEBOUNCE,
+          on_sync: Optional[Callable[[SyncResult], None]] = None,
+          stop: Optional[threading.Event] = None) -> None:
+    """Sync each debounced batch of changes until `stop` is set (or forever)."""
+    while stop is None or not stop.is_set():
+        changed = watcher.read(0.2 if stop is not None else None)
+        if not changed:
+            continue
+        first = time.perf_counter()
+        while True:
+            more = watcher.read(debounce)
+            if not more:
+                break
+            changed |= more
+        changes = affected(changed, syncer.catalog)
+        if not changes:
+            continue
+        try:
+            result = syncer.sync(changes)
+        except (OSError, ValueError) as e:
+            # A half-written feature.json or a file deleted mid-scan; the next change retries
+            result = SyncResult(sorted(changes), errors=[str(e)])
+        result.seconds = time.perf_counter() - first
+        if on_sync:
+            on_sync(result)
@@ -0,0 +1,57 @@
+"""Shared fixtures: a throwaway home directory and the catalog of the real features tree."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+from installer.python.catalog import Catalog
+from installer.python.core import get_features_path
+from installer.python.manifest import STATE_DIR
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# The user's own files the installer must leave alone (or restore exactly)
+USER_FILES = {
+    ".claude/CLAUDE.md": b"# My Claude notes\n\nKeep answers short.\n",
+    ".gemini/GEMINI.md": b"# Gemini\n\nPrefer tables.\n",
+    ".codex/AGENTS.md": b"My own agents file, no trailing newline",
+}
+
+
+@pytest.fixture(scope="session")
+def catalog(tmp_path_factory) -> Catalog:
+    return Catalog.load(get_features_path(), cache_dir=tmp_path_factory.mktemp("cache"))
+
+
+@pytest.fixture
+def home(tmp_path) -> Path:
+    """A home directory holding a few user-written config files."""
+    home = tmp_path / "home"
+    for name, data in USER_FILES.items():
+        path = home / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+    return home
+
+
+def snapshot(home: Path) -> dict:
+    """Every directory (None) and file (its bytes) under home, except the installer's own state."""
+    tree = {}
+    for dirpath, dirnames, filenames in os.walk(home):
+        rel = Path(dirpath).relative_to(home)
+        if rel == Path("."):
+            dirnames[:] = [d for d in dirnames if d != STATE_DIR]
+        for name in dirnames:
+            tree[(rel / name).as_posix()] = None
+        for name in filenames:
+            tree[(rel / name).as_posix()] = (Path(dirpath) / name).read_bytes()
+    return tree
+
+
+def nexus(*args: str, **kwargs):
+    """Run the CLI in a fresh interpreter, as a user would."""
+    import subprocess
+    return subprocess.run([sys.executable, "-m", "installer.python.nexus", *args], cwd=REPO_ROOT,
+                          capture_output=True, text=True, **kwargs)
@@ -0,0 +1,109 @@
+"""Install, uninstall and rollback as journaled transactions."""
+
+import subprocess
+import sys
+import textwrap
+
+import pytest
+
+from conftest import REPO_ROOT, USER_FILES, snapshot
+from installer.python import engine
+from installer.python.engine import InstallEngine, uninstall
+from installer.python.journal import EditedSinceCommit, recover, rollback_last, status, transactions
+from installer.python.manifest import Manifest
+
+TOOLS = ["claude", "gemini", "codex"]
+FEATURES = ["continuity", "maestro"]
+
+
+def install(home, catalog, features=FEATURES, tools=TOOLS):
+    result = InstallEngine(home, catalog, tools, features).run()
+    assert result.ok, result.errors
+    return result
+
+
+def test_failed_install_is_rolled_back_byte_for_byte(home, catalog, monkeypatch):
+    install(home, catalog, ["continuity"])
+    before = snapshot(home)
+
+    real_step = engine.install_step
+
+    def failing_step(ctx, tool_id, feature_id):
+        real_step(ctx, tool_id, feature_id)     # fail after writing, so there is something to undo
+        if (tool_id, feature_id) == ("gemini", "maestro"):
+            raise OSError("disk full")
+
+    monkeypatch.setattr(engine, "install_step", failing_step)
+    result = InstallEngine(home, catalog, TOOLS, FEATURES).run()
+
+    assert not result.ok and result.rolled_back
+    assert snapshot(home) == before
+    assert status(transactions(home)[0][1]) == "rolled back"
+
+
+def test_uninstall_then_rollback_restores_the_install(home, catalog):
+    install(home, catalog)
+    installed = snapshot(home)
+
+    result = uninstall(home, TOOLS, FEATURES, catalog)
+    assert result.ok and result.removed > 0
+    after = snapshot(home)
+    assert Manifest.load(home).files == {}
+    # The user's own content is all that is left of the config files
+    for name, data in USER_FILES.items():
+        assert after[name] == data
+
+    begin, stats = rollback_last(home)
+    assert begin["command"] == "uninstall"
+    assert stats.restored > 0
+    assert snapshot(home) == installed
+
+
+def test_rollback_refuses_to_overwrite_edits(home, catalog):
+    install(home, catalog)
+    command = home / ".claude/commands/continuity.md"
+    command.write_bytes(b"edited after the install\n")
+
+    with pytest.raises(EditedSinceCommit) as raised:
+        rollback_last(home)
+    assert raised.value.paths == [str(command)]
+    assert command.read_bytes() == b"edited after the install\n"
+
+    rollback_last(home, force=True)
+    assert not command.exists()
+
+
+def test_crash_mid_install_is_recovered(home, catalog):
+    before = snapshot(home)
+    # Die (no rollback, no commit) right after the third step has written its files
+    script = textwrap.dedent(f"""
+        import os
+        from pathlib import Path
+        from installer.python import engine
+        from installer.python.catalog import Catalog
+        from installer.python.core import get_features_path
+
+        real_step = engine.install_step
+        done = []
+
+        def step(ctx, tool_id, feature_id):
+            real_step(ctx, tool_id, feature_id)
+            done.append(feature_id)
+            if len(done) == 3:
+                os._exit(9)
+
+        engine.install_step = step
+        catalog = Catalog.load(get_features_path(), cache_dir=Path({str(home.parent / "cache")!r}))
+        engine.InstallEngine(Path({str(home)!r}), catalog, {TOOLS!r}, {FEATURES!r}).run()
+    """)
+    crashed = subprocess.run([sys.executable, "-c", script], cwd=REPO_ROOT)
+    assert crashed.returncode == 9
+
+    assert snapshot(home) != before
+    assert status(transactions(home)[0][1]) == "open"
+
+    assert recover(home) == 1
+    assert snapshot(home) == before
+    assert status(transactions(home)[0][1]) == "rolled back"
+    assert recover(home) == 0
+
@@ -0,0 +1,40 @@
+"""Maestro status changes from concurrent writers."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from conftest import nexus
+from installer.python.maestro.oplog import StateFile
+from installer.python.maestro.state import STATE_FILE, load_state
+
+TASKS = 24
+
+
+def write_plan(root) -> None:
+    lines = ["# Maestro Orchestration", "", "## Goal", "Concurrency test", "", "## Tasks",
+             "| ID | Description | Status | Specialist | Tool | Depends |",
+             "|----|-------------|--------|------------|------|---------|"]
+    lines += [f"| {i} | Task {i} | pending | code | Claude | - |" for i in range(1, TASKS + 1)]
+    path = root / STATE_FILE
+    path.parent.mkdir(parents=True)
+    path.write_text("\n".join(lines) + "\n")
+
+
+def test_concurrent_maestro_set_loses_no_updates(tmp_path):
+    write_plan(tmp_path)
+
+    # Every other writer also compacts, so appends race with rewrites of the state file
+    def set_done(task_id: int):
+        extra = ["--compact"] if task_id % 2 else []
+        return nexus("maestro", "set", str(task_id), "done", "--root", str(tmp_path), *extra)
+
+    with ThreadPoolExecutor(max_workers=TASKS) as pool:
+        runs = list(pool.map(set_done, range(1, TASKS + 1)))
+    assert [r.returncode for r in runs] == [0] * TASKS, [r.stderr for r in runs if r.returncode]
+
+    state = StateFile(tmp_path)
+    done = ["done"] * TASKS
+    # Seen through the log before it is folded in, and in the state file itself after
+    assert [state.load().task(i).status for i in range(1, TASKS + 1)] == done
+    state.compact()
+    store = load_state(tmp_path)
+    assert [store.task(i).status for i in range(1, TASKS + 1)] == done
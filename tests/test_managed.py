@@ -0,0 +1,38 @@
+"""Managed config blocks: one section per feature, the user's content untouched."""
+
+import re
+
+from conftest import USER_FILES
+from installer.python.engine import InstallEngine, uninstall
+
+SECTION_RE = re.compile(r"<!-- Nexus-AI:FEATURE (\S+) sha256=")
+
+
+def sections(path) -> list[str]:
+    return SECTION_RE.findall(path.read_text())
+
+
+def test_installing_a_subset_keeps_other_sections(home, catalog):
+    config = home / ".gemini/GEMINI.md"
+    assert InstallEngine(home, catalog, ["gemini"], ["continuity", "maestro"]).run().ok
+    assert sections(config) == ["continuity", "maestro"]
+    full = config.read_bytes()
+
+    assert InstallEngine(home, catalog, ["gemini"], ["maestro"]).run().ok
+    assert sections(config) == ["continuity", "maestro"]
+    assert config.read_bytes() == full
+
+    assert InstallEngine(home, catalog, ["gemini"], ["continuity"]).run().ok
+    assert config.read_bytes() == full
+
+
+def test_uninstall_drops_only_its_section(home, catalog):
+    config = home / ".gemini/GEMINI.md"
+    assert InstallEngine(home, catalog, ["gemini"], ["continuity", "maestro"]).run().ok
+
+    assert uninstall(home, ["gemini"], ["maestro"], catalog).ok
+    assert sections(config) == ["continuity"]
+    assert config.read_bytes().startswith(USER_FILES[".gemini/GEMINI.md"].rstrip())
+
+    assert uninstall(home, ["gemini"], ["continuity"], catalog).ok
+    assert config.read_bytes() == USER_FILES[".gemini/GEMINI.md"]